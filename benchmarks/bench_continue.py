@@ -0,0 +1,143 @@
+# Author: Roman Miroshnychenko aka Roman V.M.
+# E-mail: roman1972@gmail.com
+#
+# Copyright (c) 2016 Roman Miroshnychenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Overhead of a running program after the "continue" command
+
+Each mode runs in a separate process:
+
+- ``baseline``: no debugger.
+- ``legacy``: the debugger is never detached after "continue"
+  and breakpoint conditions are evaluated by bdb
+  (Web-PDB behavior before sys.monitoring support).
+- ``current``: the current WebPdb implementation.
+
+``legacy`` and ``current`` modes are measured without breakpoints,
+with a breakpoint in a function that is not called by the workload
+(``idle``) and with a breakpoint in the workload loop with a condition
+that is never true (``condition``). ``current`` mode is also measured
+with a logpoint in the workload loop (``logpoint``).
+Results are printed as JSON lines.
+
+Usage::
+
+    python benchmarks/bench_continue.py [--iterations N]
+"""
+
+import argparse
+import bdb
+import json
+import logging
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# pylint: disable=wrong-import-position
+import web_pdb
+
+
+class LegacyWebPdb(web_pdb.WebPdb):
+    """WebPdb that keeps the trace function after "continue" """
+    def set_continue(self):
+        self._set_stopinfo(self.botframe, None, -1)
+
+    break_here = bdb.Bdb.break_here
+
+
+def fib(n):
+    return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+
+def workload(iterations):
+    total = 0
+    for i in range(iterations):
+        total += fib(i % 15)
+    return total
+
+
+def never_called():
+    return None
+
+
+HOT_LINE = workload.__code__.co_firstlineno + 3
+BREAKPOINT_COMMANDS = {
+    'idle': f'b {never_called.__code__.co_firstlineno + 1}',
+    'condition': f'b {HOT_LINE}, i < 0',
+    'logpoint': f'lp {HOT_LINE} i = {{i}}',
+}
+
+
+def run_mode(mode, breakpoint_, iterations):
+    logging.disable(logging.CRITICAL)
+    if mode != 'baseline':
+        debugger_class = LegacyWebPdb if mode == 'legacy' else web_pdb.WebPdb
+        pdb = debugger_class(port=-1)
+        if breakpoint_:
+            pdb.console.session.input_queue.put(BREAKPOINT_COMMANDS[breakpoint_] + '\n')
+        pdb.console.session.input_queue.put('c\n')
+        pdb.set_trace(sys._getframe())  # pylint: disable=protected-access
+    start = time.perf_counter()
+    workload(iterations)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--iterations', type=int, default=2000)
+    parser.add_argument('--mode', help=argparse.SUPPRESS)
+    parser.add_argument('--breakpoint', choices=BREAKPOINT_COMMANDS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.mode is not None:
+        print(run_mode(args.mode, args.breakpoint, args.iterations))
+        return
+    python_version = '.'.join(str(v) for v in sys.version_info[:3])
+    results = []
+    for mode, breakpoint_ in (('baseline', None),
+                              ('legacy', None), ('legacy', 'idle'), ('legacy', 'condition'),
+                              ('current', None), ('current', 'idle'), ('current', 'condition'),
+                              ('current', 'logpoint')):
+        command = [sys.executable, __file__, '--mode', mode,
+                   '--iterations', str(args.iterations)]
+        if breakpoint_:
+            command += ['--breakpoint', breakpoint_]
+        output = subprocess.run(command, check=True, stdout=subprocess.PIPE,
+                                universal_newlines=True).stdout
+        results.append({
+            'benchmark': 'continue',
+            'python': python_version,
+            'mode': mode,
+            'breakpoint': breakpoint_,
+            'iterations': args.iterations,
+            'seconds': float(output.strip().splitlines()[-1]),
+        })
+    baseline = results[0]['seconds']
+    for result in results:
+        result['slowdown'] = round(result['seconds'] / baseline, 2)
+        print(json.dumps(result))
+
+
+if __name__ == '__main__':
+    main()
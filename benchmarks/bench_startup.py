@@ -0,0 +1,52 @@
+# Author: Roman Miroshnychenko aka Roman V.M.
+# E-mail: roman1972@gmail.com
+#
+# Copyright (c) 2016 Roman Miroshnychenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Startup cost of the debugger
+
+The benchmark measures ``import web_pdb`` time with ``python -X importtime``
+and checks that the web-server stack is not imported until the debugger
+is started. It also measures the time from the start of a program
+that calls ``set_trace()`` until the web-UI page with its static files
+and frame data is loaded.
+
+Usage::
+
+    python benchmarks/bench_startup.py [--runs N]
+"""
+
+import argparse
+import json
+
+from bench_suite import bench_first_page, bench_import
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+    for result in (bench_import(args.runs), bench_first_page(args.runs)):
+        print(json.dumps(result))
+
+
+if __name__ == '__main__':
+    main()
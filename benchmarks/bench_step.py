@@ -0,0 +1,56 @@
+# Author: Roman Miroshnychenko aka Roman V.M.
+# E-mail: roman1972@gmail.com
+#
+# Copyright (c) 2016 Roman Miroshnychenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Step round-trip latency
+
+The debugged program runs in a separate process. The benchmark sends
+the "next" command over the WebSocket and measures the time until
+the front-end receives the new current line. The result is compared
+against the target median latency.
+
+Usage::
+
+    python benchmarks/bench_step.py [--steps N] [--target-ms MS]
+"""
+
+import argparse
+import json
+
+from bench_suite import bench_step
+
+TARGET_MS = 10.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--steps', type=int, default=200)
+    parser.add_argument('--target-ms', type=float, default=TARGET_MS)
+    args = parser.parse_args()
+    result = bench_step(args.steps)
+    result['target_ms'] = args.target_ms
+    result['target_met'] = result['median_ms'] <= args.target_ms
+    print(json.dumps(result))
+
+
+if __name__ == '__main__':
+    main()
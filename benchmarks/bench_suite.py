@@ -0,0 +1,312 @@
+# Author: Roman Miroshnychenko aka Roman V.M.
+# E-mail: roman1972@gmail.com
+#
+# Copyright (c) 2016 Roman Miroshnychenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Headless Web-PDB benchmark suite
+
+The benchmarks run scripted programs from ``benchmarks/programs``
+and talk to the web-server via ``/frame-data`` and the WebSocket
+like the front-end does, without a browser:
+
+- ``step``: round-trip latency of the "next" command and
+  the number of bytes received by the front-end per step.
+- ``output``: ``print`` throughput with redirected standard streams
+  and RSS growth of the debugged process.
+- ``import``: ``import web_pdb`` time measured with ``python -X importtime``.
+- ``first_page``: time from the start of a program that calls ``set_trace()``
+  until the web-UI page with its static files and frame data is loaded.
+
+Results are printed as JSON lines and can be saved to a JSON file
+to track regressions.
+
+Usage::
+
+    python benchmarks/bench_suite.py [--steps N] [--lines N] [--output FILE]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+from threading import Thread
+
+from ws_client import WebSocketClient
+
+PROGRAMS = Path(__file__).resolve().parent / 'programs'
+ROOT = Path(__file__).resolve().parent.parent
+PYTHON_VERSION = '.'.join(str(v) for v in sys.version_info[:3])
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def connect(port, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return WebSocketClient('127.0.0.1', port)
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+def wait_current_line(client):
+    while True:
+        if 'current_line' in json.loads(client.recv()):
+            return
+
+
+def get_snapshot_size(port):
+    request = urllib.request.Request(f'http://127.0.0.1:{port}/frame-data',
+                                     headers={'Accept-Encoding': 'gzip'})
+    with urllib.request.urlopen(request, timeout=10) as response:
+        body = response.read()
+        if response.headers.get('Content-Encoding') == 'gzip':
+            return len(gzip.decompress(body)), len(body)
+        return len(body), len(body)
+
+
+def bench_step(steps):
+    """
+    Measure "next" command round-trip latency and payload size per step
+    """
+    port = free_port()
+    with subprocess.Popen([sys.executable, str(PROGRAMS / 'step_loop.py'), str(port)],
+                          stderr=subprocess.DEVNULL) as process:
+        try:
+            client = connect(port)
+            wait_current_line(client)
+            snapshot_bytes, snapshot_gzip_bytes = get_snapshot_size(port)
+            received = client.bytes_received
+            latencies = []
+            for _ in range(steps):
+                start = time.perf_counter()
+                client.send('n\n')
+                wait_current_line(client)
+                latencies.append((time.perf_counter() - start) * 1000)
+            step_bytes = client.bytes_received - received
+            client.close()
+        finally:
+            process.kill()
+    latencies.sort()
+    return {
+        'benchmark': 'step',
+        'python': PYTHON_VERSION,
+        'steps': steps,
+        'median_ms': round(statistics.median(latencies), 3),
+        'p95_ms': round(latencies[int(len(latencies) * 0.95) - 1], 3),
+        'max_ms': round(latencies[-1], 3),
+        'bytes_per_step': round(step_bytes / steps, 1),
+        'snapshot_bytes': snapshot_bytes,
+        'snapshot_gzip_bytes': snapshot_gzip_bytes,
+    }
+
+
+def drain(client, console):
+    try:
+        while True:
+            update = json.loads(client.recv())
+            if 'console' in update:
+                console.append(len(update['console']['data']))
+    except (OSError, ValueError):
+        pass
+
+
+def bench_output(lines):
+    """
+    Measure print throughput with redirected streams and RSS growth
+
+    The benchmark fails if the printed output has not been received
+    by the WebSocket client, e.g. if it went to the real stdout.
+    """
+    port = free_port()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        result_file = Path(temp_dir) / 'result.json'
+        with subprocess.Popen([sys.executable, str(PROGRAMS / 'print_lines.py'),
+                               str(port), str(lines), str(result_file)],
+                              stderr=subprocess.DEVNULL) as process:
+            try:
+                client = connect(port)
+                wait_current_line(client)
+                client.send('c\n')
+                console = []
+                drain_thread = Thread(target=drain, args=(client, console), daemon=True)
+                drain_thread.start()
+                process.wait(timeout=600)
+                drain_thread.join(10)
+            finally:
+                process.kill()
+        client.close()
+        result = json.loads(result_file.read_text(encoding='utf-8'))
+    console_bytes = sum(console)
+    # The console also receives debugger messages, so it may get more than printed
+    if console_bytes < result['printed_bytes']:
+        raise RuntimeError(f'The web-console received {console_bytes} bytes of output '
+                           f'instead of {result["printed_bytes"]}')
+    rss_growth = None
+    if result['rss_before'] is not None:
+        rss_growth = result['rss_after'] - result['rss_before']
+    return {
+        'benchmark': 'output',
+        'python': PYTHON_VERSION,
+        'lines': lines,
+        'seconds': round(result['seconds'], 3),
+        'lines_per_second': round(lines / result['seconds']),
+        'printed_bytes': result['printed_bytes'],
+        'console_bytes': console_bytes,
+        'received_bytes': client.bytes_received,
+        'rss_growth_bytes': rss_growth,
+    }
+
+
+def get_startup_env():
+    """Get the environment for startup benchmarks that use cached bytecode"""
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return env
+
+
+def measure_import():
+    """
+    Import web_pdb in a new process with ``-X importtime`` option
+
+    :return: cumulative import times in microseconds by module name
+    """
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import web_pdb'],
+                             cwd=ROOT, env=get_startup_env(), capture_output=True,
+                             text=True, check=True)
+    times = {}
+    for line in process.stderr.splitlines():
+        match = re.match(r'import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)$', line)
+        if match is not None:
+            times[match.group(4)] = int(match.group(2))
+    return times
+
+
+def bench_import(runs):
+    """
+    Measure ``import web_pdb`` time
+    """
+    measure_import()
+    measurements = [measure_import() for _ in range(runs)]
+    import_times = sorted(times['web_pdb'] / 1000 for times in measurements)
+    return {
+        'benchmark': 'import',
+        'python': PYTHON_VERSION,
+        'runs': runs,
+        'median_ms': round(statistics.median(import_times), 3),
+        'min_ms': round(import_times[0], 3),
+        'server_imported': 'bottle' in measurements[0],
+    }
+
+
+def get(port, path):
+    request = urllib.request.Request(f'http://127.0.0.1:{port}/{path}',
+                                     headers={'Accept-Encoding': 'gzip'})
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return response.read()
+
+
+def load_first_page(port, timeout=10.0):
+    """
+    Load the web-UI page like a browser does
+
+    :return: the number of bytes received
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            page = get(port, '')
+            break
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.005)
+    if page[:2] == b'\x1f\x8b':
+        page = gzip.decompress(page)
+    received = len(page)
+    for path in re.findall(r'(?:href|src)="(static/[^"]+)"', page.decode('utf-8')):
+        received += len(get(port, path))
+    received += len(get(port, 'frame-data'))
+    return received
+
+
+def bench_first_page(runs):
+    """
+    Measure time to the first web-UI page load after the program start
+    """
+    durations = []
+    received = 0
+    for _ in range(runs + 1):
+        port = free_port()
+        start = time.perf_counter()
+        with subprocess.Popen([sys.executable, str(PROGRAMS / 'step_loop.py'), str(port)],
+                              env=get_startup_env(), stderr=subprocess.DEVNULL) as process:
+            try:
+                received = load_first_page(port)
+                durations.append((time.perf_counter() - start) * 1000)
+            finally:
+                process.kill()
+    # The first run is a warm-up that writes bytecode cache
+    durations = sorted(durations[1:])
+    return {
+        'benchmark': 'first_page',
+        'python': PYTHON_VERSION,
+        'runs': runs,
+        'median_ms': round(statistics.median(durations), 3),
+        'min_ms': round(durations[0], 3),
+        'received_bytes': received,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--steps', type=int, default=200, help='steps to measure')
+    parser.add_argument('--lines', type=int, default=100000, help='lines to print')
+    parser.add_argument('--runs', type=int, default=10, help='startup measurement runs')
+    parser.add_argument('--output', help='save results to a JSON file')
+    args = parser.parse_args()
+    results = []
+    for result in (bench_step(args.steps), bench_output(args.lines),
+                   bench_import(args.runs), bench_first_page(args.runs)):
+        print(json.dumps(result), flush=True)
+        results.append(result)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as fo:
+            json.dump(results, fo, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+# Author: Roman Miroshnychenko aka Roman V.M.
+# E-mail: roman1972@gmail.com
+#
+# Copyright (c) 2016 Roman Miroshnychenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+A debugged program for output benchmarks
+
+It prints lines with redirected standard streams after "continue",
+so the output goes to the web-console of the debugging session
+that stays open, and writes the results as JSON to a file.
+
+Usage: print_lines.py <port> <lines> <result_file>
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# pylint: disable=wrong-import-position
+import web_pdb
+
+
+def get_rss():
+    """Get the resident set size of the current process in bytes"""
+    try:
+        with open('/proc/self/statm', encoding='ascii') as fo:
+            return int(fo.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        pass
+    try:
+        import resource  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on other platforms
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def main(port, lines, result_file):
+    web_pdb.set_trace(port=port, patch_stdstreams=True)
+    rss_before = get_rss()
+    printed_bytes = 0
+    start = time.perf_counter()
+    for i in range(lines):
+        line = f'Line {i}: the quick brown fox jumps over the lazy dog'
+        print(line)
+        printed_bytes += len(line) + 1
+    # Wait until the output is sent to the web-console clients
+    sys.stdout.flush()
+    seconds = time.perf_counter() - start
+    rss_after = get_rss()
+    with open(result_file, 'w', encoding='utf-8') as fo:
+        json.dump({
+            'lines': lines,
+            'printed_bytes': printed_bytes,
+            'seconds': seconds,
+            'rss_before': rss_before,
+            'rss_after': rss_after,
+        }, fo)
+
+
+main(int(sys.argv[1]), int(sys.argv[2]), sys.argv[3])
@@ -0,0 +1,104 @@
+# Author: Roman Miroshnychenko aka Roman V.M.
+# E-mail: roman1972@gmail.com
+#
+# Copyright (c) 2016 Roman Miroshnychenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+A minimal blocking WebSocket client for benchmarks
+"""
+
+import base64
+import os
+import socket
+import struct
+
+
+class WebSocketClient:
+    """
+    Blocking WebSocket client that supports unfragmented text messages only
+    """
+    def __init__(self, host, port, path='/ws', timeout=10.0):
+        self._sock = socket.create_connection((host, port), timeout=timeout)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        key = base64.b64encode(os.urandom(16)).decode('ascii')
+        request = (f'GET {path} HTTP/1.1\r\n'
+                   f'Host: {host}:{port}\r\n'
+                   'Upgrade: websocket\r\n'
+                   'Connection: Upgrade\r\n'
+                   f'Sec-WebSocket-Key: {key}\r\n'
+                   'Sec-WebSocket-Version: 13\r\n\r\n')
+        self._sock.sendall(request.encode('ascii'))
+        response = b''
+        while b'\r\n\r\n' not in response:
+            chunk = self._sock.recv(1)
+            if not chunk:
+                raise ConnectionError('Connection closed during handshake')
+            response += chunk
+        if b' 101 ' not in response.split(b'\r\n', 1)[0]:
+            raise ConnectionError(f'WebSocket handshake failed: {response!r}')
+        self.bytes_received = 0
+
+    def _recv_exactly(self, size):
+        data = b''
+        while len(data) < size:
+            chunk = self._sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError('Connection closed')
+            data += chunk
+        return data
+
+    def recv(self):
+        """
+        Receive a text message
+
+        :return: message text
+        :rtype: str
+        """
+        header = self._recv_exactly(2)
+        length = header[1] & 0x7f
+        if length == 126:
+            length = struct.unpack('>H', self._recv_exactly(2))[0]
+        elif length == 127:
+            length = struct.unpack('>Q', self._recv_exactly(8))[0]
+        data = self._recv_exactly(length)
+        self.bytes_received += length
+        return data.decode('utf-8')
+
+    def send(self, text):
+        """
+        Send a text message
+
+        :param text: message text
+        :type text: str
+        """
+        data = text.encode('utf-8')
+        mask = os.urandom(4)
+        header = bytes([0x81])
+        if len(data) < 126:
+            header += bytes([0x80 | len(data)])
+        elif len(data) < 65536:
+            header += bytes([0x80 | 126]) + struct.pack('>H', len(data))
+        else:
+            header += bytes([0x80 | 127]) + struct.pack('>Q', len(data))
+        masked = bytes(byte ^ mask[i % 4] for i, byte in enumerate(data))
+        self._sock.sendall(header + mask + masked)
+
+    def close(self):
+        self._sock.close()
@@ -0,0 +1,74 @@
+/*
+Copyright (c) 2018 Roman Miroshnychenko <roman1972@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+*/
+
+import $ from 'jquery';
+
+import { state, session_url } from './globals';
+
+function edit_breakpoint(line) {
+  // Open the dialog for a conditional breakpoint or a logpoint
+  $('#breakpoint_window').data('line', line);
+  $('#breakpoint_line').text(line);
+  $('#breakpoint_text').val('');
+  $('#breakpoint_error').text('');
+  $('#breakpoint_window').modal();
+}
+
+function set_breakpoint() {
+  // Set a breakpoint via the breakpoint API
+  const data = {
+      file: state.dirname + state.filename,
+      line: $('#breakpoint_window').data('line')
+    },
+    kind = $('input[name="breakpoint_kind"]:checked').val(),
+    text = $('#breakpoint_text').val().trim();
+  if (kind === 'log') {
+    data.log = text;
+  } else if (text !== '') {
+    data.cond = text;
+  }
+  $.ajax({
+    url: session_url('breakpoints'),
+    method: 'POST',
+    contentType: 'application/json',
+    data: JSON.stringify(data)
+  })
+  .then(() => {
+    $('#breakpoint_window').modal('hide');
+  }, (xhr) => {
+    // Bottle error pages contain the error message in <pre> tag
+    const $page = $('<div></div>').html(xhr.responseText);
+    $('#breakpoint_error').text($page.find('pre').text() || xhr.statusText);
+  });
+}
+
+function bind_breakpoint_events() {
+  $('#breakpoint_window').on('shown.bs.modal', () => {
+    $('#breakpoint_text').focus();
+  });
+  $('#breakpoint_form').submit((event) => {
+    event.preventDefault();
+    set_breakpoint();
+  });
+}
+
+export { edit_breakpoint, bind_breakpoint_events };
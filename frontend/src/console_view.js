@@ -0,0 +1,161 @@
+/*
+Copyright (c) 2018 Roman Miroshnychenko <roman1972@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+*/
+
+import $ from 'jquery';
+import Prism from 'prismjs';
+import 'prismjs/components/prism-python.js';
+
+import { session_url } from './globals';
+import {
+  create_list,
+  bind_list,
+  render_list,
+  set_list_length,
+  scroll_list_by,
+  scroll_list_to_end,
+  is_list_at_end
+} from './virtual_list';
+
+// Size of older console history ranges requested from the back-end
+const HISTORY_PAGE_SIZE = 64 * 1024,
+    // Max number of console characters kept in the browser while a user browses older output
+    MAX_BROWSED_SIZE = 2 * 1024 * 1024,
+    // Max number of console characters kept in the browser
+    MAX_CONSOLE_SIZE = 256 * 1024,
+    console_list = create_list('#console'),
+    // Console lines starting from "start" offset of the session console history
+    history = {
+      start: 0,
+      end: 0,
+      first: 0,
+      lines: [''],
+      loading: false
+    };
+
+function reset_console(console_data) {
+  history.start = console_data.start;
+  history.end = console_data.start + console_data.data.length;
+  history.first = 0;
+  history.lines = console_data.data.split('\n');
+}
+
+function append_console(console_data) {
+  // Returns false if some console output has been missed
+  const overlap = history.end - console_data.start,
+      tail_lines = console_data.data.slice(Math.max(overlap, 0)).split('\n');
+  if (overlap < 0) {
+    return false;
+  }
+  history.lines[history.lines.length - 1] += tail_lines.shift();
+  history.lines = history.lines.concat(tail_lines);
+  history.end = Math.max(history.end, console_data.start + console_data.data.length);
+  return true;
+}
+
+function trim_console(max_size) {
+  // Discard the oldest lines exceeding the size limit.
+  // Returns the number of discarded lines.
+  let count = 0,
+      size = history.end - history.start;
+  while (size > max_size && count < history.lines.length - 1) {
+    size -= history.lines[count].length + 1;
+    count++;
+  }
+  if (count > 0) {
+    history.lines.splice(0, count);
+    history.start = history.end - size;
+  }
+  return count;
+}
+
+function make_console_row(index) {
+  return `<span class="virtual-row">${Prism.highlight(history.lines[index], Prism.languages.python, 'python')}</span>`;
+}
+
+function prepend_history(result) {
+  // Add a range of older history received from the back-end.
+  // The same lines are kept visible in the console.
+  const lines = result.data.split('\n');
+  let start = result.start;
+  if (start > result.first && lines.length > 1) {
+    // Drop an incomplete line
+    start += lines.shift().length + 1;
+  }
+  history.first = result.first;
+  if (result.end !== history.start) {
+    return;
+  }
+  lines[lines.length - 1] += history.lines[0];
+  history.lines = lines.concat(history.lines.slice(1));
+  history.start = start;
+  set_list_length(console_list, history.lines.length);
+  scroll_list_by(console_list, lines.length - 1);
+  render_list(console_list);
+}
+
+function load_older_history(first) {
+  // Request older console history when a user scrolls to the top of the console
+  if (first > 0 || history.loading || history.start <= history.first) {
+    return;
+  }
+  history.loading = true;
+  $.getJSON(session_url('console-history'), {
+    start: Math.max(history.start - HISTORY_PAGE_SIZE, 0),
+    end: history.start
+  })
+  .then((result) => {
+    history.loading = false;
+    prepend_history(result);
+  }, () => {
+    history.loading = false;
+  });
+}
+
+function render_console() {
+  // The console follows new output unless a user scrolls it up to older output
+  const at_end = is_list_at_end(console_list);
+  let max_size = MAX_BROWSED_SIZE,
+      removed = 0;
+  if (at_end) {
+    max_size = MAX_CONSOLE_SIZE;
+  }
+  removed = trim_console(max_size);
+  set_list_length(console_list, history.lines.length);
+  if (at_end) {
+    scroll_list_to_end(console_list);
+  } else {
+    scroll_list_by(console_list, -removed);
+  }
+  render_list(console_list);
+}
+
+function bind_console_events() {
+  bind_list(console_list, make_console_row, load_older_history);
+  $(window).resize(() => {
+    // Render visible rows after the console box is resized by another handler
+    window.requestAnimationFrame(() => {
+      render_list(console_list);
+    });
+  });
+}
+
+export { reset_console, append_console, render_console, bind_console_events };
@@ -20,15 +20,39 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 */
 
+function session_url(path) {
+  // Relative URLs keep the path prefix when the page is served via a gateway.
+  // The debugged thread is selected by "thread" query parameter of the page.
+  // Observer view mode is marked with "observer" query parameter.
+  const params = new URLSearchParams(window.location.search),
+    thread = params.get('thread'),
+    url = new URL(path, window.location.href);
+  if (thread !== null) {
+    url.searchParams.set('thread', thread);
+  }
+  if (params.has('observer')) {
+    url.searchParams.set('observer', '1');
+  }
+  return url.href;
+}
+
 const state = {
   command_history: [],
   history_index: -1,
-  console_history: '',
+  seq: -1,
   dirname: '',
   filename: '',
+  file_hash: '',
   current_line: -1,
-  breakpoints: []
+  breakpoints: [],
+  logpoints: [],
+  globals: {},
+  locals: {},
+  hidden_variables: [],
+  observer: new URLSearchParams(window.location.search).has('observer'),
+  thread: '',
+  threads: []
 },
-  websocket = new WebSocket('ws://' + window.location.host + '/ws');
+  websocket = new WebSocket(session_url('ws').replace(/^http/u, 'ws'));
 
-export { websocket, state };
+export { websocket, state, session_url };
@@ -24,9 +24,16 @@ import $ from 'jquery';
 import 'bootstrap/dist/js/bootstrap.min.js';
 import 'bootstrap/dist/css/bootstrap.min.css';
 
+import { bind_breakpoint_events } from './breakpoints';
 import bind_button_events from './button_events';
+import { bind_console_events } from './console_view';
 import bind_key_events from './key_events';
+import bind_profiler_events from './profiler';
+import { bind_variable_events } from './variables';
+import { bind_thread_events } from './threads';
+import { bind_source_events } from './source_view';
 import { resize_console } from './utils';
+import { state } from './globals';
 import update_ui from './update_ui';
 
 import './styles.css';
@@ -34,9 +41,20 @@ import './styles.css';
 $(() => {
   bind_button_events();
   bind_key_events();
+  bind_variable_events();
+  bind_thread_events();
+  bind_breakpoint_events();
+  bind_source_events();
+  bind_console_events();
+  bind_profiler_events();
   $(window).resize(resize_console);
   $('title').text(`Web-PDB Console on ${window.location.host}`);
   $('#host').html(`Web-PDB Console on <em>${window.location.host}</em>`);
+  if (state.observer) {
+    // Observer view mode hides debugger controls
+    $('body').addClass('observer');
+    $('#host').append(' (observer)');
+  }
   resize_console();
   update_ui();
 });
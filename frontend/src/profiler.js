@@ -0,0 +1,219 @@
+/*
+Copyright (c) 2018 Roman Miroshnychenko <roman1972@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+*/
+
+import $ from 'jquery';
+
+import { session_url } from './globals';
+
+// Profile update interval in milliseconds while the profiler window is open
+const POLL_INTERVAL = 1000,
+    // Height of a flame graph row in pixels
+    ROW_HEIGHT = 18,
+    // Nodes narrower than this percentage of the graph width are not rendered
+    MIN_WIDTH = 0.1,
+    profiler = {
+      profile: null,
+      // Function indexes of the path to the zoomed node
+      zoom: [],
+      timer: null
+    };
+
+function build_tree(profile) {
+  // Merge sampled stacks into a tree of nodes with sample counts
+  const root = {
+    func: -1,
+    path: [],
+    value: 0,
+    children: new Map()
+  };
+  profile.stacks.forEach((stack) => {
+    let node = root;
+    root.value += stack[0];
+    stack.slice(1).forEach((func) => {
+      if (!node.children.has(func)) {
+        node.children.set(func, {
+          func,
+          path: node.path.concat([func]),
+          value: 0,
+          children: new Map()
+        });
+      }
+      node = node.children.get(func);
+      node.value += stack[0];
+    });
+  });
+  return root;
+}
+
+function get_label(func) {
+  const info = profiler.profile.functions[func];
+  if (func === -1) {
+    return 'all';
+  }
+  if (info[1] === '') {
+    return info[0];
+  }
+  return `${info[0]} (${info[1]}:${info[2]})`;
+}
+
+function get_color(func) {
+  // Functions keep the same warm color between updates
+  let hue = 0;
+  if (func !== -1) {
+    hue = Array.from(get_label(func)).reduce((hash, char) => (hash * 31 + char.charCodeAt(0)) % 997, 0) % 60;
+  }
+  return `hsl(${hue}, 85%, 60%)`;
+}
+
+function render_node(node, place, $graph) {
+  // The place contains the left offset and the width of the node in percent and its depth.
+  // Returns the max depth of rendered nodes.
+  const title = `${get_label(node.func)}: ${node.value} samples`;
+  let left = place.left,
+      max_depth = place.depth;
+  if (place.width < MIN_WIDTH) {
+    return place.depth - 1;
+  }
+  $('<div class="flame-node"></div>').text(title)
+  .attr('title', title)
+  .data('path', node.path)
+  .css({
+    left: `${place.left}%`,
+    width: `${place.width}%`,
+    top: place.depth * ROW_HEIGHT,
+    'background-color': get_color(node.func)
+  })
+  .appendTo($graph);
+  node.children.forEach((child) => {
+    const width = place.width * child.value / node.value;
+    max_depth = Math.max(max_depth, render_node(child, {
+      left,
+      width,
+      depth: place.depth + 1
+    }, $graph));
+    left += width;
+  });
+  return max_depth;
+}
+
+function find_zoomed_node(root) {
+  // Returns the zoomed node or the root if the zoomed node is not sampled anymore
+  let node = root;
+  profiler.zoom.every((func) => {
+    if (!node.children.has(func)) {
+      profiler.zoom = [];
+      node = root;
+      return false;
+    }
+    node = node.children.get(func);
+    return true;
+  });
+  return node;
+}
+
+function render_profile() {
+  const $graph = $('#flame_graph'),
+      profile = profiler.profile,
+      root = build_tree(profile);
+  let max_depth = -1,
+      status = `${profile.samples} samples`;
+  if (profile.running) {
+    status += `, sampling every ${Math.round(profile.interval * 1000)} ms`;
+  }
+  if (profile.dropped > 0) {
+    status += `, ${profile.dropped} stacks dropped`;
+  }
+  $('#profiler_status').text(status);
+  $('#profiler_start_btn').prop('disabled', profile.running);
+  $('#profiler_stop_btn').prop('disabled', !profile.running);
+  $graph.empty();
+  if (root.value > 0) {
+    max_depth = render_node(find_zoomed_node(root), {
+      left: 0,
+      width: 100,
+      depth: 0
+    }, $graph);
+  }
+  $graph.height((max_depth + 1) * ROW_HEIGHT);
+}
+
+function load_profile(method, path) {
+  $.ajax({
+    url: session_url(path),
+    method,
+    dataType: 'json'
+  })
+  .then((profile) => {
+    if (profile) {
+      profiler.profile = profile;
+      render_profile();
+    }
+  });
+}
+
+function zoom(path) {
+  // Clicking a node shows it as the root of the graph, clicking the root resets zoom
+  if (path.join(',') === profiler.zoom.join(',')) {
+    profiler.zoom = [];
+  } else {
+    profiler.zoom = path;
+  }
+  render_profile();
+}
+
+function bind_profiler_events() {
+  $('#profiler_btn').click(() => {
+    $('#profiler_window').modal();
+  });
+  $('#profiler_window').on('shown.bs.modal', () => {
+    load_profile('GET', 'profile');
+    profiler.timer = window.setInterval(() => {
+      if (profiler.profile !== null && profiler.profile.running) {
+        load_profile('GET', 'profile');
+      }
+    }, POLL_INTERVAL);
+  });
+  $('#profiler_window').on('hidden.bs.modal', () => {
+    window.clearInterval(profiler.timer);
+  });
+  $('#profiler_start_btn').click(() => {
+    load_profile('POST', 'profile/start');
+  });
+  $('#profiler_stop_btn').click(() => {
+    load_profile('POST', 'profile/stop');
+  });
+  $('#profiler_reset_btn').click(() => {
+    profiler.zoom = [];
+    $.ajax({
+      url: session_url('profile'),
+      method: 'DELETE'
+    })
+    .then(() => {
+      load_profile('GET', 'profile');
+    });
+  });
+  $('#flame_graph').on('click', '.flame-node', (event) => {
+    zoom($(event.currentTarget).data('path'));
+  });
+}
+
+export default bind_profiler_events;
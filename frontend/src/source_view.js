@@ -0,0 +1,189 @@
+/*
+Copyright (c) 2018 Roman Miroshnychenko <roman1972@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+*/
+
+import $ from 'jquery';
+import Prism from 'prismjs';
+import 'prismjs/components/prism-python.js';
+
+import { state } from './globals';
+import { edit_breakpoint } from './breakpoints';
+import { send_command } from './utils';
+import {
+  create_list,
+  bind_list,
+  render_list,
+  set_list_length,
+  get_rendered_rows,
+  scroll_list_to
+} from './virtual_list';
+
+// Source lines are highlighted in chunks when they are scrolled into view.
+// A multi-line string that crosses a chunk boundary may be highlighted incorrectly.
+const CHUNK_LINES = 200,
+    // Max number of source listings kept in the browser
+    MAX_CACHED_LISTINGS = 20,
+    source_cache = new Map(),
+    source_list = create_list('#curr_file'),
+    view = {
+      listing: null,
+      current_line: -1
+    };
+
+function load_source(file_hash) {
+  // Returns a promise resolved with a file listing.
+  // A listing contains source lines and a map of highlighted chunks.
+  if (source_cache.has(file_hash)) {
+    return Promise.resolve(source_cache.get(file_hash));
+  }
+  if (!file_hash) {
+    return Promise.resolve({
+      lines: ['No data available'],
+      chunks: new Map()
+    });
+  }
+  return $.get(`source/${file_hash}`, null, null, 'text').then((text) => {
+    const listing = {
+      lines: text.replace(/\n$/u, '').split('\n'),
+      chunks: new Map()
+    };
+    source_cache.set(file_hash, listing);
+    if (source_cache.size > MAX_CACHED_LISTINGS) {
+      source_cache.delete(source_cache.keys().next().value);
+    }
+    return listing;
+  });
+}
+
+function stringify_lines(content) {
+  // Convert Prism tokens to a list of HTML lines.
+  // Tokens that span several lines are closed at the end of each line.
+  let class_name = '';
+  if (typeof content === 'string') {
+    return Prism.util.encode(content).split('\n');
+  }
+  if (Array.isArray(content)) {
+    return content.reduce((lines, token) => {
+      const token_lines = stringify_lines(token);
+      lines[lines.length - 1] += token_lines.shift();
+      lines.push(...token_lines);
+      return lines;
+    }, ['']);
+  }
+  class_name = `token ${content.type}`;
+  if (content.alias) {
+    class_name += ' ' + [].concat(content.alias).join(' ');
+  }
+  return stringify_lines(content.content).map((line) => `<span class="${class_name}">${line}</span>`);
+}
+
+function get_chunk(index) {
+  // Returns highlighted lines of a chunk of the current listing
+  const chunks = view.listing.chunks,
+      start = index * CHUNK_LINES;
+  if (!chunks.has(index)) {
+    chunks.set(index, stringify_lines(Prism.tokenize(
+      view.listing.lines.slice(start, start + CHUNK_LINES).join('\n'),
+      Prism.languages.python
+    )));
+  }
+  return chunks.get(index);
+}
+
+function get_marker_class(lineno) {
+  if (state.breakpoints.indexOf(lineno) !== -1) {
+    return 'breakpoint';
+  }
+  if (state.logpoints.indexOf(lineno) !== -1) {
+    return 'logpoint';
+  }
+  return '';
+}
+
+function make_row(index) {
+  const code = get_chunk(Math.floor(index / CHUNK_LINES))[index % CHUNK_LINES],
+      lineno = index + 1;
+  let row_class = 'virtual-row source-line';
+  if (lineno === state.current_line) {
+    row_class += ' current-line';
+  }
+  return `<span class="${row_class}"><span id="lineno_${lineno}" class="source-lineno ${get_marker_class(lineno)}" ` +
+    `data-line="${lineno}"></span><span class="source-code">${code}</span></span>`;
+}
+
+function update_markers() {
+  // Move the current line marker and breakpoint marks within rendered lines
+  get_rendered_rows(source_list).each((index, element) => {
+    const lineno = source_list.first + index + 1;
+    $(element).toggleClass('current-line', lineno === state.current_line);
+    $(element).children('.source-lineno')
+    .removeClass('breakpoint logpoint')
+    .addClass(get_marker_class(lineno));
+  });
+}
+
+function render_source() {
+  // Highlighted lines are re-used if the file has not changed.
+  // Only the current line and breakpoint marks are updated then.
+  const file_hash = state.file_hash;
+  load_source(file_hash).then((listing) => {
+    if (file_hash !== state.file_hash) {
+      // A newer listing is being loaded
+      return;
+    }
+    if (listing !== view.listing) {
+      view.listing = listing;
+      view.current_line = -1;
+      set_list_length(source_list, listing.lines.length);
+    }
+    if (state.current_line !== view.current_line) {
+      view.current_line = state.current_line;
+      if (state.current_line !== -1) {
+        scroll_list_to(source_list, state.current_line - 1);
+      }
+    }
+    if (!render_list(source_list)) {
+      update_markers();
+    }
+  });
+}
+
+function toggle_breakpoint(event) {
+  const $lineno = $(event.currentTarget),
+      position = state.dirname + state.filename + ':' + $lineno.data('line');
+  if ($lineno.hasClass('breakpoint') || $lineno.hasClass('logpoint')) {
+    send_command('cl ' + position);
+  } else {
+    send_command('b ' + position);
+  }
+}
+
+function bind_source_events() {
+  bind_list(source_list, make_row);
+  $('#curr_file_code').on('click', '.source-lineno', toggle_breakpoint);
+  // Right click sets a conditional breakpoint or a logpoint
+  $('#curr_file_code').on('contextmenu', '.source-lineno', (event) => {
+    event.preventDefault();
+    edit_breakpoint($(event.currentTarget).data('line'));
+  });
+}
+
+export { render_source, bind_source_events };
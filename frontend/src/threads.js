@@ -0,0 +1,69 @@
+/*
+Copyright (c) 2018 Roman Miroshnychenko <roman1972@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+*/
+
+import $ from 'jquery';
+
+import { state } from './globals';
+
+function select_thread(thread_id) {
+  // Reload the page bound to another debugged thread
+  const params = new URLSearchParams(window.location.search);
+  params.set('thread', thread_id);
+  window.location.search = params.toString();
+}
+
+function render_threads() {
+  const $threads = $('#threads');
+  $threads.empty();
+  state.threads.forEach((thread) => {
+    let label = thread.name;
+    if (thread.paused) {
+      label += ' (paused)';
+    }
+    $('<option></option>')
+    .val(thread.id)
+    .text(label)
+    .appendTo($threads);
+  });
+  $threads.val(state.thread);
+  $('#threads_form').toggleClass('hidden', state.threads.length < 2);
+}
+
+function apply_threads(threads) {
+  const is_current = (thread) => thread.id === state.thread,
+    next_thread = threads.find((thread) => thread.paused) || threads[0];
+  state.threads = threads;
+  if (state.thread !== '' && next_thread && !threads.some(is_current)) {
+    // The debugged thread has finished
+    select_thread(next_thread.id);
+    return;
+  }
+  render_threads();
+}
+
+function bind_thread_events() {
+  $('#threads').change(() => {
+    select_thread($('#threads').val());
+  });
+}
+
+export { apply_threads, render_threads, bind_thread_events };
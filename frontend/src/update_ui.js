@@ -21,61 +21,129 @@ SOFTWARE.
 */
 
 import $ from 'jquery';
-import Prism from 'prismjs';
-import 'prismjs/components/prism-python.js';
-import 'prismjs/plugins/line-highlight/prism-line-highlight.js';
-import './prism-line-numbers.js';
 
 import 'prismjs/themes/prism-okaidia.css';
-import 'prismjs/plugins/line-highlight/prism-line-highlight.css';
-import 'prismjs/plugins/line-numbers/prism-line-numbers.css';
 
-import { websocket, state } from './globals';
+import { websocket, state, session_url } from './globals';
+import { append_console, render_console, reset_console } from './console_view';
+import { apply_threads, render_threads } from './threads';
+import { render_source } from './source_view';
+import { render_variable_filter, render_variables } from './variables';
 
-let wait_buffer = [];
+let pending_updates = [],
+    resync_pending = false;
 
-function update_ui() {
-  $.getJSON('/frame-data')
-  .then((frame_data) => {
-    state.breakpoints = frame_data.breakpoints;
-    state.dirname = frame_data.dirname;
-    $('#filename').text(frame_data.filename);
-    $('#curr_line').text(frame_data.current_line);
-    const $console = $('#console'),
-        $curr_file = $('#curr_file'),
-        $curr_file_code = $('#curr_file_code'),
-        $globals = $('#globals'),
-        $locals = $('#locals'),
-        $stdout = $('#stdout');
-    $globals.text(frame_data.globals);
-    $locals.text(frame_data.locals);
-    $stdout.text(frame_data.console_history);
-    $console.scrollTop($console.prop('scrollHeight'));
-    $curr_file_code.text(frame_data.file_listing);
-    $curr_file.attr('data-line', frame_data.current_line);
-    Prism.highlightAll();
-    if (frame_data.current_line !== -1 &&
-        (frame_data.filename !== state.filename ||
-          frame_data.current_line !== state.current_line)) {
-      state.filename = frame_data.filename;
-      state.current_line = frame_data.current_line;
-      // Modified from here: https://stackoverflow.com/questions/2905867/how-to-scroll-to-specific-item-using-jquery
-      $curr_file.scrollTop($(`#lineno_${state.current_line}`).offset().top -
-          $curr_file.offset().top + $curr_file.scrollTop() - $curr_file.height() / 2);
+function apply_variables_diff(vars, diff) {
+  if (diff.reset) {
+    Object.keys(vars).forEach((name) => {
+      Reflect.deleteProperty(vars, name);
+    });
+  }
+  Object.assign(vars, diff.changed);
+  diff.removed.forEach((name) => {
+    Reflect.deleteProperty(vars, name);
+  });
+}
+
+function render_ui(changed) {
+  if (changed.has('filename')) {
+    $('#filename').text(state.filename);
+  }
+  if (changed.has('current_line')) {
+    $('#curr_line').text(state.current_line);
+  }
+  if (changed.has('globals')) {
+    render_variables('globals', state.globals);
+  }
+  if (changed.has('locals')) {
+    render_variables('locals', state.locals);
+  }
+  if (changed.has('hidden_variables')) {
+    render_variable_filter();
+  }
+  if (changed.has('console')) {
+    render_console();
+  }
+  if (changed.has('file_hash') || changed.has('current_line') ||
+      changed.has('breakpoints') || changed.has('logpoints')) {
+    render_source();
+  }
+  if (changed.has('thread')) {
+    render_threads();
+  }
+}
+
+function apply_snapshot(frame_data) {
+  const changed = new Set(Object.keys(frame_data));
+  Object.keys(frame_data).forEach((key) => {
+    if (key !== 'console' && key in state) {
+      state[key] = frame_data[key];
     }
   });
+  reset_console(frame_data.console);
+  render_ui(changed);
 }
 
-websocket.onmessage = () => {
-  // WebSocket receives only data update pings from the back-end so payload does not matter.
-  // This method prevents firing bursts of requests to the back-end when it sends a series of pings.
-  wait_buffer.push(null);
-  setTimeout(() => {
-    wait_buffer.pop();
-    if (!wait_buffer.length) {
+function apply_update(update) {
+  // Returns false if the UI needs to be re-synchronized with the back-end
+  const changed = new Set(Object.keys(update));
+  if (update.resync) {
+    // The back-end has skipped updates because the client was lagging behind
+    return false;
+  }
+  if (update.seq <= state.seq) {
+    // Already included in a snapshot
+    return true;
+  }
+  if (update.seq !== state.seq + 1) {
+    return false;
+  }
+  if ('console' in update && !append_console(update.console)) {
+    return false;
+  }
+  state.seq = update.seq;
+  Object.keys(update).forEach((key) => {
+    if (key === 'globals' || key === 'locals') {
+      apply_variables_diff(state[key], update[key]);
+    } else if (key !== 'console' && key in state) {
+      state[key] = update[key];
+    }
+  });
+  render_ui(changed);
+  return true;
+}
+
+function update_ui() {
+  // Download a full snapshot of the current debugger state.
+  // Updates received while waiting for it are applied after the snapshot.
+  resync_pending = true;
+  $.getJSON(session_url('frame-data'))
+  .then((frame_data) => {
+    const updates = pending_updates;
+    resync_pending = false;
+    pending_updates = [];
+    apply_snapshot(frame_data);
+    if (!updates.every(apply_update)) {
       update_ui();
     }
-  }, 1);
+  }, () => {
+    resync_pending = false;
+    pending_updates = [];
+  });
+}
+
+websocket.onopen = update_ui;
+
+websocket.onmessage = (event) => {
+  const message = JSON.parse(event.data);
+  if ('threads' in message) {
+    // The list of debugged threads is not a part of frame data updates
+    apply_threads(message.threads);
+  } else if (resync_pending) {
+    pending_updates.push(message);
+  } else if (!apply_update(message)) {
+    update_ui();
+  }
 };
 
 export default update_ui;
@@ -35,7 +35,7 @@ function save_command_in_history(command) {
 }
 
 function send_command(command) {
-  if (websocket.readyState === websocket.OPEN) {
+  if (!state.observer && websocket.readyState === websocket.OPEN) {
     websocket.send(command + '\n');
     return true;
   }
@@ -0,0 +1,199 @@
+/*
+Copyright (c) 2018 Roman Miroshnychenko <roman1972@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+*/
+
+import $ from 'jquery';
+import Prism from 'prismjs';
+
+import { session_url, state } from './globals';
+import {
+  create_list,
+  bind_list,
+  render_list,
+  refresh_list,
+  set_list_length
+} from './virtual_list';
+
+// Kinds of variables that are hidden by the variable filter
+const FILTERED_KINDS = [
+      'classes',
+      'functions',
+      'modules'
+    ],
+    // Number of child items requested from the back-end at once
+    PAGE_SIZE = 100,
+    // Variables are shown as flat lists of rows with children following their parents.
+    // Children that are not loaded yet are represented by "more" rows.
+    panels = {
+      globals: {
+        list: create_list('#globals_panel'),
+        rows: []
+      },
+      locals: {
+        list: create_list('#locals_panel'),
+        rows: []
+      }
+    };
+
+function make_variable(scope, path, item) {
+  return {
+    scope,
+    path,
+    depth: path.length - 1,
+    key: item.key,
+    repr: item.repr,
+    expandable: item.expandable,
+    expanded: false,
+    html: null
+  };
+}
+
+function make_row(panel, index) {
+  // Returns HTML of a variable or of a placeholder for children that are being loaded
+  const row = panel.rows[index];
+  let class_name = 'virtual-row variable';
+  if (row.more) {
+    return `<span class="virtual-row variable-more" style="padding-left: ${row.depth * 2}ch">...</span>`;
+  }
+  if (row.html === null) {
+    row.html = Prism.highlight(`${row.key} = ${row.repr}`, Prism.languages.python, 'python');
+  }
+  if (row.expandable) {
+    class_name += ' expandable';
+  }
+  if (row.expanded) {
+    class_name += ' expanded';
+  }
+  return `<span class="${class_name}" style="padding-left: ${row.depth * 2}ch" data-row="${index}">` +
+    `<span class="variable-label">${row.html}</span></span>`;
+}
+
+function load_children(panel, more) {
+  // Load a page of children of an expanded variable in place of a "more" row
+  const offset = more.offset,
+      parent = more.parent;
+  more.loading = true;
+  $.getJSON(session_url('vars'), {
+    scope: parent.scope,
+    path: parent.path.join(','),
+    offset,
+    limit: PAGE_SIZE
+  }).then((info) => {
+    const children = info.children.map((child, index) => make_variable(parent.scope,
+          parent.path.concat([offset + index]), child)),
+        position = panel.rows.indexOf(more);
+    if (position === -1) {
+      // The variable has been collapsed or the panel has been re-rendered
+      return;
+    }
+    more.loading = false;
+    more.offset = offset + children.length;
+    if (more.offset < info.length && children.length > 0) {
+      children.push(more);
+    }
+    panel.rows.splice(position, 1, ...children);
+    set_list_length(panel.list, panel.rows.length);
+    render_list(panel.list);
+  }, () => {
+    more.loading = false;
+  });
+}
+
+function load_visible_children(panel, first, last) {
+  // Children are loaded when their placeholders are scrolled into view
+  panel.rows.slice(first, last).forEach((row) => {
+    if (row.more && !row.loading) {
+      load_children(panel, row);
+    }
+  });
+}
+
+function toggle_variable(panel, index) {
+  const row = panel.rows[index];
+  let count = 0;
+  if (row.expanded) {
+    while (index + count + 1 < panel.rows.length && panel.rows[index + count + 1].depth > row.depth) {
+      count++;
+    }
+    panel.rows.splice(index + 1, count);
+  } else {
+    panel.rows.splice(index + 1, 0, {
+      more: true,
+      parent: row,
+      depth: row.depth + 1,
+      offset: 0,
+      loading: false
+    });
+  }
+  row.expanded = !row.expanded;
+  set_list_length(panel.list, panel.rows.length);
+  refresh_list(panel.list);
+}
+
+function render_variables(scope, vars) {
+  // Render a variables panel where each variable can be expanded.
+  // Contents of variables are lazily loaded from the back-end.
+  const panel = panels[scope];
+  panel.rows = Object.keys(vars).sort()
+  .map((name) => make_variable(scope, [name], {
+    key: name,
+    repr: vars[name],
+    expandable: true
+  }));
+  set_list_length(panel.list, panel.rows.length);
+  render_list(panel.list);
+}
+
+function render_variable_filter() {
+  $('#variable_filter_btn').toggleClass('active', state.hidden_variables.length > 0);
+}
+
+function toggle_variable_filter() {
+  // The back-end sends the new filter with updated variables
+  let hidden = FILTERED_KINDS;
+  if (state.hidden_variables.length > 0) {
+    hidden = [];
+  }
+  $.ajax({
+    url: session_url('variable-filters'),
+    method: 'PUT',
+    contentType: 'application/json',
+    data: JSON.stringify({ hidden })
+  });
+}
+
+function bind_variable_events() {
+  Object.keys(panels).forEach((scope) => {
+    const panel = panels[scope];
+    bind_list(panel.list, (index) => make_row(panel, index), (first, last) => {
+      load_visible_children(panel, first, last);
+    });
+    $(`#${scope}`).on('click', '.expandable > .variable-label', (event) => {
+      toggle_variable(panel, $(event.currentTarget).parent().data('row'));
+    });
+  });
+  $('#variable_filter_btn').click((event) => {
+    event.preventDefault();
+    toggle_variable_filter();
+  });
+}
+
+export { render_variables, render_variable_filter, bind_variable_events };
@@ -0,0 +1,146 @@
+/*
+Copyright (c) 2018 Roman Miroshnychenko <roman1972@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+*/
+
+import $ from 'jquery';
+
+// Rows rendered above and below the visible part of a box
+const OVERSCAN_ROWS = 20;
+
+function create_list(box) {
+  // A virtual list renders only the rows that are visible in a scrollable box.
+  // The size of the DOM does not depend on the number of rows.
+  // The box must contain <code> element with <span class="virtual-rows"> inside.
+  // All rows must have "virtual-row" class to have the same height.
+  return {
+    box,
+    length: 0,
+    row_height: 0,
+    first: -1,
+    last: -1,
+    make_row: null,
+    on_render: null,
+    frame_requested: false
+  };
+}
+
+function get_row_height(list) {
+  if (!list.row_height) {
+    const $probe = $('<span class="virtual-row">&nbsp;</span>').appendTo(`${list.box} > code`);
+    list.row_height = $probe.outerHeight();
+    $probe.remove();
+  }
+  return list.row_height || 20;
+}
+
+function render_list(list) {
+  // Render the rows that are visible in the box.
+  // Returns false if the visible rows are already rendered.
+  const $box = $(list.box),
+      height = get_row_height(list),
+      row_first = Math.max(0, Math.floor($box.scrollTop() / height) - OVERSCAN_ROWS),
+      row_last = Math.min(list.length,
+          Math.ceil(($box.scrollTop() + $box.innerHeight()) / height) + OVERSCAN_ROWS);
+  let html = '';
+  if (row_first === list.first && row_last === list.last) {
+    return false;
+  }
+  for (let index = row_first; index < row_last; index++) {
+    html += list.make_row(index);
+  }
+  list.first = row_first;
+  list.last = row_last;
+  $box.find('.virtual-rows').css('top', row_first * height)
+  .html(html);
+  if (list.on_render !== null) {
+    list.on_render(row_first, row_last);
+  }
+  return true;
+}
+
+function refresh_list(list) {
+  // Re-render visible rows after their contents have changed
+  list.first = -1;
+  render_list(list);
+}
+
+function set_list_length(list, length) {
+  list.length = length;
+  list.first = -1;
+  $(`${list.box} > code`).height(length * get_row_height(list));
+}
+
+function get_rendered_rows(list) {
+  // Returns a jQuery object with rendered rows starting from list.first
+  return $(list.box).find('.virtual-rows')
+  .children();
+}
+
+function scroll_list_to(list, index) {
+  // Scroll the box to show the row in the middle
+  const $box = $(list.box);
+  $box.scrollTop((index + 0.5) * get_row_height(list) - $box.height() / 2);
+}
+
+function scroll_list_by(list, rows) {
+  // Keep the same rows visible after rows have been added or removed above them
+  const $box = $(list.box);
+  $box.scrollTop($box.scrollTop() + rows * get_row_height(list));
+}
+
+function scroll_list_to_end(list) {
+  $(list.box).scrollTop(list.length * get_row_height(list));
+}
+
+function is_list_at_end(list) {
+  const $box = $(list.box);
+  return $box.scrollTop() + $box.innerHeight() >= $box.prop('scrollHeight') - get_row_height(list);
+}
+
+function bind_list(list, make_row, on_render) {
+  // The make_row(index) function returns HTML of a row.
+  // Optional on_render(first, last) callback is called after visible rows are rendered.
+  list.make_row = make_row;
+  list.on_render = on_render || null;
+  $(list.box).scroll(() => {
+    // Render rows once per animation frame while scrolling
+    if (!list.frame_requested) {
+      list.frame_requested = true;
+      window.requestAnimationFrame(() => {
+        list.frame_requested = false;
+        render_list(list);
+      });
+    }
+  });
+}
+
+export {
+  create_list,
+  bind_list,
+  render_list,
+  refresh_list,
+  set_list_length,
+  get_rendered_rows,
+  scroll_list_to,
+  scroll_list_by,
+  scroll_list_to_end,
+  is_list_at_end
+};
@@ -21,22 +21,57 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import bdb
+import gzip
+import importlib.util
+import json
+import os
+import socket
 import sys
+import tempfile
 import time
+import types
 from pathlib import Path
-from subprocess import Popen
+from subprocess import Popen, run
+from threading import Thread, current_thread
 from unittest import TestCase, main, skipIf
+from urllib.error import URLError
+from urllib.request import urlopen
+from wsgiref.util import setup_testing_defaults
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 
 CWD = Path(__file__).resolve().parent
+sys.path.insert(0, str(CWD.parent))
+
+# pylint: disable=wrong-import-position
+from web_pdb import WebPdb
+from web_pdb.async_server import AsyncioWsgiServer, AsyncioWebSocketHandler
+from web_pdb.breakpoints import BreakpointChecker, compile_log_message
+from web_pdb.buffer import ConsoleHistory
+from web_pdb.gateway import Gateway
+from web_pdb.monitoring import BreakpointMonitor, ThreadInterrupter
+from web_pdb.profiler import SamplingProfiler
+from web_pdb.registry import register_session, unregister_session, list_sessions
+from web_pdb.sessions import SessionRegistry
+from web_pdb.snapshots import SnapshotWriter, list_snapshots, load_snapshot
+from web_pdb.reprs import (SafeRepr, NotEvaluated, get_child, get_children, get_members,
+                           evaluate_member)
+from web_pdb.source_cache import SourceCache
+from web_pdb.summarizers import SummarizerRegistry
+from web_pdb.variables import VARIABLE_KINDS, VariableListing
+from web_pdb.web_console import WebConsoleSocketBase
+from web_pdb.wsgi_app import app
+
 DB_PY = CWD / 'db.py'
 
 IS_PY_310 = sys.version_info[:2] >= (3, 10)
+IS_PY_312 = sys.version_info[:2] >= (3, 12)
 IS_PY_313 = sys.version_info[:2] >= (3, 13)
 
+
 class SeleniumTestCase(TestCase):
     @classmethod
     def setUpClass(cls):
@@ -71,6 +106,7 @@ class SeleniumTestCase(TestCase):
                 if self in failed_tests:
                     self.browser.save_screenshot(f'screenshot-{self}.png')
 
+
 class WebPdbTestCase(SeleniumTestCase):
     """
     This class provides basic functionality testing for Web-PDB
@@ -139,9 +175,8 @@ class WebPdbTestCase(SeleniumTestCase):
         self.stdin.send_keys('b 20')
         self.send_btn.click()
         time.sleep(1)
-        line_numbers_rows = self.browser.find_element(By.CSS_SELECTOR, 'span.line-numbers-rows')
-        line_spans = line_numbers_rows.find_elements(By.TAG_NAME, 'span')
-        self.assertEqual('breakpoint', line_spans[19].get_attribute('class'))
+        line_span = self.browser.find_element(By.ID, 'lineno_20')
+        self.assertIn('breakpoint', line_span.get_attribute('class').split())
 
     def test_5_unicode_literal(self):
         """
@@ -268,5 +303,715 @@ class InspectCommandTestCase(SeleniumTestCase):
                       self.stdout_tag.text)
 
 
+class ConsoleHistoryTestCase(TestCase):
+    """
+    Test bounded console history storage
+    """
+    def test_read_ranges(self):
+        history = ConsoleHistory()
+        history.append('foo\n')
+        history.append('bar\n')
+        self.assertEqual((0, 'foo\nbar\n'), history.read())
+        self.assertEqual((4, 'bar'), history.read(4, 7))
+        self.assertEqual((5, 'ar\n'), history.tail(3))
+
+    def test_size_eviction(self):
+        history = ConsoleHistory(max_size=1000)
+        history.chunk_size = 100
+        for i in range(1000):
+            history.append(f'{i:04}\n')
+        self.assertEqual(5000, history.end)
+        self.assertGreater(history.start, 0)
+        start, data = history.read(0)
+        self.assertEqual(history.start, start)
+        self.assertTrue(data.endswith('0999\n'))
+        self.assertEqual(data[:5], f'{start // 5:04}\n')
+
+    def test_line_eviction(self):
+        history = ConsoleHistory(max_lines=100)
+        history.chunk_size = 10
+        for i in range(1000):
+            history.append(f'{i:04}\n')
+        _, data = history.read()
+        self.assertLessEqual(data.count('\n'), 100)
+        self.assertTrue(data.endswith('0999\n'))
+
+    def test_oversized_write(self):
+        history = ConsoleHistory(max_size=10)
+        history.append('spam')
+        history.append('0123456789abcdef')
+        self.assertEqual(20, history.end)
+        self.assertEqual((10, '6789abcdef'), history.read())
+
+    def test_pending_chunk_eviction(self):
+        history = ConsoleHistory(max_size=10, max_lines=2)
+        history.append('spam\n')
+        history.append('ham\n')
+        history.append('eggs\n')
+        self.assertEqual(14, history.end)
+        self.assertEqual((5, 'ham\neggs\n'), history.read())
+        history.append('0123456')
+        self.assertEqual((11, 'gs\n0123456'), history.read())
+
+
+class SourceCacheTestCase(TestCase):
+    """
+    Test content-addressed source cache
+    """
+    def test_listing_is_read_once(self):
+        cache = SourceCache()
+        calls = []
+
+        def get_lines():
+            calls.append(None)
+            return DB_PY.read_text(encoding='utf-8').splitlines(True)
+
+        listing_hash = cache.add(str(DB_PY), get_lines)
+        self.assertEqual(listing_hash, cache.add(str(DB_PY), get_lines))
+        self.assertEqual(1, len(calls))
+        self.assertIn('foo = \'foo\'', cache.get(listing_hash))
+
+    def test_eviction(self):
+        cache = SourceCache(max_size=10)
+        spam_hash = cache.add('<spam>', lambda: ['spam' * 2])
+        eggs_hash = cache.add('<eggs>', lambda: ['eggs' * 2])
+        self.assertIsNone(cache.get(spam_hash))
+        self.assertEqual('eggs' * 2, cache.get(eggs_hash))
+
+
+class SafeReprTestCase(TestCase):
+    """
+    Test size-limited object representations
+    """
+    def test_large_containers(self):
+        safe_repr = SafeRepr()
+        self.assertLessEqual(len(safe_repr.repr(list(range(1000000)))), safe_repr.max_length)
+        self.assertLessEqual(len(safe_repr.repr('x' * 1000000)), safe_repr.max_length)
+        self.assertTrue(safe_repr.pformat(list(range(1000000))).endswith('...]'))
+
+    def test_recursive_containers(self):
+        spam = [1]
+        spam.append(spam)
+        self.assertEqual('[1, [1, [1, [1, [...]]]]]', SafeRepr().repr(spam))
+
+    def test_children(self):
+        class Spam:
+            @property
+            def eggs(self):
+                raise RuntimeError
+
+        spam = Spam()
+        spam.ham = {'foo': [1, 2]}
+        self.assertEqual([('ham', spam.ham)], list(get_children(spam)))
+        self.assertEqual(2, get_child(get_child(spam.ham, 0), 1))
+        with self.assertRaises(IndexError):
+            get_child(spam.ham, 1)
+
+    def test_members_are_not_evaluated(self):
+        class Spam:
+            __slots__ = ('ham',)
+
+            @property
+            def eggs(self):
+                raise RuntimeError('eggs')
+
+        spam = Spam()
+        spam.ham = 'ham'
+        members = dict(get_members(spam))
+        self.assertEqual('ham', members['ham'])
+        self.assertIsInstance(members['eggs'], NotEvaluated)
+        self.assertEqual('<RuntimeError: eggs>', repr(evaluate_member(spam, 'eggs')))
+
+
+class SummarizerRegistryTestCase(TestCase):
+    """
+    Test summaries of large objects
+    """
+    def setUp(self):
+        self.safe_repr = SafeRepr()
+        self.safe_repr.summarizers = SummarizerRegistry()
+
+    def test_summarizer(self):
+        class Grid(list):
+            pass
+
+        class SubGrid(Grid):
+            pass
+
+        self.safe_repr.summarizers.register(Grid, lambda grid: f'Grid({len(grid)})')
+        grid = SubGrid(range(100000))
+        self.assertEqual('Grid(100000)', self.safe_repr.repr(grid))
+        self.assertEqual('[Grid(100000)]', self.safe_repr.repr([grid]))
+        self.assertEqual('{1: Grid(100000)}', self.safe_repr.pformat({1: grid}))
+        self.safe_repr.summarizers.register(Grid, lambda grid: 1 / 0)
+        self.assertTrue(self.safe_repr.repr(grid).startswith('SubGrid([0, 1, 2'))
+        self.safe_repr.summarizers.register(Grid, None)
+        self.assertIsNone(self.safe_repr.summarizers.summarize(grid))
+
+    def test_summarizer_by_name(self):
+        module = types.ModuleType('web_pdb_test_module')
+
+        class Tensor:  # pylint: disable=too-few-public-methods
+            pass
+
+        module.Tensor = Tensor
+        self.safe_repr.summarizers.register('web_pdb_test_module.Tensor', lambda _: 'Tensor()')
+        self.assertIsNone(self.safe_repr.summarizers.summarize(Tensor()))
+        sys.modules[module.__name__] = module
+        try:
+            self.assertEqual('Tensor()', self.safe_repr.repr(Tensor()))
+        finally:
+            del sys.modules[module.__name__]
+        with self.assertRaises(ValueError):
+            self.safe_repr.summarizers.register('Tensor', lambda _: 'Tensor()')
+
+    @skipIf(importlib.util.find_spec('numpy') is None, 'NumPy is not installed')
+    def test_numpy_array(self):
+        import numpy  # pylint: disable=import-outside-toplevel,import-error
+        array = numpy.arange(1000000, dtype=numpy.int64).reshape(1000, 1000)
+        self.assertEqual('ndarray(shape=(1000, 1000), dtype=int64, memory=7.6 MiB) '
+                         '[0, 1, 2, ..., 999997, 999998, 999999]', SafeRepr().repr(array))
+
+
+class AsyncioWsgiServerTestCase(TestCase):
+    """
+    Test asyncio-based web-server
+    """
+    def test_serving_and_shutdown(self):
+        def wsgi_app(environ, start_response):
+            start_response('200 OK', [('Content-Type', 'text/plain')])
+            return [environ['QUERY_STRING'].encode('ascii')]
+
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        server = AsyncioWsgiServer('127.0.0.1', port, wsgi_app)
+        server_thread = Thread(target=server.serve_forever)
+        server_thread.start()
+        try:
+            for _ in range(50):
+                try:
+                    with urlopen(f'http://127.0.0.1:{port}/?spam', timeout=5) as response:
+                        self.assertEqual(b'spam', response.read())
+                    break
+                except URLError:
+                    time.sleep(0.1)
+            else:
+                self.fail('The server has not started')
+        finally:
+            start = time.monotonic()
+            server.shutdown()
+            server_thread.join(5)
+        self.assertFalse(server_thread.is_alive())
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_unmasked_websocket_frame(self):
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        server = AsyncioWsgiServer('127.0.0.1', port, None, AsyncioWebSocketHandler)
+        server_thread = Thread(target=server.serve_forever)
+        server_thread.start()
+        try:
+            for _ in range(50):
+                try:
+                    client = socket.create_connection(('127.0.0.1', port), timeout=5)
+                    break
+                except ConnectionRefusedError:
+                    time.sleep(0.1)
+            else:
+                self.fail('The server has not started')
+            with client:
+                client.sendall(b'GET /ws HTTP/1.1\r\nHost: localhost\r\n'
+                               b'Upgrade: websocket\r\nConnection: Upgrade\r\n'
+                               b'Sec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\n'
+                               b'Sec-WebSocket-Version: 13\r\n\r\n')
+                response = b''
+                while not response.endswith(b'\r\n\r\n'):
+                    response += client.recv(1)
+                self.assertIn(b' 101 ', response)
+                client.sendall(b'\x81\x04spam')
+                # The connection is closed with 1002 "protocol error" status
+                self.assertEqual(b'\x88\x02\x03\xea', client.recv(4))
+                self.assertEqual(b'', client.recv(1))
+        finally:
+            server.shutdown()
+            server_thread.join(5)
+
+
+class SessionRegistryTestCase(TestCase):
+    """
+    Test registry of gateway sessions
+    """
+    def test_register_and_list_sessions(self):
+        with tempfile.TemporaryDirectory() as sessions_dir:
+            socket_path = register_session(sessions_dir, 'spam')
+            self.assertEqual(os.path.join(sessions_dir, 'spam.sock'), socket_path)
+            self.assertEqual([], list_sessions(sessions_dir))  # No socket yet
+            Path(socket_path).touch()
+            sessions = list_sessions(sessions_dir)
+            self.assertEqual(['spam'], [session['id'] for session in sessions])
+            self.assertEqual(os.getpid(), sessions[0]['pid'])
+            unregister_session(sessions_dir, 'spam')
+            self.assertEqual([], os.listdir(sessions_dir))
+
+
+class GatewayTestCase(TestCase):
+    """
+    Test routing requests to sessions via the gateway
+    """
+    def test_session_requests(self):
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        session = app.sessions.open(current_thread())[0]
+        session.frame_data.contents = {'seq': 1, 'current_line': 7}
+        with tempfile.TemporaryDirectory() as sessions_dir:
+            server = AsyncioWsgiServer('', 0, app)
+            server.unix_path = register_session(sessions_dir, 'spam')
+            server_thread = Thread(target=server.serve_forever)
+            server_thread.start()
+            # The gateway runs until the end of the test process
+            gateway = Gateway('127.0.0.1', port, sessions_dir)
+            Thread(target=gateway.serve_forever, daemon=True).start()
+            try:
+                for _ in range(50):
+                    try:
+                        with urlopen(f'http://127.0.0.1:{port}/sessions', timeout=5) as response:
+                            sessions = json.loads(response.read())
+                        if sessions:
+                            break
+                    except URLError:
+                        pass
+                    time.sleep(0.1)
+                else:
+                    self.fail('The gateway has not started')
+                self.assertEqual(['spam'], [session['id'] for session in sessions])
+                with urlopen(f'http://127.0.0.1:{port}/session/spam/', timeout=5) as response:
+                    self.assertIn(b'src="static/bundle.min.js"', response.read())
+                with urlopen(f'http://127.0.0.1:{port}/session/spam/frame-data'
+                             f'?thread={session.id}&keys=current_line', timeout=5) as response:
+                    self.assertEqual({'seq': 1, 'current_line': 7}, json.loads(response.read()))
+            finally:
+                server.shutdown()
+                server_thread.join(5)
+                unregister_session(sessions_dir, 'spam')
+                app.sessions.remove(session)
+
+
+class DebugSessionsTestCase(TestCase):
+    """
+    Test debugging sessions of threads
+    """
+    def test_sessions_of_threads(self):
+        sessions = SessionRegistry()
+        self.assertIsNone(sessions.get())
+        session, is_new = sessions.open(current_thread())
+        self.assertTrue(is_new)
+        self.assertIs(session, sessions.open(current_thread(), reuse=True)[0])
+        results = []
+        thread = Thread(target=lambda: results.append(sessions.open(current_thread())[0]))
+        thread.start()
+        thread.join()
+        # The session of the finished thread is discarded
+        self.assertEqual([session.info], sessions.list())
+        self.assertIs(session, sessions.get(results[0].id))
+        session.awaiting_command.set()
+        self.assertTrue(sessions.list()[0]['paused'])
+        sessions.remove(session)
+        self.assertEqual(0, len(sessions))
+
+    def test_instances_of_finished_threads(self):
+        instances = []
+
+        def worker():
+            instances.append(WebPdb(port=-1))
+            instances.append(WebPdb.active_instance)
+
+        thread = Thread(target=worker)
+        thread.start()
+        thread.join()
+        try:
+            self.assertIs(instances[0], instances[1])
+            self.assertIsNone(WebPdb.active_instance)
+            # A new thread may get the ID of the finished one
+            thread = Thread(target=lambda: instances.append(WebPdb.get_active_instance()))
+            thread.start()
+            thread.join()
+            self.assertIsNone(instances[2])
+            self.assertEqual({}, WebPdb.active_instances)
+            self.assertTrue(instances[0].console.closed)
+        finally:
+            if not instances[0].console.closed:
+                instances[0].console.close()
+
+
+class FakeWebSocket(WebConsoleSocketBase):
+    """
+    WebSocket handler that keeps sent messages in memory
+    """
+    handshaked = True
+
+    def __init__(self, query=''):
+        self.query = query
+        self.queue = []
+        self.handleConnected()
+
+    @staticmethod
+    def prepareMessage(data):
+        return data.encode('utf-8')
+
+    def sendPrepared(self, message):
+        self.queue.append(message)
+
+    def sendMessage(self, data):
+        self.sendPrepared(self.prepareMessage(data))
+
+    def queued_messages(self):
+        return len(self.queue)
+
+    def drain(self):
+        messages = [json.loads(message) for message in self.queue]
+        self.queue = []
+        self._notify_sent()
+        return messages
+
+
+class WebSocketFanOutTestCase(TestCase):
+    """
+    Test sending updates to WebSocket clients
+    """
+    def test_lagging_client(self):
+        client = FakeWebSocket()
+        fast_client = FakeWebSocket()
+        try:
+            WebConsoleSocketBase.broadcast('{"seq": 1}')
+            # The message is encoded once for all clients
+            self.assertIs(client.queue[0], fast_client.queue[0])
+            for seq in range(2, FakeWebSocket.max_queued_messages + 10):
+                fast_client.drain()
+                WebConsoleSocketBase.broadcast(json.dumps({'seq': seq}))
+            self.assertEqual([{'seq': FakeWebSocket.max_queued_messages + 9}], fast_client.drain())
+            self.assertEqual(FakeWebSocket.max_queued_messages, len(client.drain()))
+            # Skipped updates are replaced with one message
+            self.assertEqual([{'resync': True}], client.drain())
+            WebConsoleSocketBase.broadcast('{"seq": 100}')
+            self.assertEqual([{'seq': 100}], client.drain())
+        finally:
+            client.handleClose()
+            fast_client.handleClose()
+        self.assertEqual((), WebConsoleSocketBase.clients)
+
+    def test_observer(self):
+        session = app.sessions.open(current_thread())[0]
+        observer = FakeWebSocket(f'thread={session.id}&observer')
+        try:
+            self.assertIs(session, observer.session)
+            session.input_queue.get_nowait()  # Refresh request of the connected client
+            observer.data = 'c'
+            observer.handleMessage()
+            self.assertTrue(session.input_queue.empty())
+            environ = {'REQUEST_METHOD': 'PUT', 'PATH_INFO': '/variable-filters',
+                       'QUERY_STRING': 'observer=1'}
+            setup_testing_defaults(environ)
+            statuses = []
+            app(environ, lambda status, *_: statuses.append(status))
+            self.assertEqual(['403 Forbidden'], statuses)
+        finally:
+            observer.handleClose()
+            app.sessions.remove(session)
+
+    def test_subscribed_keys(self):
+        session = app.sessions.open(current_thread())[0]
+        self.assertEqual(set(), WebConsoleSocketBase.subscribed_keys(session))
+        client = FakeWebSocket(f'thread={session.id}&keys=locals,current_line')
+        try:
+            self.assertEqual({'locals', 'current_line'},
+                             WebConsoleSocketBase.subscribed_keys(session))
+            other_client = FakeWebSocket(f'thread={session.id}')
+            other_client.handleClose()
+            self.assertEqual({'locals', 'current_line'},
+                             WebConsoleSocketBase.subscribed_keys(session))
+            other_client = FakeWebSocket(f'thread={session.id}')
+            try:
+                self.assertIsNone(WebConsoleSocketBase.subscribed_keys(session))
+            finally:
+                other_client.handleClose()
+        finally:
+            client.handleClose()
+            app.sessions.remove(session)
+
+
+class FrameDataTestCase(TestCase):
+    """
+    Test getting frame data snapshots
+    """
+    def test_building_missing_keys(self):
+        class FakeDebugger:
+            requested = []
+
+            def get_current_frame_data(self, keys):
+                self.requested.append(keys)
+                return {key: key.upper() for key in keys}
+
+        def get_frame_data(query):
+            environ = {'PATH_INFO': '/frame-data', 'QUERY_STRING': query}
+            setup_testing_defaults(environ)
+            return json.loads(b''.join(app(environ, lambda *_: None)))
+
+        def run_debugger_call():
+            session.input_queue.get(timeout=5).run(FakeDebugger())
+
+        session = app.sessions.open(current_thread())[0]
+        session.frame_data_keys = ('current_line', 'globals', 'locals')
+        session.frame_data.contents = {'seq': 1, 'current_line': 7}
+        session.awaiting_command.set()
+        try:
+            # Published keys are taken from the snapshot
+            frame_data = get_frame_data(f'thread={session.id}&keys=current_line')
+            self.assertEqual({'seq': 1, 'current_line': 7}, frame_data)
+            self.assertEqual([], FakeDebugger.requested)
+            # Only requested keys are built by the debugger
+            debugger_thread = Thread(target=run_debugger_call)
+            debugger_thread.start()
+            frame_data = get_frame_data(f'thread={session.id}&keys=current_line,locals')
+            debugger_thread.join(5)
+            self.assertEqual({'seq': 1, 'current_line': 7, 'locals': 'LOCALS'}, frame_data)
+            self.assertEqual([['locals']], FakeDebugger.requested)
+        finally:
+            session.awaiting_command.clear()
+            app.sessions.remove(session)
+
+
+class BreakpointCheckerTestCase(TestCase):
+    """
+    Test compiled breakpoint conditions and logpoints
+    """
+    def setUp(self):
+        self.output = []
+        self.checker = BreakpointChecker(self.output.append)
+        self.checker.logpoint_rate = 2
+        # The line of "return" statement in hit() method
+        self.line = self.hit.__code__.co_firstlineno + 3
+
+    def tearDown(self):
+        # Breakpoint.clearBreakpoints() is not available before Python 3.10
+        bdb.Breakpoint.next = 1
+        bdb.Breakpoint.bplist = {}
+        bdb.Breakpoint.bpbynumber = [None]
+
+    def hit(self, i):  # pylint: disable=unused-argument
+        # The frame of this method has ``i`` local variable
+        frame = sys._getframe()  # pylint: disable=protected-access
+        return self.checker.effective('spam.py', frame.f_lineno, frame)
+
+    def test_conditional_breakpoint(self):
+        bp = bdb.Breakpoint('spam.py', self.line, cond='i == 2')
+        self.assertEqual([(None, None), (None, None), (bp, True)],
+                         [self.hit(i) for i in range(3)])
+        self.assertEqual(3, bp.hits)
+        bp.cond = 'i ==='
+        self.assertEqual((bp, False), self.hit(0))
+
+    def test_logpoint(self):
+        bp = bdb.Breakpoint('spam.py', self.line)
+        bp.log_message = 'i = {i}'
+        for i in range(4):
+            self.assertEqual((None, None), self.hit(i))
+        self.assertEqual(['*** Logpoint 1: i = 0\n', '*** Logpoint 1: i = 1\n'], self.output)
+        bp.log_state = (time.monotonic() - 1, 2, 3)  # The next rate limit window
+        self.hit(4)
+        self.assertEqual('*** Logpoint 1: i = 4 (3 messages suppressed)\n', self.output[-1])
+
+    def test_log_message(self):
+        frame = sys._getframe()  # pylint: disable=protected-access
+        d = {'k': 'spam'}  # pylint: disable=unused-variable
+        w = 6  # pylint: disable=unused-variable
+        message = '{d["k"]} it\'s {d[\'k\']!r} {{eggs}} {w:>{w}} {w=} {d["k"]!s:.2}'
+        self.assertEqual("spam it's 'spam' {eggs}      6 w=6 sp",
+                         compile_log_message(message)(frame))
+        for message in ('{}', '{w!x}', '{w +}', '{w'):
+            with self.assertRaises(SyntaxError):
+                compile_log_message(message)
+
+
+class SamplingProfilerTestCase(TestCase):
+    """
+    Test aggregating stack samples
+    """
+    def test_stack_table(self):
+        profiler = SamplingProfiler()
+        frame = sys._getframe()  # pylint: disable=protected-access
+        names = {1: 'MainThread', 2: 'web-pdb-server'}
+        for _ in range(3):
+            profiler.sample({1: frame, 2: frame}, names)
+        profile = profiler.get_profile()
+        self.assertEqual(3, profile['samples'])
+        self.assertEqual(1, len(profile['stacks']))
+        count, root, *_, leaf = profile['stacks'][0]
+        self.assertEqual(3, count)
+        self.assertEqual(['MainThread', '', 0], profile['functions'][root])
+        self.assertIn('test_stack_table', profile['functions'][leaf][0])
+        profiler.max_stacks = 1
+        profiler.sample({3: frame.f_back}, names)
+        self.assertEqual(1, profiler.get_profile()['dropped'])
+        profiler.reset()
+        self.assertEqual([], profiler.get_profile()['stacks'])
+
+    def test_sampling_thread(self):
+        profiler = SamplingProfiler()
+        self.assertTrue(profiler.start(0.001))
+        self.assertFalse(profiler.start())
+        deadline = time.monotonic() + 0.2
+        while time.monotonic() < deadline:
+            pass
+        profiler.stop()
+        profile = profiler.get_profile()
+        self.assertFalse(profile['running'])
+        self.assertGreater(profile['samples'], 0)
+        self.assertNotIn('web-pdb-profiler', [name for name, _, _ in profile['functions']])
+
+
+class SnapshotWriterTestCase(TestCase):
+    """
+    Test saving exception snapshots
+    """
+    def test_save_snapshot(self):
+        with tempfile.TemporaryDirectory() as snapshots_dir:
+            writer = SnapshotWriter(snapshots_dir)
+            writer.rate_limit = 2
+            writer.max_snapshots = 1
+            spam = 'eggs'  # pylint: disable=unused-variable
+            try:
+                raise ValueError('Ham')
+            except ValueError as exc:
+                paths = [writer.save(exc, exc.__traceback__) for _ in range(3)]
+            self.assertIsNone(paths[2])
+            self.assertFalse(os.path.exists(paths[0]))
+            snapshots = list_snapshots(snapshots_dir)
+            self.assertEqual(1, len(snapshots))
+            self.assertEqual('ValueError: Ham', snapshots[0]['exception'])
+            snapshot = load_snapshot(snapshots_dir, snapshots[0]['id'])
+            frame = snapshot['frames'][0]
+            self.assertIn('test_save_snapshot', frame['name'])
+            self.assertIn(['spam', 'str', "'eggs'"], frame['locals'])
+            self.assertIsNone(load_snapshot(snapshots_dir, '../spam'))
+
+
+@skipIf(not IS_PY_312, 'sys.monitoring requires Python 3.12+')
+class BreakpointMonitorTestCase(TestCase):
+    """
+    Test watching breakpoints via sys.monitoring
+    """
+    def test_code_created_after_start(self):
+        hits = []
+
+        class FakeDebugger:
+            breaks = {'<spam>': [3]}
+
+            @staticmethod
+            def canonic(filename):
+                return filename
+
+            @staticmethod
+            def break_here(frame):  # pylint: disable=unused-argument
+                return True
+
+            @staticmethod
+            def break_at(frame):
+                hits.append(frame.f_lineno)
+
+        monitor = BreakpointMonitor(FakeDebugger())
+        self.assertTrue(monitor.start(sys._getframe()))  # pylint: disable=protected-access
+        try:
+            namespace = {}
+            code = compile('def spam():\n    ham = 1\n    return ham\n', '<spam>', 'exec')
+            exec(code, namespace)  # pylint: disable=exec-used
+            namespace['spam']()
+        finally:
+            monitor.stop()
+        self.assertEqual([3], hits)
+        self.assertFalse(monitor.active)
+
+
+@skipIf(not IS_PY_312, 'sys.monitoring requires Python 3.12+')
+class ThreadInterrupterTestCase(TestCase):
+    """
+    Test calling a function in another thread
+    """
+    def test_interrupt_thread(self):
+        frames = []
+        stop = []
+
+        def worker():
+            while not stop:
+                time.sleep(0.01)
+
+        thread = Thread(target=worker)
+        thread.start()
+        try:
+            interrupter = ThreadInterrupter(thread.ident, frames.append)
+            self.assertTrue(interrupter.start())
+            deadline = time.monotonic() + 5
+            while not frames and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            stop.append(True)
+            thread.join()
+        self.assertEqual(1, len(frames))
+        self.assertEqual('worker', frames[0].f_code.co_name)
+        self.assertFalse(interrupter.stop())
+
+
+class VariableListingTestCase(TestCase):
+    """
+    Test cached variable listings
+    """
+    def test_cached_listing(self):
+        represented = []
+
+        def get_repr(value):
+            represented.append(value)
+            return repr(value)
+
+        listing = VariableListing(get_repr)
+        namespace = {'__name__': 'spam', 'os': os, 'ham': [], 'eggs': 'eggs',
+                     'main': main, 'TestCase': TestCase}
+        names = listing.get_names(namespace, cache=True)
+        self.assertEqual(['TestCase', 'eggs', 'ham', 'main', 'os'], names)
+        self.assertIs(names, listing.get_names(namespace, cache=True))
+        self.assertEqual(['eggs', 'ham'], listing.get_names(namespace, VARIABLE_KINDS, cache=True))
+        for _ in range(2):
+            for name in names:
+                listing.get_repr(namespace[name])
+        # Only the mutable list is represented again
+        self.assertEqual(6, len(represented))
+        namespace['eggs'] = 'spam'
+        namespace['bacon'] = 'bacon'
+        self.assertEqual('bacon', listing.get_names(namespace, cache=True)[1])
+        self.assertEqual("'spam'", listing.get_repr(namespace['eggs']))
+
+
+class StartupTestCase(TestCase):
+    """
+    Test lazy imports and preloading of static files
+    """
+    def test_lazy_import(self):
+        code = ('import sys, web_pdb; '
+                'web_pdb._get_snapshots_dir(); '
+                'print([m for m in ("bottle", "asyncio", "web_pdb.web_console", '
+                '"web_pdb.snapshots") if m in sys.modules])')
+        process = run([sys.executable, '-c', code], cwd=str(CWD.parent), capture_output=True,
+                      text=True, check=True)
+        self.assertEqual('[]', process.stdout.strip())
+
+    def test_static_files(self):
+        static_file = app.get_static_file('bundle.min.js')
+        self.assertTrue(static_file['content_type'].endswith('charset=utf-8'))
+        self.assertEqual(static_file['body'], gzip.decompress(static_file['gzip_body']))
+        self.assertIs(static_file, app.get_static_file('bundle.min.js'))
+        self.assertIsNone(app.get_static_file('../__init__.py'))
+
+
 if __name__ == '__main__':
     main()
@@ -24,31 +24,63 @@
 A web-interface for Python's built-in PDB debugger
 """
 
+import bdb
 import inspect
 import os
 import random
+import signal
 import sys
+import threading
 import traceback
+from bdb import BdbQuit
 from contextlib import contextmanager
+from itertools import islice
 from pdb import Pdb
-from pprint import pformat
+from threading import RLock, current_thread
 
-from .web_console import WebConsole
+from .breakpoints import (BreakpointChecker, compile_condition, compile_log_message,
+                          get_breakpoint_info)
+from .monitoring import BreakpointMonitor, ThreadInterrupter
+from .reprs import (SafeRepr, NotEvaluated, get_child, get_children, count_children,
+                    is_expandable, get_members, evaluate_member)
+from .summarizers import register_summarizer
+from .variables import VARIABLE_KINDS, VariableListing
 
-__all__ = ['WebPdb', 'set_trace', 'post_mortem', 'catch_post_mortem']
+__all__ = ['WebPdb', 'set_trace', 'post_mortem', 'catch_post_mortem', 'save_snapshot',
+           'install_signal_handler', 'register_summarizer']
 
 
-class WebPdb(Pdb):
+class _ActiveInstance:  # pylint: disable=too-few-public-methods
+    """
+    ``WebPdb.active_instance`` attribute kept for backward compatibility
+
+    It returns the active debugger instance of the current thread.
+    """
+    def __get__(self, instance, owner):
+        return owner.get_active_instance()
+
+
+class WebPdb(Pdb):  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """
     The main debugger class
 
     It provides a web-interface for Python's built-in PDB debugger
     with extra convenience features.
+
+    Each thread is debugged by its own instance, and sessions
+    of different threads are available via the same web-UI.
     """
-    active_instance = None
+    active_instances = {}  # Thread objects are keys because thread IDs are reused
+    active_instance = _ActiveInstance()
     null = object()
-
-    def __init__(self, host='', port=5555, patch_stdstreams=False):
+    frame_data_keys = ('dirname', 'filename', 'file_hash', 'current_line',
+                       'breakpoints', 'logpoints', 'globals', 'locals', 'hidden_variables')
+    repr_engine = SafeRepr()
+    variables_max_size = 100 * 1024
+    hidden_variables = frozenset(VARIABLE_KINDS)
+    inspect_page_size = 50
+
+    def __init__(self, host='', port=5555, patch_stdstreams=False, persistent=False):
         """
         :param host: web-UI hostname or IP-address
         :type host: str
@@ -58,11 +90,25 @@ class WebPdb(Pdb):
         :param patch_stdstreams: redirect all standard input and output
             streams to the web-UI.
         :type patch_stdstreams: bool
+        :param persistent: keep the web-UI server running with its
+            connected clients after the debugging session is finished
+            so that subsequent sessions attach to it.
+        :type persistent: bool
         """
         if port == -1:
             random.seed()
             port = random.randint(32768, 65536)
-        self.console = WebConsole(host, port, self)
+        self._monitor = BreakpointMonitor(self)
+        self._resume_tracing = False
+        self._frame_data_lock = RLock()
+        self._frame_data_cache = {}
+        self._variable_listing = VariableListing(self._get_repr)
+        self._thread = current_thread()
+        # The web-server stack is imported only when the debugger is started
+        # so that importing web_pdb does not slow down the program
+        from .web_console import WebConsole  # pylint: disable=import-outside-toplevel
+        self.console = WebConsole(host, port, self, persistent)
+        self._breakpoint_checker = BreakpointChecker(self.console.writeline)
         super().__init__(stdin=self.console, stdout=self.console)
         # Borrowed from here: https://github.com/ionelmc/python-remote-pdb
         self._backup = []
@@ -77,50 +123,131 @@ class WebPdb(Pdb):
             ):
                 self._backup.append((name, getattr(sys, name)))
                 setattr(sys, name, self.console)
-        WebPdb.active_instance = self
+        WebPdb.active_instances[self._thread] = self
+
+    @classmethod
+    def get_active_instance(cls):
+        """
+        Get the active debugger instance of the current thread
+
+        :return: a debugger instance or ``None``
+        :rtype: WebPdb
+        """
+        # Threads watched by breakpoint monitors may finish
+        # while the debugger is detached
+        for thread, instance in list(cls.active_instances.items()):
+            if not thread.is_alive():
+                instance._release()  # pylint: disable=protected-access
+        return cls.active_instances.get(current_thread())
+
+    def _release(self):
+        """
+        Finish the debugging session of the instance
+
+        Breakpoints are no longer monitored, patched standard streams
+        are restored and the web-console is closed, so the web-server
+        is stopped unless it is persistent or used by other sessions.
+        """
+        self._monitor.stop()
+        for name, fh in self._backup:
+            setattr(sys, name, fh)
+        self._backup = []
+        if not self.console.closed:
+            self.console.close()
+        if WebPdb.active_instances.get(self._thread) is self:
+            del WebPdb.active_instances[self._thread]
 
     def do_quit(self, arg):
         """
         quit || exit || q
         Stop and quit the current debugging session
         """
-        for name, fh in self._backup:
-            setattr(sys, name, fh)
         self.console.writeline('*** Aborting program ***\n')
-        self.console.flush()
-        self.console.close()
-        WebPdb.active_instance = None
+        self._release()
         return super().do_quit(arg)
 
     do_q = do_exit = do_quit
 
     def do_inspect(self, arg):
         """
-        i(nspect) object
+        i(nspect) [-e] object [page]
         Inspect an object
+
+        Properties and other descriptors are not evaluated
+        unless -e option is given. Members are listed in pages
+        of :attr:`inspect_page_size` items.
         """
-        if arg in self.curframe_locals:
-            obj = self.curframe_locals[arg]
-        elif arg in self.curframe.f_globals:
-            obj = self.curframe.f_globals[arg]
+        args = arg.split()
+        evaluate = bool(args) and args[0] == '-e'
+        if evaluate:
+            args = args[1:]
+        try:
+            name = args[0]
+            page = int(args[1]) if len(args) > 1 else 1
+        except (IndexError, ValueError):
+            self.console.writeline('Usage: inspect [-e] object [page]\n')
+            return
+        if name in self.curframe_locals:
+            obj = self.curframe_locals[name]
+        elif name in self.curframe.f_globals:
+            obj = self.curframe.f_globals[name]
         else:
             obj = WebPdb.null
         if obj is not WebPdb.null:
-            self.console.writeline(f'{arg} = {type(obj)}:\n')
-            for name, value in inspect.getmembers(obj):
-                if not (name.startswith('__') and (name.endswith('__'))):
-                    repr_value = self._get_repr(value, pretty=True, indent=8)
-                    self.console.writeline(f'    {name}: {repr_value}\n')
+            members = get_members(obj)
+            pages = max((len(members) - 1) // self.inspect_page_size + 1, 1)
+            page = min(max(page, 1), pages)
+            start = (page - 1) * self.inspect_page_size
+            lines = [f'{name} = {type(obj)}:\n']
+            for member, value in members[start:start + self.inspect_page_size]:
+                if evaluate and isinstance(value, NotEvaluated):
+                    value = evaluate_member(obj, member)
+                repr_value = self._get_repr(value, pretty=True, indent=8)
+                lines.append(f'    {member}: {repr_value}\n')
+            if page < pages:
+                option = '-e ' if evaluate else ''
+                lines.append(f'*** Page {page} of {pages}, '
+                             f'enter "i {option}{name} {page + 1}" for the next page\n')
+            self.console.writeline(''.join(lines))
         else:
-            self.console.writeline(f'NameError: name "{arg}" is not defined\n')
+            self.console.writeline(f'NameError: name "{name}" is not defined\n')
         self.console.flush()
 
     do_i = do_inspect
 
-    @staticmethod
-    def _get_repr(obj, pretty=False, indent=1):
+    def do_logpoint(self, arg):
+        """
+        lp(logpoint) [[filename:]lineno message]
+        Set a logpoint or list logpoints if no arguments are given
+
+        A logpoint does not stop the program but writes the message
+        to the console each time the line is executed. Expressions
+        in curly braces are evaluated like in f-strings,
+        e.g. "lp 42 i = {i}, total = {total!r}". Logpoints are
+        numbered, cleared, disabled and enabled like breakpoints.
         """
-        Get string representation of an object
+        location, _, message = arg.strip().partition(' ')
+        if not location:
+            lines = [f'{bp.number}: {bp.file}:{bp.line}: {bp.log_message} (hits: {bp.hits})\n'
+                     for bp in bdb.Breakpoint.bpbynumber
+                     if bp is not None and getattr(bp, 'log_message', None) is not None]
+            self.console.writeline(''.join(lines) or 'No logpoints\n')
+            return
+        filename, _, lineno = location.rpartition(':')
+        if filename:
+            filename = self.lookupmodule(filename) or filename
+        try:
+            bp = self.set_breakpoint(filename, int(lineno), log_message=message.strip())
+        except ValueError as exc:
+            self.console.writeline(f'*** {exc}\n')
+        else:
+            self.console.writeline(f'Logpoint {bp.number} at {bp.file}:{bp.line}\n')
+
+    do_lp = do_logpoint
+
+    def _get_repr(self, obj, pretty=False, indent=1):
+        """
+        Get size-limited string representation of an object
 
         :param obj: object
         :type obj: object
@@ -132,86 +259,405 @@ class WebPdb(Pdb):
         :rtype: str
         """
         if pretty:
-            repr_value = pformat(obj, indent)
-        else:
-            repr_value = repr(obj)
-        return repr_value
+            return self.repr_engine.pformat(obj, indent)
+        return self.repr_engine.repr(obj)
+
+    def _iter_reprs(self, items):
+        """
+        Get representations of values within :attr:`variables_max_size` budget
+
+        Values that do not fit into the budget are shown as ``...``.
+
+        :param items: an iterable of ``(name, value)`` pairs
+        :return: an iterator of ``(name, value, repr_value)`` tuples
+        """
+        budget = self.variables_max_size
+        for name, value in items:
+            if budget > 0:
+                repr_value = self._variable_listing.get_repr(value)
+                budget -= len(name) + len(repr_value)
+            else:
+                repr_value = '...'
+            yield name, value, repr_value
+
+    def break_here(self, frame):
+        """
+        Check if there is an effective breakpoint for the current line
+
+        Unlike the parent's method, breakpoint conditions are evaluated
+        from compiled code and logpoints write their messages
+        without stopping the program.
+        """
+        filename = self.canonic(frame.f_code.co_filename)
+        lines = self.breaks.get(filename)
+        if not lines:
+            return False
+        lineno = frame.f_lineno
+        if lineno not in lines:
+            # The first line of a function with a breakpoint set by function name
+            lineno = frame.f_code.co_firstlineno
+            if lineno not in lines:
+                return False
+        bp, flag = self._breakpoint_checker.effective(filename, lineno, frame)
+        if bp is None:
+            return False
+        self.currentbp = bp.number  # pylint: disable=attribute-defined-outside-init
+        if flag and bp.temporary:
+            self.do_clear(str(bp.number))
+        return True
+
+    def set_breakpoint(self, filename, lineno, cond=None, log_message=None):
+        """
+        Set a breakpoint or a logpoint
+
+        :param filename: a file name. If empty, the current file is used.
+        :type filename: str
+        :param lineno: line number
+        :type lineno: int
+        :param cond: a breakpoint condition
+        :type cond: str
+        :param log_message: a logpoint message. If set, the breakpoint
+            does not stop the program but writes the message to the console.
+        :type log_message: str
+        :return: a new breakpoint
+        :rtype: bdb.Breakpoint
+        :raises ValueError: if the breakpoint cannot be set
+        """
+        try:
+            if cond:
+                compile_condition(cond)
+            if log_message is not None:
+                compile_log_message(log_message)
+        except SyntaxError as exc:
+            raise ValueError(f'Invalid expression: {exc}') from exc
+        filename = self.canonic(filename or self.curframe.f_code.co_filename)
+        error = self.set_break(filename, lineno, cond=cond or None)
+        if error:
+            raise ValueError(error)
+        bp = self.get_breaks(filename, lineno)[-1]
+        bp.log_message = log_message
+        self.invalidate_frame_data('breakpoints', 'logpoints')
+        return bp
+
+    @staticmethod
+    def _get_breakpoint(number):
+        try:
+            return bdb.Breakpoint.bpbynumber[number] or None
+        except IndexError:
+            return None
+
+    def get_breakpoints(self):
+        """
+        Get properties of all breakpoints and logpoints
+
+        :rtype: list
+        """
+        return [get_breakpoint_info(bp) for bp in bdb.Breakpoint.bpbynumber if bp is not None]
+
+    def update_breakpoint(self, number, changes):
+        """
+        Change breakpoint properties via the web-UI
+
+        :param number: breakpoint number
+        :type number: int
+        :param changes: new values of ``enabled``, ``cond`` and/or ``log`` properties
+        :type changes: dict
+        :return: updated breakpoint properties
+        :rtype: dict
+        :raises KeyError: if the breakpoint does not exist
+        :raises ValueError: if new properties are invalid
+        """
+        bp = self._get_breakpoint(number)
+        if bp is None:
+            raise KeyError(number)
+        try:
+            if changes.get('cond'):
+                compile_condition(changes['cond'])
+            if changes.get('log') is not None:
+                compile_log_message(changes['log'])
+        except SyntaxError as exc:
+            raise ValueError(f'Invalid expression: {exc}') from exc
+        if 'enabled' in changes:
+            if changes['enabled']:
+                bp.enable()
+            else:
+                bp.disable()
+        if 'cond' in changes:
+            bp.cond = changes['cond'] or None
+        if 'log' in changes:
+            bp.log_message = changes['log']
+        self.invalidate_frame_data('breakpoints', 'logpoints')
+        return get_breakpoint_info(bp)
+
+    def remove_breakpoint(self, number):
+        """
+        Clear a breakpoint via the web-UI
+
+        :param number: breakpoint number
+        :type number: int
+        :raises KeyError: if the breakpoint does not exist
+        """
+        bp = self._get_breakpoint(number)
+        if bp is None:
+            raise KeyError(number)
+        self.clear_bpbynumber(number)
+        self.invalidate_frame_data('breakpoints', 'logpoints')
+
+    def setup(self, f, tb):
+        self.invalidate_frame_data()
+        return super().setup(f, tb)
+
+    def postcmd(self, stop, line):
+        self.invalidate_frame_data()
+        return super().postcmd(stop, line)
 
     def set_continue(self):
-        # We do not detach the debugger
-        # for correct multiple set_trace() and post_mortem() calls.
+        if not self.breaks:
+            # No breakpoints: run without debugger overhead.
+            # Only tracing is removed: the web-console, the session and
+            # the patched std streams are kept for subsequent set_trace() calls.
+            self._resume_tracing = False
+            super().set_continue()
+            return
         self._set_stopinfo(self.botframe, None, -1)
+        frame = sys._getframe().f_back  # pylint: disable=protected-access
+        if self._monitor.start(frame):
+            # Only code objects with breakpoints are watched via sys.monitoring
+            self._resume_tracing = False
+            sys.settrace(None)
+            while frame and frame is not self.botframe:
+                del frame.f_trace
+                frame = frame.f_back
+
+    def break_at(self, frame):
+        """
+        Stop at a breakpoint hit while the debugger was detached
+
+        Tracing is resumed from the provided frame so that stepping
+        commands work as usual.
+
+        :param frame: a frame that has hit a breakpoint
+        :type frame: types.FrameType
+        """
+        self._resume_tracing = True
+        back_frame = frame
+        while back_frame is not None:
+            back_frame.f_trace = self.trace_dispatch
+            back_frame = back_frame.f_back
+        self.user_line(frame)
+        if self.quitting:
+            raise BdbQuit
+        if self._resume_tracing:
+            sys.settrace(self.trace_dispatch)
 
     def dispatch_return(self, frame, arg):
         # The parent's method needs to be called first.
         ret = super().dispatch_return(frame, arg)
-        if frame.f_back is None:
+        if frame.f_back is None and not self.console.closed:
             self.console.writeline('*** Thread finished ***\n')
-            if not self.console.closed:
-                self.console.flush()
-                self.console.close()
-                WebPdb.active_instance = None
+            self._release()
         return ret
 
-    def get_current_frame_data(self):
+    def invalidate_frame_data(self, *keys):
+        """
+        Discard cached frame data
+
+        Frame data is cached until the debugger stops at a new location
+        or executes a command that may change the program state.
+
+        :param keys: frame data keys to discard. If omitted, all keys are discarded.
+        """
+        with self._frame_data_lock:
+            if keys:
+                for key in keys:
+                    self._frame_data_cache.pop(key, None)
+            else:
+                self._frame_data_cache = {}
+
+    def get_current_frame_data(self, keys=None):
         """
         Get all date about the current execution frame
 
+        Frame data are built lazily and only for the requested keys.
+
+        :param keys: frame data keys to get. If ``None``, all the keys
+            from :attr:`frame_data_keys` are returned.
+        :type keys: collections.abc.Iterable
         :return: current frame data
         :rtype: dict
         :raises AttributeError: if the debugger does hold any execution frame.
         :raises IOError: if source code for the current execution frame is not accessible.
         """
+        if keys is None:
+            keys = self.frame_data_keys
+        with self._frame_data_lock:
+            for key in keys:
+                if key not in self._frame_data_cache:
+                    self._frame_data_cache[key] = getattr(self, f'_get_frame_{key}')()
+            return {key: self._frame_data_cache[key] for key in keys}
+
+    def _get_frame_dirname(self):
         filename = self.curframe.f_code.co_filename
-        lines, _ = inspect.findsource(self.curframe)
-        return {
-            'dirname': os.path.dirname(os.path.abspath(filename)) + os.path.sep,
-            'filename': os.path.basename(filename),
-            'file_listing': ''.join(lines),
-            'current_line': self.curframe.f_lineno,
-            'breakpoints': self.get_file_breaks(filename),
-            'globals': self.get_globals(),
-            'locals': self.get_locals()
-        }
-
-    def _format_variables(self, raw_vars):
-        """
-        :param raw_vars: a `dict` of `var_name: var_object` pairs
-        :type raw_vars: dict
+        return os.path.dirname(os.path.abspath(filename)) + os.path.sep
+
+    def _get_frame_filename(self):
+        return os.path.basename(self.curframe.f_code.co_filename)
+
+    def _get_frame_file_hash(self):
+        frame = self.curframe
+        return self.console.source_cache.add(
+            frame.f_code.co_filename, lambda: inspect.findsource(frame)[0])
+
+    def _get_frame_current_line(self):
+        return self.curframe.f_lineno
+
+    def _get_frame_points(self, logpoints):
+        filename = self.canonic(self.curframe.f_code.co_filename)
+        return sorted({line for line in self.breaks.get(filename, ())
+                       if any((getattr(bp, 'log_message', None) is not None) == logpoints
+                              for bp in self.get_breaks(filename, line))})
+
+    def _get_frame_breakpoints(self):
+        return self._get_frame_points(logpoints=False)
+
+    def _get_frame_logpoints(self):
+        return self._get_frame_points(logpoints=True)
+
+    def _get_frame_globals(self):
+        return self._get_variables('globals')
+
+    def _get_frame_locals(self):
+        return self._get_variables('locals')
+
+    def _get_frame_hidden_variables(self):
+        return sorted(self.hidden_variables)
+
+    def set_hidden_variables(self, kinds):
+        """
+        Set kinds of variables that are hidden in Globals and Locals listings
+
+        :param kinds: variable kinds, see :data:`web_pdb.variables.VARIABLE_KINDS`
+        :type kinds: collections.abc.Iterable
+        :return: sorted hidden variable kinds
+        :rtype: list
+        :raises ValueError: if a variable kind is invalid
+        """
+        kinds = frozenset(kinds)
+        invalid = kinds.difference(VARIABLE_KINDS)
+        if invalid:
+            raise ValueError(f'Invalid variable kinds: {", ".join(sorted(invalid))}')
+        self.hidden_variables = kinds
+        self.invalidate_frame_data('globals', 'locals', 'hidden_variables')
+        return sorted(kinds)
+
+    def _get_namespace(self, scope):
+        if scope == 'globals':
+            return self.curframe.f_globals
+        return self.curframe_locals
+
+    def _get_variable_names(self, scope):
+        """
+        Get sorted names of variables shown in a scope
+
+        Special ``__dunder__`` variables and kinds of variables
+        from :attr:`hidden_variables` are not included.
+        """
+        # Sorted names are cached only for module globals that live long
+        return self._variable_listing.get_names(self._get_namespace(scope),
+                                                self.hidden_variables, cache=scope == 'globals')
+
+    def _get_variables(self, scope):
+        """
+        :param scope: ``'globals'`` or ``'locals'``
+        :type scope: str
+        :return: a `dict` of `var_name: var_repr` pairs
+        :rtype: dict
+        """
+        raw_vars = self._get_namespace(scope)
+        items = ((var, raw_vars[var]) for var in self._get_variable_names(scope))
+        return {var: repr_value for var, _, repr_value in self._iter_reprs(items)}
+
+    def get_variable(self, scope, path, offset=0, limit=100):
+        """
+        Get a variable from the current frame with a page of its children
+
+        :param scope: ``'globals'`` or ``'locals'``
+        :type scope: str
+        :param path: a variable name followed by positions of nested
+            children as yielded by :func:`web_pdb.reprs.get_children`.
+            An empty path means the scope itself.
+        :type path: list
+        :param offset: the position of the first child to return
+        :type offset: int
+        :param limit: the max number of children to return
+        :type limit: int
+        :return: variable info with ``children`` list
+        :rtype: dict
+        :raises KeyError: if a variable does not exist
+        :raises IndexError: if a child does not exist
+        """
+        raw_vars = self._get_namespace(scope)
+        if path:
+            obj = raw_vars[path[0]]
+            for index in path[1:]:
+                obj = get_child(obj, index)
+            info = {
+                'type': type(obj).__name__,
+                'repr': self._get_repr(obj),
+                'length': count_children(obj),
+            }
+            children = islice(get_children(obj), offset, offset + limit)
+        else:
+            names = self._get_variable_names(scope)
+            info = {'type': scope, 'repr': '', 'length': len(names)}
+            children = ((var, raw_vars[var]) for var in names[offset:offset + limit])
+        info.update(path=path, offset=offset, children=[
+            {
+                'key': key,
+                'type': type(value).__name__,
+                'repr': repr_value,
+                'expandable': is_expandable(value),
+            }
+            for key, value, repr_value in self._iter_reprs(children)
+        ])
+        return info
+
+    def _format_variables(self, scope):
+        """
+        :param scope: ``'globals'`` or ``'locals'``
+        :type scope: str
         :return: sorted list of variables as a unicode string
         :rtype: unicode
         """
-        f_vars = []
-        for var, value in raw_vars.items():
-            if not (var.startswith('__') and var.endswith('__')):
-                repr_value = self._get_repr(value)
-                f_vars.append(f'{var} = {repr_value}')
-        return '\n'.join(sorted(f_vars))
+        return '\n'.join(f'{var} = {repr_value}'
+                         for var, repr_value in self._get_variables(scope).items())
 
     def get_globals(self):
         """
         Get the listing of global variables in the current scope
 
         .. note:: special variables that start and end with
-            double underscores ``__`` are not included.
+            double underscores ``__`` and kinds of variables
+            from :attr:`hidden_variables` are not included.
 
         :return: a listing of ``var = value`` pairs sorted alphabetically
         :rtype: unicode
         """
-        return self._format_variables(self.curframe.f_globals)
+        return self._format_variables('globals')
 
     def get_locals(self):
         """
         Get the listing of local variables in the current scope
 
         .. note:: special variables that start and end with
-            double underscores ``__`` are not included.
+            double underscores ``__`` and kinds of variables
+            from :attr:`hidden_variables` are not included.
             For module scope globals and locals listings are the same.
 
         :return: a listing of ``var = value`` pairs sorted alphabetically
         :rtype: unicode
         """
-        return self._format_variables(self.curframe_locals)
+        return self._format_variables('locals')
 
     def remove_trace(self, frame=None):
         """
@@ -221,6 +667,7 @@ class WebPdb(Pdb):
         :type frame: types.FrameType
         """
         sys.settrace(None)
+        self._monitor.stop()
         if frame is None:
             frame = self.curframe
         while frame and frame is not self.botframe:
@@ -228,7 +675,7 @@ class WebPdb(Pdb):
             frame = frame.f_back
 
 
-def set_trace(host='', port=5555, patch_stdstreams=False):
+def set_trace(host='', port=5555, patch_stdstreams=False, persistent=False):
     """
     Start the debugger
 
@@ -250,23 +697,36 @@ def set_trace(host='', port=5555, patch_stdstreams=False):
     :param patch_stdstreams: redirect all standard input and output
         streams to the web-UI.
     :type patch_stdstreams: bool
+    :param persistent: keep the web-UI server running with its
+        connected clients after the debugging session is finished
+        so that subsequent sessions attach to it.
+    :type persistent: bool
     """
-    pdb = WebPdb.active_instance
+    frame = sys._getframe().f_back  # pylint: disable=protected-access
+    _set_trace(frame, host, port, patch_stdstreams, persistent)
+
+
+def _set_trace(frame, host, port, patch_stdstreams, persistent):
+    pdb = WebPdb.get_active_instance()
     if pdb is None:
-        pdb = WebPdb(host, port, patch_stdstreams)
+        pdb = WebPdb(host, port, patch_stdstreams, persistent)
     else:
         # If the debugger is still attached reset trace to a new location
         pdb.remove_trace()
-    pdb.set_trace(sys._getframe().f_back)  # pylint: disable=protected-access
+    pdb.set_trace(frame)
 
 
-def post_mortem(tb=None, host='', port=5555, patch_stdstreams=False):
+def post_mortem(tb=None, host='', port=5555, patch_stdstreams=False, persistent=False):
     """
     Start post-mortem debugging for the provided traceback object
 
     If no traceback is provided the debugger tries to obtain a traceback
     for the last unhandled exception.
 
+    If ``WEB_PDB_SNAPSHOTS_DIR`` environment variable is set, a snapshot
+    of the exception is saved to that directory instead
+    (see :func:`save_snapshot`) and the program continues.
+
     Example::
 
         try:
@@ -285,6 +745,10 @@ def post_mortem(tb=None, host='', port=5555, patch_stdstreams=False):
     :param patch_stdstreams: redirect all standard input and output
         streams to the web-UI.
     :type patch_stdstreams: bool
+    :param persistent: keep the web-UI server running with its
+        connected clients after the debugging session is finished
+        so that subsequent sessions attach to it.
+    :type persistent: bool
     :raises ValueError: if no valid traceback is provided and the Python
         interpreter is not handling any exception
     """
@@ -295,13 +759,20 @@ def post_mortem(tb=None, host='', port=5555, patch_stdstreams=False):
         t, v, tb = sys.exc_info()
         exc_data = traceback.format_exception(t, v, tb)
     else:
+        v = None
         exc_data = traceback.format_tb(tb)
     if tb is None:
         raise ValueError('A valid traceback must be passed if no '
                          'exception is being handled')
-    pdb = WebPdb.active_instance
+    snapshots_dir = _get_snapshots_dir()
+    if snapshots_dir:
+        # pylint: disable=import-outside-toplevel
+        from .snapshots import SnapshotWriter
+        SnapshotWriter.get_instance(snapshots_dir).save(v, tb)
+        return
+    pdb = WebPdb.get_active_instance()
     if pdb is None:
-        pdb = WebPdb(host, port, patch_stdstreams)
+        pdb = WebPdb(host, port, patch_stdstreams, persistent)
     else:
         pdb.remove_trace()
     pdb.console.writeline('*** Web-PDB post-mortem ***\n')
@@ -310,14 +781,66 @@ def post_mortem(tb=None, host='', port=5555, patch_stdstreams=False):
     pdb.interaction(None, tb)
 
 
+def save_snapshot(exc=None, snapshots_dir=None):
+    """
+    Save a snapshot of an exception for offline browsing
+
+    Unlike :func:`post_mortem` this function does not wait for a debugger
+    connection. It captures the frames of the exception traceback with source code
+    around the current lines and size-limited representations of local and global
+    variables, saves them to the snapshots directory and returns immediately.
+    Snapshot capture time and the number of saved snapshots per minute are limited.
+    Saved snapshots can be browsed with ``python -m web_pdb.snapshot_viewer`` command.
+
+    Example::
+
+        try:
+            # Some error-prone code
+            assert ham == spam
+        except AssertionError:
+            web_pdb.save_snapshot(snapshots_dir='/var/tmp/snapshots')
+
+    :param exc: an exception, defaults to the exception that is being handled
+    :type exc: BaseException
+    :param snapshots_dir: the snapshots directory, defaults to
+        ``WEB_PDB_SNAPSHOTS_DIR`` environment variable
+    :type snapshots_dir: str
+    :return: the path of the saved snapshot or ``None`` if the snapshot
+        has been dropped
+    :rtype: str
+    :raises ValueError: if no snapshots directory or exception is provided
+    """
+    snapshots_dir = _get_snapshots_dir(snapshots_dir)
+    if not snapshots_dir:
+        raise ValueError('The snapshots directory is not set')
+    exc = exc or sys.exc_info()[1]
+    if exc is None:
+        raise ValueError('An exception must be passed if no exception is being handled')
+    from .snapshots import SnapshotWriter  # pylint: disable=import-outside-toplevel
+    return SnapshotWriter.get_instance(snapshots_dir).save(exc, exc.__traceback__)
+
+
+def _get_snapshots_dir(snapshots_dir=None):
+    # The same variable as snapshots.SNAPSHOTS_DIR_ENV. The module is not imported
+    # here, so it is loaded only when a snapshot is saved.
+    return snapshots_dir or os.environ.get('WEB_PDB_SNAPSHOTS_DIR')
+
+
 @contextmanager
-def catch_post_mortem(host='', port=5555, patch_stdstreams=False):
+def catch_post_mortem(host='', port=5555, patch_stdstreams=False, persistent=False,
+                      snapshots_dir=None):
     """
     A context manager for tracking potentially error-prone code
 
     If an unhandled exception is raised inside context manager's code block,
     the post-mortem debugger is started automatically.
 
+    In production, pass ``snapshots_dir`` argument or set
+    ``WEB_PDB_SNAPSHOTS_DIR`` environment variable: instead of starting
+    the debugger that waits for a connection, a snapshot of the exception
+    is saved to that directory (see :func:`save_snapshot`)
+    and the program continues after the code block.
+
     Example::
 
         with web_pdb.catch_post_mortem()
@@ -332,8 +855,80 @@ def catch_post_mortem(host='', port=5555, patch_stdstreams=False):
     :param patch_stdstreams: redirect all standard input and output
         streams to the web-UI.
     :type patch_stdstreams: bool
+    :param persistent: keep the web-UI server running with its
+        connected clients after the debugging session is finished
+        so that subsequent sessions attach to it.
+    :type persistent: bool
+    :param snapshots_dir: save exception snapshots to this directory
+        instead of starting the debugger
+    :type snapshots_dir: str
     """
     try:
         yield
     except Exception:  # pylint: disable=broad-except
-        post_mortem(None, host, port, patch_stdstreams)
+        if _get_snapshots_dir(snapshots_dir):
+            save_snapshot(None, snapshots_dir)
+        else:
+            post_mortem(None, host, port, patch_stdstreams, persistent)
+
+
+def install_signal_handler(signum, host='', port=5555, thread=None, persistent=False):
+    """
+    Start the debugger when the process receives a signal
+
+    Until the signal arrives the debugger adds no overhead: no web-server
+    is started and no trace function is set. When the signal arrives,
+    the web-server is started and the program is stopped at the line
+    that the main thread was executing. This allows to debug a running process
+    that does not have a hardcoded :func:`set_trace` call.
+
+    Example::
+
+        import signal
+        import web_pdb
+
+        web_pdb.install_signal_handler(signal.SIGUSR1, port=5555)
+
+    and then::
+
+        kill -USR1 <PID>
+
+    If ``thread`` is provided, the chosen thread is stopped instead of
+    the main thread when it runs its next line of Python code.
+    Stopping other threads requires Python 3.12+.
+
+    This function must be called from the main thread.
+
+    :param signum: signal number, e.g. ``signal.SIGUSR1``
+    :type signum: int
+    :param host: web-UI hostname or IP-address
+    :type host: str
+    :param port: web-UI port. If ``port=-1``, choose a random port value
+        between 32768 and 65536.
+    :type port: int
+    :param thread: the name or the ID of the thread to stop
+    :type thread: str or int
+    :param persistent: keep the web-UI server running with its
+        connected clients after the debugging session is finished
+        so that subsequent sessions attach to it.
+    :type persistent: bool
+    :return: the previous signal handler
+    """
+    def start_debugger(frame):
+        try:
+            _set_trace(frame, host, port, False, persistent)
+        except Exception:  # pylint: disable=broad-except
+            import logging  # pylint: disable=import-outside-toplevel
+            logging.exception('Web-PDB: unable to start the debugger')
+
+    def handle_signal(signum, frame):  # pylint: disable=unused-argument
+        if thread is None:
+            start_debugger(frame)
+            return
+        thread_id = next((t.ident for t in threading.enumerate()
+                          if thread in (t.name, t.ident)), None)
+        if thread_id is None or not ThreadInterrupter(thread_id, start_debugger).start():
+            import logging  # pylint: disable=import-outside-toplevel
+            logging.critical('Web-PDB: unable to stop thread %s', thread)
+
+    return signal.signal(signum, handle_signal)
@@ -0,0 +1,486 @@
+# Author: Roman Miroshnychenko aka Roman V.M.
+# E-mail: roman1972@gmail.com
+#
+# Copyright (c) 2016 Roman Miroshnychenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Self-contained asyncio-based WSGI server with WebSocket support
+
+HTTP requests and WebSocket connections are served concurrently
+on one event loop thread. WSGI applications are called in a pool
+of worker threads so a slow request does not block other connections.
+"""
+
+import asyncio
+import base64
+import hashlib
+import io
+import logging
+import struct
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+from urllib.parse import unquote
+
+__all__ = ['AsyncioWsgiServer', 'AsyncioWebSocketHandler', 'make_text_frame']
+
+logger = logging.getLogger(__name__)
+
+WS_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xa
+CLOSE_PROTOCOL_ERROR = 1002
+
+
+class HttpError(Exception):
+    """Malformed HTTP request"""
+
+
+class ProtocolError(Exception):
+    """WebSocket protocol violation"""
+
+
+def _make_frame(opcode, payload):
+    header = bytes([0x80 | opcode])
+    length = len(payload)
+    if length < 126:
+        header += bytes([length])
+    elif length < 65536:
+        header += bytes([126]) + struct.pack('>H', length)
+    else:
+        header += bytes([127]) + struct.pack('>Q', length)
+    return header + payload
+
+
+def make_text_frame(data):
+    """
+    Encode a text message as a WebSocket frame
+
+    :param data: message text
+    :type data: str
+    :rtype: bytes
+    """
+    return _make_frame(OP_TEXT, data.encode('utf-8'))
+
+
+def _unmask(payload, mask):
+    # XOR-ing as big integers is much faster than byte by byte
+    length = len(payload)
+    key = (mask * (length // 4 + 1))[:length]
+    return (int.from_bytes(payload, 'big') ^ int.from_bytes(key, 'big')).to_bytes(length, 'big')
+
+
+class AsyncioWebSocketHandler:  # pylint: disable=too-many-instance-attributes
+    """
+    WebSocket connection handler
+
+    The interface is compatible with WebSocket handlers
+    of ``asyncore-wsgi`` package: subclasses override
+    :meth:`handleConnected`, :meth:`handleMessage` and :meth:`handleClose`
+    and the received message is available as :attr:`data`.
+    :attr:`query` holds the query string of the WebSocket request.
+    """
+    max_message_size = 16 * 1024 * 1024
+
+    def __init__(self, server, reader, writer):
+        self.server = server
+        self.data = None
+        self.query = ''
+        self.handshaked = False
+        self._reader = reader
+        self._writer = writer
+        self._loop = asyncio.get_event_loop()
+        self._send_queue = asyncio.Queue()
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+
+    @property
+    def sendq(self):
+        """The number of messages that are not sent yet"""
+        with self._pending_lock:
+            return self._pending
+
+    def handleConnected(self):
+        pass
+
+    def handleMessage(self):
+        pass
+
+    def handleClose(self):
+        pass
+
+    def handleSent(self):
+        """Called when all queued messages have been sent"""
+
+    @staticmethod
+    def prepareMessage(data):
+        """
+        Encode a text message once for sending it to several clients
+
+        :param data: message text
+        :type data: str
+        :return: a message for :meth:`sendPrepared`
+        :rtype: bytes
+        """
+        return make_text_frame(data)
+
+    def sendMessage(self, data):
+        """
+        Send a text message
+
+        This method can be called from any thread.
+
+        :param data: message text
+        :type data: str
+        """
+        self.sendPrepared(self.prepareMessage(data))
+
+    def sendPrepared(self, frame):
+        """
+        Send a message encoded by :meth:`prepareMessage`
+
+        This method can be called from any thread.
+
+        :param frame: an encoded message
+        :type frame: bytes
+        """
+        with self._pending_lock:
+            self._pending += 1
+        try:
+            self._loop.call_soon_threadsafe(self._send_queue.put_nowait, frame)
+        except RuntimeError:  # The event loop is closed
+            with self._pending_lock:
+                self._pending -= 1
+
+    async def _send_frames(self):
+        while True:
+            frame = await self._send_queue.get()
+            try:
+                self._writer.write(frame)
+                await self._writer.drain()
+            finally:
+                with self._pending_lock:
+                    self._pending -= 1
+                    sent = not self._pending
+            if sent:
+                self.handleSent()
+
+    async def _read_frame(self):
+        header = await self._reader.readexactly(2)
+        fin = bool(header[0] & 0x80)
+        opcode = header[0] & 0x0f
+        length = header[1] & 0x7f
+        if length == 126:
+            length = struct.unpack('>H', await self._reader.readexactly(2))[0]
+        elif length == 127:
+            length = struct.unpack('>Q', await self._reader.readexactly(8))[0]
+        if length > self.max_message_size:
+            raise HttpError('WebSocket message is too big')
+        if not header[1] & 0x80:
+            # RFC 6455, section 5.1: all frames sent by a client must be masked
+            raise ProtocolError('Unmasked WebSocket frame')
+        mask = await self._reader.readexactly(4)
+        payload = _unmask(await self._reader.readexactly(length), mask)
+        return fin, opcode, payload
+
+    async def serve(self):
+        """
+        Receive WebSocket messages until the connection is closed
+        """
+        self.handshaked = True
+        sender = asyncio.ensure_future(self._send_frames())
+        self.handleConnected()
+        message = []
+        try:
+            while True:
+                try:
+                    fin, opcode, payload = await self._read_frame()
+                except ProtocolError:
+                    self._writer.write(_make_frame(OP_CLOSE,
+                                                   struct.pack('>H', CLOSE_PROTOCOL_ERROR)))
+                    break
+                if opcode == OP_CLOSE:
+                    self._writer.write(_make_frame(OP_CLOSE, payload[:2]))
+                    break
+                if opcode == OP_PING:
+                    self._writer.write(_make_frame(OP_PONG, payload))
+                    continue
+                if opcode == OP_PONG:
+                    continue
+                message.append(payload)
+                if sum(len(part) for part in message) > self.max_message_size:
+                    raise HttpError('WebSocket message is too big')
+                if fin:
+                    data = b''.join(message)
+                    message = []
+                    self.data = data.decode('utf-8')
+                    self.handleMessage()
+        finally:
+            sender.cancel()
+            with self._pending_lock:
+                self._pending = 0
+            self.handshaked = False
+            self.handleClose()
+
+
+class AsyncioWsgiServer:  # pylint: disable=too-many-instance-attributes
+    """
+    Asynchronous WSGI server with WebSocket support
+
+    A request to ``ws_path`` is upgraded to WebSocket protocol
+    and served by an instance of ``ws_handler_class``.
+    If :attr:`unix_path` is set, the server listens on a Unix socket
+    with this path instead of ``host`` and ``port``.
+    Names of threads started by the server begin with :attr:`thread_name`.
+    """
+    server_version = 'WebPdbServer'
+    thread_name = 'web-pdb-server'
+    max_header_lines = 100
+    max_content_length = 16 * 1024 * 1024
+    shutdown_timeout = 1.0
+
+    def __init__(self, host, port, app, ws_handler_class=None, ws_path='/ws'):
+        self.host = host
+        self.port = port
+        self.app = app
+        self.ws_handler_class = ws_handler_class
+        self.ws_path = ws_path
+        self.unix_path = None
+        self._loop = None
+        self._stop_requested = False
+        self._stopped = None
+        self._writers = set()
+
+    def serve_forever(self):
+        """
+        Serve requests until :meth:`shutdown` is called
+
+        This method blocks the current thread.
+        """
+        loop = asyncio.new_event_loop()
+        loop.set_default_executor(ThreadPoolExecutor(thread_name_prefix=self.thread_name))
+        try:
+            loop.run_until_complete(self._serve(loop))
+        finally:
+            loop.close()
+
+    def shutdown(self):
+        """
+        Stop the server
+
+        This method can be called from any thread.
+        """
+        self._stop_requested = True
+        loop = self._loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(self._stop)
+            except RuntimeError:  # The event loop is already closed
+                pass
+
+    def _stop(self):
+        if not self._stopped.done():
+            self._stopped.set_result(None)
+
+    async def _serve(self, loop):
+        self._stopped = loop.create_future()
+        self._loop = loop
+        if self._stop_requested:
+            return
+        if self.unix_path is not None:
+            server = await asyncio.start_unix_server(self._handle_connection, self.unix_path)
+        else:
+            server = await asyncio.start_server(self._handle_connection, self.host or None,
+                                                self.port, reuse_address=True)
+        try:
+            await self._stopped
+        finally:
+            server.close()
+            # Closing connections makes their handlers exit
+            for writer in list(self._writers):
+                writer.close()
+            await server.wait_closed()
+            tasks = [task for task in asyncio.all_tasks(loop)
+                     if task is not asyncio.current_task(loop)]
+            if tasks:
+                _, pending = await asyncio.wait(tasks, timeout=self.shutdown_timeout)
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _handle_connection(self, reader, writer):
+        self._writers.add(writer)
+        try:
+            keep_alive = True
+            while keep_alive:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, target, version, headers = request
+                path = target.split('?', 1)[0]
+                if (path == self.ws_path and self.ws_handler_class is not None
+                        and headers.get('upgrade', '').lower() == 'websocket'):
+                    await self._switch_to_websocket(reader, writer, headers, target)
+                    break
+                keep_alive = self._is_keep_alive(version, headers)
+                content_length = int(headers.get('content-length', 0))
+                if content_length > self.max_content_length:
+                    raise HttpError('Request body is too big')
+                body = await reader.readexactly(content_length)
+                environ = self._get_environ(writer, request, body)
+                response = await self._loop.run_in_executor(None, self._call_app, environ)
+                self._write_response(writer, (method, version), response, keep_alive)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                HttpError, UnicodeDecodeError, ValueError):
+            pass
+        except Exception:  # pylint: disable=broad-except
+            logger.exception('Error while serving a request')
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _read_request(self, reader):
+        request_line = await reader.readline()
+        if not request_line.strip():
+            return None
+        try:
+            method, target, version = request_line.decode('latin-1').split()
+        except ValueError as exc:
+            raise HttpError('Invalid request line') from exc
+        headers = {}
+        for _ in range(self.max_header_lines):
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise HttpError('Too many headers')
+        return method.upper(), target, version, headers
+
+    @staticmethod
+    def _is_keep_alive(version, headers):
+        connection = headers.get('connection', '').lower()
+        if version == 'HTTP/1.0':
+            return connection == 'keep-alive'
+        return connection != 'close'
+
+    def _get_environ(self, writer, request, body):
+        method, target, version, headers = request
+        path, _, query = target.partition('?')
+        peer = writer.get_extra_info('peername') or ('', 0)
+        environ = {
+            'REQUEST_METHOD': method,
+            'SCRIPT_NAME': '',
+            'PATH_INFO': unquote(path, 'latin-1'),
+            'QUERY_STRING': query,
+            'SERVER_NAME': self.host or 'localhost',
+            'SERVER_PORT': str(self.port),
+            'SERVER_PROTOCOL': version,
+            'REMOTE_ADDR': peer[0],
+            'CONTENT_TYPE': headers.get('content-type', ''),
+            'CONTENT_LENGTH': str(len(body)),
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': 'http',
+            'wsgi.input': io.BytesIO(body),
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False,
+        }
+        for name, value in headers.items():
+            if name not in ('content-type', 'content-length'):
+                environ['HTTP_' + name.upper().replace('-', '_')] = value
+        return environ
+
+    def _run_app(self, environ):
+        response = []
+        body = []
+
+        def start_response(status, headers, exc_info=None):
+            if exc_info is not None and response:
+                raise exc_info[1].with_traceback(exc_info[2])
+            response[:] = [status, headers]
+            return body.append
+
+        result = self.app(environ, start_response)
+        try:
+            body.extend(result)
+        finally:
+            if hasattr(result, 'close'):
+                result.close()
+        return response[0], response[1], b''.join(body)
+
+    def _call_app(self, environ):
+        """
+        Call the WSGI application in a worker thread
+
+        :return: ``(status, headers, body)`` tuple
+        """
+        try:
+            return self._run_app(environ)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception('Error in WSGI application')
+            return ('500 Internal Server Error',
+                    [('Content-Type', 'text/plain')], b'Internal Server Error')
+
+    def _write_response(self, writer, request, response, keep_alive):
+        """
+        :param request: ``(method, version)`` tuple
+        :param response: ``(status, headers, content)`` tuple
+        """
+        method, version = request
+        status, headers, content = response
+        lines = [f'{version} {status}']
+        names = set()
+        for name, value in headers:
+            names.add(name.lower())
+            lines.append(f'{name}: {value}')
+        if 'content-length' not in names:
+            lines.append(f'Content-Length: {len(content)}')
+        if 'date' not in names:
+            lines.append(f'Date: {formatdate(usegmt=True)}')
+        lines.append(f'Server: {self.server_version}')
+        if not keep_alive:
+            lines.append('Connection: close')
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        if method != 'HEAD':
+            writer.write(content)
+
+    async def _switch_to_websocket(self, reader, writer, headers, target):
+        key = headers.get('sec-websocket-key')
+        if not key:
+            raise HttpError('Invalid WebSocket handshake')
+        accept = base64.b64encode(
+            hashlib.sha1((key + WS_GUID).encode('ascii')).digest()).decode('ascii')
+        writer.write(('HTTP/1.1 101 Switching Protocols\r\n'
+                      'Upgrade: websocket\r\n'
+                      'Connection: Upgrade\r\n'
+                      f'Sec-WebSocket-Accept: {accept}\r\n\r\n').encode('ascii'))
+        await writer.drain()
+        handler = self.ws_handler_class(self, reader, writer)
+        handler.query = target.partition('?')[2]
+        await handler.serve()
@@ -0,0 +1,143 @@
+# Author: Roman Miroshnychenko aka Roman V.M.
+# E-mail: roman1972@gmail.com
+#
+# Copyright (c) 2016 Roman Miroshnychenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+asyncore-based web-server backend
+
+This module is imported only when ``'asyncore'`` backend is selected
+(see :class:`web_pdb.web_console.WebServer`).
+"""
+
+import socket
+
+from asyncore_wsgi import asyncore, make_server, AsyncWsgiHandler, AsyncWebSocketHandler
+
+from .async_server import OP_TEXT, make_text_frame
+from .web_console import WebConsoleSocketBase
+from .wsgi_app import app
+
+__all__ = ['serve']
+
+
+class ServerWaker(asyncore.dispatcher):
+    """
+    Wakes up the web-server polling loop from other threads
+
+    The server checks if it has data to send only when it starts polling
+    sockets, so after queueing messages from another thread
+    the polling loop must be interrupted.
+    """
+    def __init__(self, map_):
+        self._wakeup_sock, sock = socket.socketpair()
+        self._wakeup_sock.setblocking(False)
+        super().__init__(sock, map_)
+
+    def writable(self):
+        return False
+
+    def handle_read(self):
+        try:
+            while self.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def wake(self):
+        try:
+            self._wakeup_sock.send(b'\0')
+        except (BlockingIOError, OSError):
+            pass  # The server will wake up anyway
+
+    def close(self):
+        super().close()
+        self._wakeup_sock.close()
+
+
+class WebConsoleRequestHandler(AsyncWsgiHandler):
+    """
+    HTTP request handler for asyncore-based web-server
+
+    Unlike the parent class, it accepts WebSocket requests with a query string.
+    """
+    ws_query = ''
+
+    def parse_request(self):
+        if not super().parse_request():
+            return False
+        path, _, query = self.path.partition('?')
+        if path == self.ws_path:
+            self.path = path  # pylint: disable=attribute-defined-outside-init
+            self.ws_query = query
+        return True
+
+
+class WebConsoleSocket(WebConsoleSocketBase, AsyncWebSocketHandler):
+    """
+    WebSocket handler for asyncore-based web-server
+    """
+    @staticmethod
+    def prepareMessage(data):
+        return make_text_frame(data)
+
+    def sendPrepared(self, message):
+        self.sendq.append((OP_TEXT, message))  # deque.append is thread-safe
+
+    def queued_messages(self):
+        return len(self.sendq)
+
+    def handle_write(self):
+        super().handle_write()
+        if not self.sendq:
+            self._notify_sent()
+
+    def handleConnected(self):
+        # Small update messages must not be delayed by Nagle's algorithm
+        try:
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass
+        self.query = self.request.ws_query
+        super().handleConnected()
+
+
+def serve(host, port, stop_event):
+    """
+    Run asyncore-based web-server until the stop event is set
+
+    :param host: hostname or IP-address to listen on
+    :type host: str
+    :param port: port to listen on
+    :type port: int
+    :param stop_event: stops the server when set
+    :type stop_event: threading.Event
+    """
+    httpd = make_server(host, port, app, handler_class=WebConsoleRequestHandler,
+                        ws_handler_class=WebConsoleSocket)
+    # pylint: disable=protected-access
+    WebConsoleSocketBase.waker = ServerWaker(httpd._map)
+    while not stop_event.is_set():
+        try:
+            httpd.poll_once(None)  # Sleep until socket activity or wake-up
+        except (KeyboardInterrupt, SystemExit):
+            break
+    WebConsoleSocketBase.waker = None
+    httpd.handle_close()
@@ -0,0 +1,238 @@
+# Author: Roman Miroshnychenko aka Roman V.M.
+# E-mail: roman1972@gmail.com
+#
+# Copyright (c) 2016 Roman Miroshnychenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Breakpoints with compiled conditions and logpoints
+"""
+
+import bdb
+import string
+import time
+from functools import partial
+
+__all__ = ['BreakpointChecker', 'compile_condition', 'compile_log_message',
+           'get_breakpoint_info']
+
+
+def compile_condition(cond):
+    """
+    Compile a breakpoint condition
+
+    :param cond: a Python expression
+    :type cond: str
+    :return: a code object
+    :raises SyntaxError: if the condition is not a valid expression
+    """
+    try:
+        return compile(cond, '<breakpoint condition>', 'eval')
+    except ValueError as exc:  # Null bytes in the source
+        raise SyntaxError(str(exc)) from exc
+
+
+_CONVERSIONS = {None: None, 'r': repr, 's': str, 'a': ascii}
+
+
+def _compile_fields(message):
+    """
+    Split a message into literal text and compiled replacement fields
+
+    The message is parsed by :class:`string.Formatter` instead of
+    the f-string parser, so expressions may contain any quotes
+    on all Python versions.
+    """
+    try:
+        parsed = list(string.Formatter().parse(message))
+    except ValueError as exc:
+        raise SyntaxError(str(exc)) from exc
+    parts = []
+    for literal, field, spec, conversion in parsed:
+        if literal:
+            parts.append(literal)
+        if field is None:
+            continue
+        expression = field.rstrip()
+        if expression.endswith('=') and not expression.endswith(('==', '!=', '<=', '>=')):
+            # Self-documenting expression like f'{x=}'
+            parts.append(field)
+            expression = expression[:-1]
+            if conversion is None and not spec:
+                conversion = 'r'
+        if not expression.strip():
+            raise SyntaxError('empty expression in a message')
+        if conversion not in _CONVERSIONS:
+            raise SyntaxError(f'invalid conversion character: {conversion!r}')
+        parts.append((compile_condition(f'({expression})'), _CONVERSIONS[conversion],
+                      _compile_fields(spec) if spec else []))
+    return parts
+
+
+def _format_fields(parts, frame):
+    chunks = []
+    for part in parts:
+        if isinstance(part, str):
+            chunks.append(part)
+            continue
+        code, convert, spec = part
+        value = eval(code, frame.f_globals, frame.f_locals)  # pylint: disable=eval-used
+        if convert is not None:
+            value = convert(value)
+        chunks.append(format(value, _format_fields(spec, frame)))
+    return ''.join(chunks)
+
+
+def compile_log_message(message):
+    """
+    Compile a logpoint message with the syntax of f-strings
+
+    Each expression in curly braces is compiled separately, and the message
+    is formatted with optional conversions and format specs like an f-string.
+
+    :param message: a message with expressions in curly braces
+    :type message: str
+    :return: a function that formats the message in the context of a frame
+    :rtype: collections.abc.Callable
+    :raises SyntaxError: if the message is not valid
+    """
+    return partial(_format_fields, _compile_fields(message))
+
+
+def _get_compiled(bp, attr, source, compile_func):
+    """
+    Get a compiled expression or message cached in a breakpoint instance
+
+    The expression is recompiled only if its source has changed,
+    e.g. after ``condition`` command. Invalid expressions are cached as ``None``.
+    """
+    cached = getattr(bp, attr, None)
+    if cached is None or cached[0] != source:
+        try:
+            code = compile_func(source)
+        except SyntaxError:
+            code = None
+        cached = (source, code)
+        setattr(bp, attr, cached)
+    return cached[1]
+
+
+def get_breakpoint_info(bp):
+    """
+    Get breakpoint properties for the web-UI
+
+    :param bp: a breakpoint
+    :type bp: bdb.Breakpoint
+    :rtype: dict
+    """
+    return {
+        'number': bp.number,
+        'file': bp.file,
+        'line': bp.line,
+        'enabled': bool(bp.enabled),
+        'temporary': bool(bp.temporary),
+        'cond': bp.cond,
+        'log': getattr(bp, 'log_message', None),
+        'hits': bp.hits,
+        'ignore': bp.ignore,
+    }
+
+
+class BreakpointChecker:  # pylint: disable=too-few-public-methods
+    """
+    Checks if a debugger needs to stop at a breakpoint
+
+    This is a replacement for :func:`bdb.effective` with the same rules
+    for ignore counts and temporary breakpoints. Conditions are compiled once
+    and cached in breakpoint instances instead of being evaluated
+    from strings on every hit.
+
+    A breakpoint with ``log_message`` attribute is a logpoint: it never stops
+    the program but writes the message formatted as an f-string
+    in the context of the current frame to the console. Each logpoint writes
+    no more than :attr:`logpoint_rate` messages per second, and the number
+    of messages suppressed over the limit is reported with the next message.
+    """
+    logpoint_rate = 10
+
+    def __init__(self, write):
+        """
+        :param write: a function that writes a string to the debugger console
+        :type write: collections.abc.Callable
+        """
+        self._write = write
+
+    def effective(self, filename, lineno, frame):
+        """
+        Find a breakpoint to stop at
+
+        :param filename: canonical file name
+        :type filename: str
+        :param lineno: line number
+        :type lineno: int
+        :param frame: the current frame
+        :type frame: types.FrameType
+        :return: ``(breakpoint, delete_temporary_flag)``
+            or ``(None, None)`` if the program does not need to stop
+        :rtype: tuple
+        """
+        for bp in bdb.Breakpoint.bplist.get((filename, lineno), ()):
+            if not bp.enabled or not bdb.checkfuncname(bp, frame):
+                continue
+            bp.hits += 1
+            if bp.cond:
+                # Like bdb, stop if a condition cannot be evaluated
+                # but do not delete a temporary breakpoint
+                code = _get_compiled(bp, 'compiled_cond', bp.cond, compile_condition)
+                if code is None:
+                    return bp, False
+                try:
+                    if not eval(code, frame.f_globals, frame.f_locals):  # pylint: disable=eval-used
+                        continue
+                except Exception:  # pylint: disable=broad-except
+                    return bp, False
+            if bp.ignore > 0:
+                bp.ignore -= 1
+                continue
+            if getattr(bp, 'log_message', None) is not None:
+                self._log(bp, frame)
+                continue
+            return bp, True
+        return None, None
+
+    def _log(self, bp, frame):
+        now = time.monotonic()
+        window_start, count, suppressed = getattr(bp, 'log_state', (now, 0, 0))
+        if now - window_start >= 1.0:
+            window_start, count = now, 0
+        if count >= self.logpoint_rate:
+            bp.log_state = (window_start, count, suppressed + 1)
+            return
+        bp.log_state = (window_start, count + 1, 0)
+        format_message = _get_compiled(bp, 'compiled_log', bp.log_message, compile_log_message)
+        if format_message is None:
+            message = f'<invalid message: {bp.log_message}>'
+        else:
+            try:
+                message = format_message(frame)
+            except Exception as exc:  # pylint: disable=broad-except
+                message = f'<{type(exc).__name__}: {exc}>'
+        if suppressed:
+            message += f' ({suppressed} messages suppressed)'
+        self._write(f'*** Logpoint {bp.number}: {message}\n')
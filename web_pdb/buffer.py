@@ -21,9 +21,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from threading import RLock
+from collections import deque
+from threading import Event, RLock
 
-__all__ = ['ThreadSafeBuffer']
+__all__ = ['ThreadSafeBuffer', 'ConsoleHistory', 'DebuggerCall']
 
 
 class ThreadSafeBuffer:
@@ -53,3 +54,218 @@ class ThreadSafeBuffer:
         with self._lock:
             self._contents = value
             self._is_dirty = True
+
+
+class DebuggerCall:
+    """
+    A function call to be executed in the debugger thread
+
+    Calls are put into the console input queue by web-server handlers
+    and executed by the debugger while it waits for a command,
+    so the debugged program state is never accessed concurrently.
+    """
+    def __init__(self, func):
+        """
+        :param func: a function that receives the debugger instance
+        :type func: collections.abc.Callable
+        """
+        self._func = func
+        self._done = Event()
+        self._result = None
+        self._error = None
+
+    def run(self, debugger):
+        """
+        Execute the call and store its result
+
+        :param debugger: the debugger instance
+        """
+        try:
+            self._result = self._func(debugger)
+        except Exception as exc:  # pylint: disable=broad-except
+            self._error = exc
+        finally:
+            self._done.set()
+
+    def wait(self, timeout=None):
+        """
+        Wait for the call result
+
+        :param timeout: timeout in seconds
+        :type timeout: float
+        :return: the function return value
+        :raises TimeoutError: if the call has not been executed in time
+        :raises Exception: an exception raised by the function
+        """
+        if not self._done.wait(timeout):
+            raise TimeoutError('The debugger is busy')
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+class ConsoleHistory:  # pylint: disable=too-many-instance-attributes
+    """
+    Bounded append-only storage for console history
+
+    Data is stored in chunks of about :attr:`chunk_size` characters.
+    When the stored history exceeds ``max_size`` characters or ``max_lines``
+    lines, the oldest chunks are discarded like in a ring buffer.
+    The current chunk that is still being filled counts towards the limits too
+    and is trimmed from its start if it alone exceeds them.
+    Each character has a stable offset counted from the start of the session
+    so clients can request arbitrary ranges of the retained history.
+    """
+    chunk_size = 4096
+
+    def __init__(self, max_size=1024 * 1024, max_lines=10000):
+        """
+        :param max_size: max number of retained characters
+        :type max_size: int
+        :param max_lines: max number of retained lines
+        :type max_lines: int
+        """
+        self._lock = RLock()
+        self.max_size = max_size
+        self.max_lines = max_lines
+        self._chunks = deque()  # (start_offset, text, line_count) tuples
+        self._pending = []
+        self._pending_size = 0
+        self._pending_lines = 0
+        self._start = 0
+        self._end = 0
+        self._lines = 0
+
+    @property
+    def start(self):
+        """Offset of the first retained character"""
+        with self._lock:
+            return self._start
+
+    @property
+    def end(self):
+        """Offset past the last written character"""
+        with self._lock:
+            return self._end
+
+    def append(self, data):
+        """
+        Append data to the history
+
+        :param data: console output
+        :type data: str
+        :return: history end offset after appending
+        :rtype: int
+        """
+        with self._lock:
+            if len(data) > self.max_size:
+                skipped = len(data) - self.max_size
+                self._discard_all(self._end + skipped)
+                data = data[skipped:]
+            self._pending.append(data)
+            self._pending_size += len(data)
+            lines = data.count('\n')
+            self._pending_lines += lines
+            self._lines += lines
+            self._end += len(data)
+            if self._pending_size >= self.chunk_size:
+                self._seal_pending()
+            self._evict()
+            return self._end
+
+    def read(self, start=None, end=None):
+        """
+        Read a range of the retained history
+
+        Offsets outside the retained range are clamped to it.
+
+        :param start: start offset, defaults to the first retained character
+        :type start: int
+        :param end: end offset, defaults to the end of the history
+        :type end: int
+        :return: the actual start offset and the data
+        :rtype: tuple
+        """
+        with self._lock:
+            start = self._start if start is None else max(start, self._start)
+            end = self._end if end is None else min(end, self._end)
+            if start >= end:
+                return end, ''
+            parts = []
+            for chunk_start, text, _ in self._iter_chunks():
+                chunk_end = chunk_start + len(text)
+                if chunk_end <= start:
+                    continue
+                if chunk_start >= end:
+                    break
+                parts.append(text[max(start - chunk_start, 0):end - chunk_start])
+            return start, ''.join(parts)
+
+    def tail(self, size):
+        """
+        Read the last ``size`` characters of the history
+
+        :param size: max number of characters to read
+        :type size: int
+        :return: the actual start offset and the data
+        :rtype: tuple
+        """
+        with self._lock:
+            return self.read(self._end - size)
+
+    def clear(self):
+        """Discard all history and reset offsets"""
+        with self._lock:
+            self._discard_all(0)
+
+    def _iter_chunks(self):
+        yield from self._chunks
+        if self._pending:
+            text = ''.join(self._pending)
+            self._pending = [text]
+            yield self._end - len(text), text, self._pending_lines
+
+    def _seal_pending(self):
+        text = ''.join(self._pending)
+        self._chunks.append((self._end - len(text), text, self._pending_lines))
+        self._pending = []
+        self._pending_size = 0
+        self._pending_lines = 0
+
+    def _is_full(self):
+        return self._end - self._start > self.max_size or self._lines > self.max_lines
+
+    def _evict(self):
+        while self._chunks and self._is_full():
+            chunk_start, text, lines = self._chunks.popleft()
+            self._start = chunk_start + len(text)
+            self._lines -= lines
+        if self._pending and self._is_full():
+            self._trim_pending()
+
+    def _trim_pending(self):
+        # The pending chunk alone is over the limits
+        # so its oldest characters are discarded.
+        text = ''.join(self._pending)
+        skipped = max(len(text) - self.max_size, 0)
+        excess_lines = self._lines - self.max_lines
+        if excess_lines > 0:
+            newline = -1
+            for _ in range(excess_lines):
+                newline = text.index('\n', newline + 1)
+            skipped = max(skipped, newline + 1)
+        lines = text.count('\n', 0, skipped)
+        text = text[skipped:]
+        self._pending = [text]
+        self._pending_size = len(text)
+        self._pending_lines -= lines
+        self._lines -= lines
+        self._start = self._end - len(text)
+
+    def _discard_all(self, new_start):
+        self._chunks.clear()
+        self._pending = []
+        self._pending_size = 0
+        self._pending_lines = 0
+        self._lines = 0
+        self._start = self._end = new_start
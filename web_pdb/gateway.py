@@ -0,0 +1,204 @@
+# Author: Roman Miroshnychenko aka Roman V.M.
+# E-mail: roman1972@gmail.com
+#
+# Copyright (c) 2016 Roman Miroshnychenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Single-port gateway for debugging sessions of multiple processes
+
+In gateway mode each debugged process serves its web-UI on a Unix socket
+in a sessions directory instead of a TCP port. The gateway serves
+one HTTP endpoint with the list of active sessions and routes requests
+to ``/session/<session_id>/`` path to the respective process.
+
+Usage::
+
+    python -m web_pdb.gateway [--host HOST] [--port PORT] [--dir DIR]
+
+Debugged processes join the gateway if ``WEB_PDB_GATEWAY_DIR`` environment
+variable is set to the sessions directory.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import re
+import socket
+import time
+
+import bottle
+
+from .registry import SESSIONS_DIR_ENV, get_default_sessions_dir, list_sessions
+
+__all__ = ['Gateway']
+
+this_dir = os.path.dirname(os.path.abspath(__file__))
+template_lookup = [os.path.join(this_dir, 'templates')]
+session_path_re = re.compile(r'^/session/([A-Za-z0-9_-]+)(/.*)?$')
+
+
+async def _pipe(reader, writer):
+    try:
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            writer.write(data)
+            await writer.drain()
+    except OSError:
+        pass
+
+
+class Gateway:  # pylint: disable=too-few-public-methods
+    """
+    HTTP and WebSocket gateway to debugging sessions of multiple processes
+
+    Requests are routed to sessions at the level of byte streams,
+    so the gateway does not depend on the protocol details
+    of session web-servers. Plain HTTP requests are proxied
+    one per connection, and WebSocket connections are piped
+    until one of the sides closes the connection.
+    """
+    max_head_size = 64 * 1024
+
+    def __init__(self, host, port, sessions_dir):
+        self.host = host
+        self.port = port
+        self.sessions_dir = sessions_dir
+
+    def serve_forever(self):
+        """
+        Serve requests
+
+        This method blocks the current thread.
+        """
+        loop = asyncio.new_event_loop()
+        try:
+            server = loop.run_until_complete(asyncio.start_server(
+                self._handle_connection, self.host or None, self.port,
+                reuse_address=True, limit=self.max_head_size))
+            logging.critical('Web-PDB gateway: serving sessions from %s on http://%s:%s',
+                             self.sessions_dir, socket.gethostname(), self.port)
+            loop.run_until_complete(server.serve_forever())
+        finally:
+            loop.close()
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+            request_line = head.split(b'\r\n', 1)[0].decode('latin-1')
+            method, target, _ = request_line.split()
+            path = target.split('?', 1)[0]
+            match = session_path_re.match(path)
+            if path == '/':
+                await self._respond(writer, '200 OK', 'text/html; charset=utf-8',
+                                    self._render_sessions())
+            elif path == '/sessions':
+                await self._respond(writer, '200 OK', 'application/json',
+                                    json.dumps(list_sessions(self.sessions_dir)))
+            elif match is None:
+                await self._respond(writer, '404 Not Found', 'text/plain', 'Not Found')
+            elif match.group(2) is None:
+                await self._respond(writer, '301 Moved Permanently', 'text/plain', '',
+                                    f'Location: {path}/\r\n')
+            else:
+                new_target = target[len(f'/session/{match.group(1)}'):]
+                await self._proxy(reader, writer, match.group(1),
+                                  self._rewrite_head(head, method, new_target))
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError, OSError):
+            pass
+        finally:
+            writer.close()
+
+    def _render_sessions(self):
+        sessions = list_sessions(self.sessions_dir)
+        for session in sessions:
+            session['started_str'] = time.strftime('%Y-%m-%d %H:%M:%S',
+                                                   time.localtime(session['started']))
+        return bottle.template('sessions', template_lookup=template_lookup,
+                               host=socket.gethostname(), sessions=sessions)
+
+    @staticmethod
+    async def _respond(writer, status, content_type, body, extra_headers=''):
+        body = body.encode('utf-8')
+        writer.write((f'HTTP/1.1 {status}\r\n'
+                      f'Content-Type: {content_type}\r\n'
+                      f'Content-Length: {len(body)}\r\n'
+                      'Cache-Control: no-store\r\n'
+                      f'{extra_headers}'
+                      'Connection: close\r\n\r\n').encode('latin-1') + body)
+        await writer.drain()
+
+    @staticmethod
+    def _rewrite_head(head, method, target):
+        """
+        Rewrite request path and ask the session server to close
+        the connection after a plain HTTP response, so that the next
+        request from a browser is routed again
+        """
+        lines = head.decode('latin-1').split('\r\n')[1:-2]
+        is_websocket = any(line.lower().replace(' ', '') == 'upgrade:websocket'
+                           for line in lines)
+        if not is_websocket:
+            lines = [line for line in lines
+                     if not line.lower().startswith(('connection:', 'keep-alive:'))]
+            lines.append('Connection: close')
+        return '\r\n'.join([f'{method} {target} HTTP/1.1'] + lines + ['', '']).encode('latin-1')
+
+    async def _proxy(self, reader, writer, session_id, head):
+        socket_path = os.path.join(self.sessions_dir, session_id + '.sock')
+        try:
+            session_reader, session_writer = await asyncio.open_unix_connection(socket_path)
+        except OSError:
+            await self._respond(writer, '502 Bad Gateway', 'text/plain',
+                                f'Session {session_id} is not available')
+            return
+        try:
+            session_writer.write(head)
+            tasks = [asyncio.ensure_future(_pipe(reader, session_writer)),
+                     asyncio.ensure_future(_pipe(session_reader, writer))]
+            _, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            session_writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Web-PDB gateway for debugging sessions of multiple processes')
+    parser.add_argument('--host', default='', help='hostname or IP-address to listen on')
+    parser.add_argument('--port', type=int, default=5555, help='port to listen on')
+    parser.add_argument('--dir', default=get_default_sessions_dir(),
+                        help=f'sessions directory (set {SESSIONS_DIR_ENV} environment '
+                             f'variable to this path for debugged processes)')
+    args = parser.parse_args()
+    os.makedirs(args.dir, mode=0o700, exist_ok=True)
+    try:
+        Gateway(args.host, args.port, args.dir).serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
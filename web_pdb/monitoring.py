@@ -0,0 +1,244 @@
+# Author: Roman Miroshnychenko aka Roman V.M.
+# E-mail: roman1972@gmail.com
+#
+# Copyright (c) 2016 Roman Miroshnychenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Low-overhead breakpoint monitoring based on sys.monitoring (PEP 669)
+"""
+
+import sys
+import threading
+
+__all__ = ['BreakpointMonitor', 'ThreadInterrupter']
+
+
+class BreakpointMonitor:
+    """
+    Watches breakpoint lines while a program runs without a trace function
+
+    ``LINE`` events are enabled only for code objects that contain
+    breakpoints, so the rest of the program runs at full speed.
+    Code objects are checked for breakpoints when they start or resume
+    executing: ``PY_START`` and ``PY_RESUME`` events are disabled
+    for each code location after the first one, so code objects
+    created after the monitor has been started are watched too.
+    When an effective breakpoint is hit in the monitored thread,
+    the debugger's :meth:`break_at` method is called with
+    the current frame.
+
+    Only one monitor in a process can be active at a time because
+    sys.monitoring callbacks are global. Debuggers of other threads
+    fall back to tracing.
+
+    Requires Python 3.12+.
+    """
+    tool_name = 'web-pdb'
+    _active_monitor = None
+
+    def __init__(self, debugger):
+        """
+        :param debugger: a debugger instance
+        :type debugger: web_pdb.WebPdb
+        """
+        self._debugger = debugger
+        self._thread_id = None
+        self._breaks = {}
+        self._code_objects = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_available():
+        """Check if sys.monitoring is available"""
+        return hasattr(sys, 'monitoring')
+
+    @property
+    def active(self):
+        return self._thread_id is not None
+
+    def start(self, frame):
+        """
+        Start monitoring breakpoints in the current thread
+
+        :param frame: the current frame of the debugged program.
+        :type frame: types.FrameType
+        :return: ``False`` if sys.monitoring is not available
+            or the debugger tool ID is used by another tool or monitor.
+        :rtype: bool
+        """
+        if not self.is_available():
+            return False
+        if BreakpointMonitor._active_monitor not in (None, self):
+            return False
+        monitoring = sys.monitoring  # pylint: disable=no-member
+        tool_id = monitoring.DEBUGGER_ID
+        tool_name = monitoring.get_tool(tool_id)
+        if tool_name is None:
+            monitoring.use_tool_id(tool_id, self.tool_name)
+        elif tool_name != self.tool_name:
+            return False
+        self.stop()
+        events = monitoring.events
+        self._breaks = {filename: set(lines)
+                        for filename, lines in self._debugger.breaks.items()}
+        monitoring.register_callback(tool_id, events.LINE, self._on_line)
+        monitoring.register_callback(tool_id, events.PY_START, self._on_start)
+        monitoring.register_callback(tool_id, events.PY_RESUME, self._on_start)
+        # Code blocks that are already executing, e.g. module-level code,
+        # do not start again so they are taken from the current stack.
+        while frame is not None:
+            self._watch(frame.f_code)
+            frame = frame.f_back
+        monitoring.set_events(tool_id, events.PY_START | events.PY_RESUME)
+        # Re-enable start events that have been disabled by a previous run
+        monitoring.restart_events()
+        self._thread_id = threading.get_ident()
+        BreakpointMonitor._active_monitor = self
+        return True
+
+    def stop(self):
+        """Stop monitoring breakpoints"""
+        if not self.active:
+            return
+        monitoring = sys.monitoring  # pylint: disable=no-member
+        tool_id = monitoring.DEBUGGER_ID
+        events = monitoring.events
+        monitoring.set_events(tool_id, events.NO_EVENTS)
+        with self._lock:
+            self._breaks = {}
+            for code in self._code_objects:
+                monitoring.set_local_events(tool_id, code, events.NO_EVENTS)
+            self._code_objects = set()
+        for event in (events.LINE, events.PY_START, events.PY_RESUME):
+            monitoring.register_callback(tool_id, event, None)
+        monitoring.free_tool_id(tool_id)
+        self._thread_id = None
+        BreakpointMonitor._active_monitor = None
+
+    def _watch(self, code):
+        """
+        Enable ``LINE`` events for a code object if it contains breakpoint lines
+        """
+        lines = self._breaks.get(self._debugger.canonic(code.co_filename))
+        if not lines:
+            return
+        code_lines = {line for _, _, line in code.co_lines()}
+        code_lines.add(code.co_firstlineno)
+        if code_lines.isdisjoint(lines):
+            return
+        monitoring = sys.monitoring  # pylint: disable=no-member
+        with self._lock:
+            # Start events of other threads may arrive after the monitor is stopped
+            if self._breaks and code not in self._code_objects:
+                self._code_objects.add(code)
+                monitoring.set_local_events(monitoring.DEBUGGER_ID, code,
+                                            monitoring.events.LINE)
+
+    def _on_start(self, code, instruction_offset):  # pylint: disable=unused-argument
+        self._watch(code)
+        return sys.monitoring.DISABLE  # pylint: disable=no-member
+
+    def _on_line(self, code, line_number):
+        monitoring = sys.monitoring  # pylint: disable=no-member
+        if threading.get_ident() != self._thread_id:
+            return None
+        lines = self._breaks.get(self._debugger.canonic(code.co_filename), ())
+        if line_number not in lines and code.co_firstlineno not in lines:
+            return monitoring.DISABLE
+        frame = sys._getframe(1)  # pylint: disable=protected-access
+        if self._debugger.break_here(frame):
+            self.stop()
+            self._debugger.break_at(frame)
+        return None
+
+
+class ThreadInterrupter:
+    """
+    Calls a function in another thread when that thread runs its next line
+
+    ``LINE`` events are enabled only for code objects of the current stack
+    of the thread and only until the function is called. If the thread
+    is blocked in a system call, the function is called after it returns.
+
+    Requires Python 3.12+.
+    """
+    tool_name = 'web-pdb-interrupter'
+
+    def __init__(self, thread_id, callback):
+        """
+        :param thread_id: the ID of the thread to interrupt
+        :type thread_id: int
+        :param callback: a function that is called in the interrupted thread
+            with the current frame of that thread
+        :type callback: typing.Callable[[types.FrameType], None]
+        """
+        self._thread_id = thread_id
+        self._callback = callback
+        self._code_objects = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        """
+        Start waiting for the thread
+
+        :return: ``False`` if sys.monitoring is not available, the debugger tool ID
+            is used by another tool or the thread does not run Python code.
+        :rtype: bool
+        """
+        if not BreakpointMonitor.is_available():
+            return False
+        monitoring = sys.monitoring  # pylint: disable=no-member
+        tool_id = monitoring.DEBUGGER_ID
+        frame = sys._current_frames().get(self._thread_id)  # pylint: disable=protected-access
+        if frame is None or monitoring.get_tool(tool_id) is not None:
+            return False
+        monitoring.use_tool_id(tool_id, self.tool_name)
+        monitoring.register_callback(tool_id, monitoring.events.LINE, self._on_line)
+        while frame is not None:
+            if frame.f_code not in self._code_objects:
+                self._code_objects.append(frame.f_code)
+                monitoring.set_local_events(tool_id, frame.f_code, monitoring.events.LINE)
+            frame = frame.f_back
+        monitoring.restart_events()
+        return True
+
+    def stop(self):
+        """
+        Stop waiting for the thread
+
+        :return: ``False`` if the interrupter is already stopped
+        :rtype: bool
+        """
+        with self._lock:
+            if not self._code_objects:
+                return False
+            monitoring = sys.monitoring  # pylint: disable=no-member
+            tool_id = monitoring.DEBUGGER_ID
+            for code in self._code_objects:
+                monitoring.set_local_events(tool_id, code, monitoring.events.NO_EVENTS)
+            monitoring.register_callback(tool_id, monitoring.events.LINE, None)
+            monitoring.free_tool_id(tool_id)
+            self._code_objects = []
+            return True
+
+    def _on_line(self, code, line_number):  # pylint: disable=unused-argument
+        # Other threads may run the same code objects, so locations are not disabled
+        if threading.get_ident() == self._thread_id and self.stop():
+            self._callback(sys._getframe(1))  # pylint: disable=protected-access
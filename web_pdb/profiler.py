@@ -0,0 +1,174 @@
+# Author: Roman Miroshnychenko aka Roman V.M.
+# E-mail: roman1972@gmail.com
+#
+# Copyright (c) 2016 Roman Miroshnychenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Sampling profiler for running programs
+"""
+
+import sys
+import threading
+import time
+from collections import Counter
+
+__all__ = ['SamplingProfiler']
+
+
+class SamplingProfiler:  # pylint: disable=too-many-instance-attributes
+    """
+    Statistical profiler that periodically samples stacks of all threads
+
+    Stacks are taken from :func:`sys._current_frames` by a background thread,
+    so the profiled program runs without a trace function. Samples
+    are aggregated into a table of unique stacks with their counts where
+    each stack is a list of indexes in the table of sampled functions.
+
+    Threads with names starting with :attr:`thread_name_prefix`
+    belong to Web-PDB and are not sampled.
+    """
+    interval = 0.01
+    min_interval = 0.001
+    max_depth = 128
+    max_stacks = 10000
+    thread_name_prefix = 'web-pdb'
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._functions = {}  # code object or thread name -> function index
+        self._function_list = []
+        self._stacks = Counter()
+        self._samples = 0
+        self._dropped = 0
+        self._current_interval = self.interval
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, interval=None):
+        """
+        Start sampling in a background thread
+
+        :param interval: interval between samples in seconds,
+            defaults to :attr:`interval`
+        :type interval: float
+        :return: ``False`` if the profiler is already running
+        :rtype: bool
+        """
+        with self._lock:
+            if self.running:
+                return False
+            self._current_interval = max(interval or self.interval, self.min_interval)
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, args=(self._current_interval,),
+                                            name=f'{self.thread_name_prefix}-profiler',
+                                            daemon=True)
+            self._thread.start()
+            return True
+
+    def stop(self):
+        """Stop sampling and keep collected samples"""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def reset(self):
+        """Discard collected samples"""
+        with self._lock:
+            self._functions.clear()
+            self._function_list.clear()
+            self._stacks.clear()
+            self._samples = 0
+            self._dropped = 0
+
+    def sample(self, frames, thread_names):
+        """
+        Add a sample of thread stacks
+
+        :param frames: the current frames of threads by thread ID
+            as returned by :func:`sys._current_frames`
+        :type frames: dict
+        :param thread_names: thread names by thread ID
+        :type thread_names: dict
+        """
+        with self._lock:
+            for thread_id, frame in frames.items():
+                name = thread_names.get(thread_id, f'Thread {thread_id}')
+                if name.startswith(self.thread_name_prefix):
+                    continue
+                stack = []
+                while frame is not None and len(stack) < self.max_depth:
+                    stack.append(self._get_function(frame.f_code))
+                    frame = frame.f_back
+                stack.append(self._get_function(name))
+                stack = tuple(reversed(stack))
+                if stack in self._stacks or len(self._stacks) < self.max_stacks:
+                    self._stacks[stack] += 1
+                else:
+                    self._dropped += 1
+            self._samples += 1
+
+    def get_profile(self):
+        """
+        Get collected samples
+
+        ``functions`` is a list of ``[name, filename, first_line]`` items.
+        Stack roots are pseudo-functions with thread names and empty filenames.
+        ``stacks`` is a list of ``[count, root_index, ..., leaf_index]`` items.
+
+        :return: profile data
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                'running': self.running,
+                'interval': self._current_interval,
+                'samples': self._samples,
+                'dropped': self._dropped,
+                'functions': list(self._function_list),
+                'stacks': [[count, *stack] for stack, count in self._stacks.items()],
+            }
+
+    def _get_function(self, code):
+        index = self._functions.get(code)
+        if index is None:
+            index = len(self._function_list)
+            if isinstance(code, str):
+                self._function_list.append([code, '', 0])
+            else:
+                self._function_list.append([getattr(code, 'co_qualname', code.co_name),
+                                            code.co_filename, code.co_firstlineno])
+            self._functions[code] = index
+        return index
+
+    def _run(self, interval):
+        thread_names = {}
+        names_updated = 0.0
+        while not self._stop.wait(interval):
+            now = time.monotonic()
+            if now - names_updated >= 1.0:
+                # Enumerating threads takes a lock so thread names are updated once per second
+                thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+                names_updated = now
+            self.sample(sys._current_frames(), thread_names)  # pylint: disable=protected-access
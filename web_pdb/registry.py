@@ -0,0 +1,137 @@
+# Author: Roman Miroshnychenko aka Roman V.M.
+# E-mail: roman1972@gmail.com
+#
+# Copyright (c) 2016 Roman Miroshnychenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Registry of debugging sessions served via the gateway
+
+Each session is described by a JSON file in the sessions directory
+next to the Unix socket of its web-server.
+"""
+
+import getpass
+import json
+import os
+import socket
+import sys
+import tempfile
+import time
+
+__all__ = ['SESSIONS_DIR_ENV', 'get_default_sessions_dir', 'register_session',
+           'unregister_session', 'list_sessions']
+
+SESSIONS_DIR_ENV = 'WEB_PDB_GATEWAY_DIR'
+
+
+def get_default_sessions_dir():
+    """
+    Get the default directory for session sockets
+
+    :rtype: str
+    """
+    return os.path.join(tempfile.gettempdir(), f'web-pdb-{getpass.getuser()}')
+
+
+def register_session(sessions_dir, session_id):
+    """
+    Register a debugging session in the sessions directory
+
+    :param sessions_dir: the sessions directory
+    :type sessions_dir: str
+    :param session_id: a unique session ID
+    :type session_id: str
+    :return: the path of the Unix socket for the session web-server
+    :rtype: str
+    """
+    os.makedirs(sessions_dir, mode=0o700, exist_ok=True)
+    socket_path = os.path.join(sessions_dir, session_id + '.sock')
+    info = {
+        'id': session_id,
+        'pid': os.getpid(),
+        'argv': sys.argv,
+        'hostname': socket.gethostname(),
+        'started': time.time(),
+    }
+    info_path = os.path.join(sessions_dir, session_id + '.json')
+    temp_path = info_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as fo:
+        json.dump(info, fo)
+    os.replace(temp_path, info_path)
+    return socket_path
+
+
+def unregister_session(sessions_dir, session_id):
+    """
+    Remove a debugging session from the sessions directory
+
+    :param sessions_dir: the sessions directory
+    :type sessions_dir: str
+    :param session_id: a session ID
+    :type session_id: str
+    """
+    for ext in ('.json', '.sock'):
+        try:
+            os.remove(os.path.join(sessions_dir, session_id + ext))
+        except OSError:
+            pass
+
+
+def _is_process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass  # The process exists but belongs to another user
+    return True
+
+
+def list_sessions(sessions_dir):
+    """
+    Get active debugging sessions
+
+    Sessions of processes that do not exist anymore are removed.
+
+    :param sessions_dir: the sessions directory
+    :type sessions_dir: str
+    :return: a list of session info dicts sorted by start time
+    :rtype: list
+    """
+    sessions = []
+    try:
+        filenames = os.listdir(sessions_dir)
+    except OSError:
+        return sessions
+    for filename in filenames:
+        if not filename.endswith('.json'):
+            continue
+        try:
+            with open(os.path.join(sessions_dir, filename), encoding='utf-8') as fo:
+                info = json.load(fo)
+        except (OSError, ValueError):
+            continue
+        if not _is_process_alive(info['pid']):
+            unregister_session(sessions_dir, info['id'])
+            continue
+        if os.path.exists(os.path.join(sessions_dir, info['id'] + '.sock')):
+            sessions.append(info)
+    sessions.sort(key=lambda item: item['started'])
+    return sessions
@@ -0,0 +1,300 @@
+# Author: Roman Miroshnychenko aka Roman V.M.
+# E-mail: roman1972@gmail.com
+#
+# Copyright (c) 2016 Roman Miroshnychenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Size-budgeted object representations and variable tree helpers
+"""
+
+import inspect
+import reprlib
+import types
+from collections import deque
+from itertools import islice
+from pprint import pformat
+
+from .summarizers import registry
+
+__all__ = ['SafeRepr', 'get_children', 'count_children', 'get_child', 'is_expandable',
+           'NotEvaluated', 'get_members', 'evaluate_member']
+
+_CONTAINERS = (dict, list, tuple, set, frozenset, deque)
+_SCALARS = (str, bytes, bytearray, int, float, complex, bool, type(None), range)
+# Descriptors that are safe to show as they are
+_PLAIN_DESCRIPTORS = (
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodDescriptorType,
+    types.WrapperDescriptorType,
+    types.ClassMethodDescriptorType,
+    staticmethod,
+    classmethod,
+)
+
+
+def _is_dunder(name):
+    return isinstance(name, str) and name.startswith('__') and name.endswith('__')
+
+
+class SafeRepr(reprlib.Repr):  # pylint: disable=too-many-instance-attributes
+    """
+    Object representation with size limits
+
+    Containers show only their first items and nested containers
+    are shown only up to :attr:`maxlevel` levels deep, so huge objects
+    are never formatted in full. Any representation is cut
+    to :attr:`max_length` characters. Objects that have a summarizer
+    in :attr:`summarizers` registry, e.g. NumPy arrays, are shown
+    as their summaries.
+    """
+    max_length = 2000
+    max_pretty_items = 1000
+    summarizers = registry
+
+    def __init__(self):
+        super().__init__()
+        self.maxlevel = 4
+        self.maxtuple = self.maxlist = self.maxarray = self.maxdeque = 50
+        self.maxdict = self.maxset = self.maxfrozenset = 50
+        self.maxstring = 1000
+        self.maxlong = 200
+        self.maxother = 1000
+
+    def repr(self, x):
+        return self._cut(super().repr(x))
+
+    def repr1(self, x, level):
+        summary = self.summarizers.summarize(x)
+        if summary is not None:
+            return summary
+        typename = type(x).__name__
+        if ' ' in typename:
+            typename = '_'.join(typename.split())
+        if not hasattr(self, 'repr_' + typename):
+            # Subclasses of built-in containers may be huge too
+            for base in _CONTAINERS:
+                if isinstance(x, base) and len(x) > getattr(self, 'max' + base.__name__):
+                    base_repr = getattr(self, 'repr_' + base.__name__)(x, level)
+                    return f'{type(x).__name__}({base_repr})'
+        return super().repr1(x, level)
+
+    def pformat(self, obj, indent=1):
+        """
+        Get pretty-formatted representation of an object
+
+        Pretty formatting is used only for objects with a limited number
+        of nested items. Larger objects are represented as with
+        :meth:`repr`.
+        """
+        if self._count_items(obj) > self.max_pretty_items:
+            return self.repr(obj)
+        try:
+            return self._cut(pformat(obj, indent))
+        except Exception:  # pylint: disable=broad-except
+            return self.repr(obj)
+
+    def _count_items(self, obj):
+        count = 0
+        queue = deque([(obj, 0)])
+        while queue and count <= self.max_pretty_items:
+            item, level = queue.popleft()
+            if self.summarizers.get_summarizer(type(item)) is not None:
+                # Summarized objects are never pretty-formatted
+                return self.max_pretty_items + 1
+            if not isinstance(item, _CONTAINERS) or level > self.maxlevel:
+                continue
+            count += len(item)
+            if count > self.max_pretty_items:
+                break
+            values = item.values() if isinstance(item, dict) else item
+            queue.extend((value, level + 1) for value in values)
+        return count
+
+    def _cut(self, repr_value):
+        if len(repr_value) > self.max_length:
+            return repr_value[:self.max_length - 3] + '...'
+        return repr_value
+
+
+def _get_attributes(obj):
+    """
+    Get object attributes without evaluating properties and other descriptors
+    """
+    try:
+        attrs = object.__getattribute__(obj, '__dict__')
+    except (AttributeError, TypeError):
+        attrs = {}
+    if not isinstance(attrs, (dict, types.MappingProxyType)):
+        attrs = {}
+    items = [(name, value) for name, value in attrs.items() if not _is_dunder(name)]
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            descriptor = cls.__dict__.get(name)
+            if isinstance(descriptor, types.MemberDescriptorType):
+                try:
+                    # pylint: disable=unnecessary-dunder-call
+                    items.append((name, descriptor.__get__(obj, type(obj))))
+                except AttributeError:
+                    pass
+    items.sort(key=lambda item: str(item[0]))
+    return items
+
+
+def get_children(obj):
+    """
+    Iterate over object children
+
+    Dictionaries yield their items, sequences and sets yield their elements
+    with indexes, other objects yield their instance attributes. Properties
+    and other descriptors are never evaluated.
+
+    :param obj: an object
+    :return: an iterator of ``(key, value)`` pairs where ``key`` is a string
+    """
+    if isinstance(obj, dict):
+        return ((reprlib.repr(key), value) for key, value in obj.items())
+    if isinstance(obj, _SCALARS):
+        return iter(())
+    if isinstance(obj, (list, tuple, deque, set, frozenset)):
+        return ((str(index), value) for index, value in enumerate(obj))
+    return ((str(name), value) for name, value in _get_attributes(obj))
+
+
+def count_children(obj):
+    """
+    Get the number of object children
+
+    :param obj: an object
+    :return: the number of children
+    :rtype: int
+    """
+    if isinstance(obj, _SCALARS):
+        return 0
+    if isinstance(obj, _CONTAINERS):
+        return len(obj)
+    return len(_get_attributes(obj))
+
+
+def get_child(obj, index):
+    """
+    Get a child of an object by its position
+
+    :param obj: an object
+    :param index: a position of a child as yielded by :func:`get_children`
+    :type index: int
+    :return: a child object
+    :raises IndexError: if there is no child at this position
+    """
+    if isinstance(obj, (list, tuple)) and not isinstance(obj, _SCALARS):
+        return obj[index]
+    if index < 0:
+        raise IndexError(index)
+    for _, value in islice(get_children(obj), index, None):
+        return value
+    raise IndexError(index)
+
+
+def is_expandable(obj):
+    """
+    Check if an object has children
+
+    :param obj: an object
+    :rtype: bool
+    """
+    return count_children(obj) > 0
+
+
+class NotEvaluated:  # pylint: disable=too-few-public-methods
+    """
+    A placeholder for a descriptor that has not been evaluated
+    """
+    def __init__(self, descriptor):
+        self.descriptor = descriptor
+
+    def __repr__(self):
+        return f'<{type(self.descriptor).__name__} (not evaluated)>'
+
+
+class _EvaluationError:  # pylint: disable=too-few-public-methods
+    def __init__(self, exc):
+        self.exc = exc
+
+    def __repr__(self):
+        return f'<{type(self.exc).__name__}: {self.exc}>'
+
+
+def get_members(obj):
+    """
+    Get object members without evaluating properties and other descriptors
+
+    Members are looked up statically as with :func:`inspect.getattr_static`.
+    Values of properties and other non-trivial descriptors are replaced
+    with :class:`NotEvaluated` placeholders. Special members with names
+    enclosed in double underscores are skipped.
+
+    :param obj: an object
+    :return: a sorted list of ``(name, value)`` pairs
+    :rtype: list
+    """
+    try:
+        names = dir(obj)
+    except Exception:  # pylint: disable=broad-except
+        names = [name for name, _ in _get_attributes(obj)]
+    members = []
+    for name in sorted(set(names)):
+        if _is_dunder(name):
+            continue
+        try:
+            value = inspect.getattr_static(obj, name)
+        except AttributeError:
+            continue
+        if isinstance(value, types.MemberDescriptorType) and not isinstance(obj, type):
+            try:
+                # pylint: disable=unnecessary-dunder-call
+                value = value.__get__(obj, type(obj))
+            except AttributeError:
+                continue
+        elif (hasattr(type(value), '__get__')
+              and not isinstance(value, _PLAIN_DESCRIPTORS)):
+            value = NotEvaluated(value)
+        members.append((name, value))
+    return members
+
+
+def evaluate_member(obj, name):
+    """
+    Get the value of an object member
+
+    Unlike :func:`get_members`, this function evaluates descriptors.
+    Exceptions are caught and returned as the member value.
+
+    :param obj: an object
+    :param name: a member name
+    :type name: str
+    :return: the member value
+    """
+    try:
+        return getattr(obj, name)
+    except Exception as exc:  # pylint: disable=broad-except
+        return _EvaluationError(exc)
@@ -0,0 +1,149 @@
+# Author: Roman Miroshnychenko aka Roman V.M.
+# E-mail: roman1972@gmail.com
+#
+# Copyright (c) 2016 Roman Miroshnychenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Debugging sessions of individual threads
+"""
+
+import queue
+from threading import Event, Lock
+
+from .buffer import ThreadSafeBuffer, ConsoleHistory
+
+__all__ = ['DebugSession', 'SessionRegistry']
+
+
+class DebugSession:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """
+    The state of a debugging session of one thread shared with the web-UI
+
+    Each session has its own command input queue, console history
+    and frame data, so several threads can be debugged independently
+    via one web-server.
+    """
+    def __init__(self, thread):
+        """
+        :param thread: a debugged thread
+        :type thread: threading.Thread
+        """
+        self.id = str(thread.ident)
+        self.thread = thread
+        self.thread_name = thread.name
+        self.frame_data = ThreadSafeBuffer()
+        # Frame data keys that the debugger of the session can build
+        self.frame_data_keys = ()
+        self.console_history = ConsoleHistory()
+        self.input_queue = queue.Queue()
+        self.awaiting_command = Event()
+
+    @property
+    def info(self):
+        """Session info for the web-UI"""
+        return {
+            'id': self.id,
+            'name': self.thread_name,
+            'paused': self.awaiting_command.is_set(),
+        }
+
+
+class SessionRegistry:
+    """
+    Debugging sessions of a process keyed by thread
+
+    Sessions of threads that have finished are discarded.
+    """
+    def __init__(self):
+        self._sessions = {}
+        self._lock = Lock()
+
+    def __len__(self):
+        with self._lock:
+            self._discard_finished()
+            return len(self._sessions)
+
+    def _discard_finished(self):
+        for session_id, session in list(self._sessions.items()):
+            if not session.thread.is_alive():
+                del self._sessions[session_id]
+
+    def open(self, thread, reuse=False):
+        """
+        Create a session for a thread
+
+        :param thread: a debugged thread
+        :type thread: threading.Thread
+        :param reuse: return the existing session of the thread if any
+        :type reuse: bool
+        :return: a session and a flag that indicates if it is new
+        :rtype: tuple
+        """
+        with self._lock:
+            self._discard_finished()
+            session = self._sessions.get(str(thread.ident))
+            if session is not None and session.thread is thread and reuse:
+                return session, False
+            session = DebugSession(thread)
+            self._sessions[session.id] = session
+            return session, True
+
+    def remove(self, session):
+        """
+        Remove a session if it is still registered
+
+        :param session: a session to remove
+        :type session: DebugSession
+        """
+        with self._lock:
+            if self._sessions.get(session.id) is session:
+                del self._sessions[session.id]
+
+    def get(self, session_id=None):
+        """
+        Get a session by ID
+
+        :param session_id: session ID. If ``None`` or there is no such
+            session, the default session is returned: the earliest session
+            that is waiting for a command, otherwise the earliest session.
+        :type session_id: str
+        :return: a session or ``None`` if there are no sessions
+        :rtype: DebugSession
+        """
+        with self._lock:
+            self._discard_finished()
+            session = self._sessions.get(session_id)
+            if session is not None:
+                return session
+            sessions = list(self._sessions.values())
+        for session in sessions:
+            if session.awaiting_command.is_set():
+                return session
+        return sessions[0] if sessions else None
+
+    def list(self):
+        """
+        Get info of all sessions
+
+        :rtype: list
+        """
+        with self._lock:
+            self._discard_finished()
+            return [session.info for session in self._sessions.values()]
@@ -0,0 +1,114 @@
+# Author: Roman Miroshnychenko aka Roman V.M.
+# E-mail: roman1972@gmail.com
+#
+# Copyright (c) 2016 Roman Miroshnychenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Web-UI for browsing exception snapshots saved by :mod:`web_pdb.snapshots`
+
+Usage::
+
+    python -m web_pdb.snapshot_viewer [--host HOST] [--port PORT] [--dir DIR]
+"""
+
+import argparse
+import json
+import logging
+import os
+import socket
+import time
+
+import bottle
+
+from .async_server import AsyncioWsgiServer
+from .snapshots import SNAPSHOTS_DIR_ENV, list_snapshots, load_snapshot
+
+__all__ = ['SnapshotViewerApp']
+
+this_dir = os.path.dirname(os.path.abspath(__file__))
+template_lookup = [os.path.join(this_dir, 'templates')]
+
+
+class SnapshotViewerApp(bottle.Bottle):
+    """
+    Web-UI for browsing saved snapshots
+    """
+    def __init__(self, snapshots_dir):
+        """
+        :param snapshots_dir: the snapshots directory
+        :type snapshots_dir: str
+        """
+        super().__init__()
+        self.snapshots_dir = snapshots_dir
+        self.route('/', callback=self.show_snapshots)
+        self.route('/snapshots', callback=self.get_snapshots)
+        self.route('/snapshot/<snapshot_id>', callback=self.show_snapshot)
+        self.route('/snapshot/<snapshot_id>/json', callback=self.get_snapshot)
+
+    @staticmethod
+    def _render(template_name, **kwargs):
+        return bottle.template(template_name, template_lookup=template_lookup,
+                               format_time=_format_time, **kwargs)
+
+    def _load(self, snapshot_id):
+        snapshot = load_snapshot(self.snapshots_dir, snapshot_id)
+        if snapshot is None:
+            bottle.abort(404, 'Snapshot not found')
+        return snapshot
+
+    def show_snapshots(self):
+        return self._render('snapshots', host=socket.gethostname(),
+                            snapshots=list_snapshots(self.snapshots_dir))
+
+    def get_snapshots(self):
+        bottle.response.content_type = 'application/json'
+        return json.dumps(list_snapshots(self.snapshots_dir))
+
+    def show_snapshot(self, snapshot_id):
+        return self._render('snapshot', snapshot=self._load(snapshot_id))
+
+    def get_snapshot(self, snapshot_id):
+        bottle.response.content_type = 'application/json'
+        return json.dumps(self._load(snapshot_id))
+
+
+def _format_time(timestamp):
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Web-PDB viewer for saved exception snapshots')
+    parser.add_argument('--host', default='', help='hostname or IP-address to listen on')
+    parser.add_argument('--port', type=int, default=5555, help='port to listen on')
+    parser.add_argument('--dir', default=os.environ.get(SNAPSHOTS_DIR_ENV),
+                        required=SNAPSHOTS_DIR_ENV not in os.environ,
+                        help=f'snapshots directory (defaults to {SNAPSHOTS_DIR_ENV} '
+                             f'environment variable)')
+    args = parser.parse_args()
+    logging.critical('Web-PDB: serving snapshots from %s on http://%s:%s',
+                     args.dir, socket.gethostname(), args.port)
+    try:
+        AsyncioWsgiServer(args.host, args.port, SnapshotViewerApp(args.dir)).serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,314 @@
+# Author: Roman Miroshnychenko aka Roman V.M.
+# E-mail: roman1972@gmail.com
+#
+# Copyright (c) 2016 Roman Miroshnychenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Non-blocking exception snapshots
+
+A snapshot captures the frames of an exception traceback with source
+code around the current lines and size-limited representations of local
+and global variables, and is saved to a snapshots directory as a gzipped
+JSON file. The program continues right after a snapshot is saved,
+and saved snapshots can be browsed later with the snapshot viewer::
+
+    python -m web_pdb.snapshot_viewer [--host HOST] [--port PORT] [--dir DIR]
+"""
+
+import gzip
+import json
+import linecache
+import logging
+import os
+import re
+import socket
+import sys
+import threading
+import time
+import traceback
+import types
+import uuid
+from collections import deque
+
+from .reprs import SafeRepr
+
+__all__ = ['SNAPSHOTS_DIR_ENV', 'SnapshotWriter', 'list_snapshots', 'load_snapshot']
+
+SNAPSHOTS_DIR_ENV = 'WEB_PDB_SNAPSHOTS_DIR'
+SNAPSHOT_EXT = '.json.gz'
+
+snapshot_id_re = re.compile(r'^[A-Za-z0-9_-]+$')
+
+
+class SnapshotWriter:  # pylint: disable=too-many-instance-attributes
+    """
+    Captures exception snapshots and saves them to a snapshots directory
+
+    Capturing takes no more than about :attr:`max_capture_time` seconds:
+    variables that are not captured in time are saved as ``...``
+    and the snapshot is marked as truncated. No more than :attr:`rate_limit`
+    snapshots are saved per :attr:`rate_period` seconds, and only
+    the :attr:`max_snapshots` most recent snapshots are kept in the directory.
+    """
+    max_frames = 30
+    source_context = 5
+    max_variables = 100
+    max_repr_length = 500
+    max_traceback_length = 64 * 1024
+    max_capture_time = 0.2
+    rate_limit = 10
+    rate_period = 60.0
+    max_snapshots = 100
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, snapshots_dir):
+        """
+        :param snapshots_dir: the snapshots directory
+        :type snapshots_dir: str
+        """
+        self.snapshots_dir = snapshots_dir
+        self._lock = threading.Lock()
+        self._saved_times = deque()
+        self._dropped = 0
+        self._repr_engine = SafeRepr()
+        self._repr_engine.max_length = self.max_repr_length
+
+    @classmethod
+    def get_instance(cls, snapshots_dir):
+        """
+        Get a writer for the snapshots directory
+
+        Writers are shared so that the rate limit applies to all snapshots
+        saved to the same directory by the process.
+
+        :rtype: SnapshotWriter
+        """
+        with cls._instances_lock:
+            writer = cls._instances.get(snapshots_dir)
+            if writer is None:
+                writer = cls._instances[snapshots_dir] = cls(snapshots_dir)
+            return writer
+
+    def save(self, exc_value, tb):
+        """
+        Capture and save a snapshot of an exception
+
+        This method never raises exceptions so that the program can continue.
+
+        :param exc_value: an exception or ``None`` if only a traceback is known
+        :type exc_value: BaseException
+        :param tb: the exception traceback
+        :type tb: types.TracebackType
+        :return: the path of the saved snapshot or ``None`` if the snapshot
+            has been dropped because of the rate limit or an error
+        :rtype: str
+        """
+        dropped = self._check_rate_limit()
+        if dropped is None:
+            return None
+        try:
+            snapshot = self.capture(exc_value, tb)
+            snapshot['dropped'] = dropped
+            return self._write(snapshot)
+        except Exception:  # pylint: disable=broad-except
+            logging.exception('Web-PDB: unable to save an exception snapshot')
+            return None
+
+    def capture(self, exc_value, tb):
+        """
+        Capture a snapshot of an exception
+
+        :param exc_value: an exception or ``None`` if only a traceback is known
+        :type exc_value: BaseException
+        :param tb: the exception traceback
+        :type tb: types.TracebackType
+        :return: snapshot data
+        :rtype: dict
+        """
+        budget = {'deadline': time.monotonic() + self.max_capture_time, 'truncated': False}
+        created = time.time()
+        entries = list(traceback.walk_tb(tb))
+        if len(entries) > self.max_frames:
+            entries = entries[-self.max_frames:]
+            budget['truncated'] = True
+        modules = {}
+        frames = []
+        for frame, lineno in entries:
+            module = frame.f_globals.get('__name__') or frame.f_code.co_filename
+            if module not in modules:
+                modules[module] = self._get_variables(frame.f_globals, budget)
+            frames.append(self._get_frame(frame, lineno, module, budget))
+        if exc_value is not None:
+            exc_type = type(exc_value).__qualname__
+            exc_text = ''.join(traceback.format_exception(type(exc_value), exc_value, tb))
+        else:
+            exc_type = 'Traceback'
+            exc_text = ''.join(traceback.format_tb(tb))
+        created_str = time.strftime('%Y%m%d-%H%M%S', time.localtime(created))
+        created_str += f'{int(created % 1 * 1000000):06d}'
+        return {
+            'version': 1,
+            'id': f'{created_str}-{os.getpid()}-{uuid.uuid4().hex[:8]}',
+            'time': created,
+            'pid': os.getpid(),
+            'hostname': socket.gethostname(),
+            'argv': sys.argv,
+            'thread': threading.current_thread().name,
+            'exception': {
+                'type': exc_type,
+                'message': str(exc_value or '')[:self.max_repr_length],
+                'traceback': exc_text[-self.max_traceback_length:],
+            },
+            'frames': frames,
+            'globals': modules,
+            'truncated': budget['truncated'],
+        }
+
+    def _get_frame(self, frame, lineno, module, budget):
+        code = frame.f_code
+        lines = linecache.getlines(code.co_filename, frame.f_globals)
+        start = max(lineno - self.source_context, 1)
+        if frame.f_locals is frame.f_globals:
+            # Module-level code
+            local_vars = None
+        else:
+            local_vars = self._get_variables(frame.f_locals, budget)
+        return {
+            'filename': code.co_filename,
+            'name': getattr(code, 'co_qualname', code.co_name),
+            'line': lineno,
+            'source_start': start,
+            'source': [line.rstrip('\r\n')
+                       for line in lines[start - 1:lineno + self.source_context]],
+            'locals': local_vars,
+            'globals': module,
+        }
+
+    def _get_variables(self, raw_vars, budget):
+        """
+        :return: a list of ``[name, type_name, repr]`` items sorted by name
+        """
+        names = sorted(name for name in raw_vars
+                       if not (name.startswith('__') and name.endswith('__'))
+                       and not isinstance(raw_vars[name], types.ModuleType))
+        if len(names) > self.max_variables:
+            names = names[:self.max_variables]
+            budget['truncated'] = True
+        variables = []
+        for name in names:
+            value = raw_vars[name]
+            if time.monotonic() > budget['deadline']:
+                repr_value = '...'
+                budget['truncated'] = True
+            else:
+                try:
+                    repr_value = self._repr_engine.repr(value)
+                except Exception as exc:  # pylint: disable=broad-except
+                    repr_value = f'<repr() failed: {type(exc).__name__}>'
+            variables.append([name, type(value).__name__, repr_value])
+        return variables
+
+    def _check_rate_limit(self):
+        """
+        :return: the number of snapshots dropped since the last saved one
+            or ``None`` if this snapshot must be dropped
+        """
+        now = time.monotonic()
+        with self._lock:
+            while self._saved_times and now - self._saved_times[0] > self.rate_period:
+                self._saved_times.popleft()
+            if len(self._saved_times) >= self.rate_limit:
+                self._dropped += 1
+                return None
+            self._saved_times.append(now)
+            dropped, self._dropped = self._dropped, 0
+            return dropped
+
+    def _write(self, snapshot):
+        os.makedirs(self.snapshots_dir, mode=0o700, exist_ok=True)
+        path = os.path.join(self.snapshots_dir, snapshot['id'] + SNAPSHOT_EXT)
+        temp_path = path + '.tmp'
+        data = json.dumps(snapshot, separators=(',', ':')).encode('utf-8')
+        with open(temp_path, 'wb') as fo:
+            fo.write(gzip.compress(data))
+        os.replace(temp_path, path)
+        for snapshot_id in _list_snapshot_ids(self.snapshots_dir)[:-self.max_snapshots]:
+            try:
+                os.remove(os.path.join(self.snapshots_dir, snapshot_id + SNAPSHOT_EXT))
+            except OSError:
+                pass
+        return path
+
+
+def _list_snapshot_ids(snapshots_dir):
+    try:
+        filenames = os.listdir(snapshots_dir)
+    except OSError:
+        return []
+    # Snapshot IDs start with the time of the snapshot
+    return sorted(filename[:-len(SNAPSHOT_EXT)] for filename in filenames
+                  if filename.endswith(SNAPSHOT_EXT))
+
+
+def load_snapshot(snapshots_dir, snapshot_id):
+    """
+    Load a saved snapshot
+
+    :param snapshots_dir: the snapshots directory
+    :type snapshots_dir: str
+    :param snapshot_id: snapshot ID
+    :type snapshot_id: str
+    :return: snapshot data or ``None`` if the snapshot does not exist
+    :rtype: dict
+    """
+    if not snapshot_id_re.match(snapshot_id):
+        return None
+    try:
+        with gzip.open(os.path.join(snapshots_dir, snapshot_id + SNAPSHOT_EXT)) as fo:
+            return json.load(fo)
+    except (OSError, ValueError, EOFError):
+        return None
+
+
+def list_snapshots(snapshots_dir):
+    """
+    Get summaries of saved snapshots
+
+    :param snapshots_dir: the snapshots directory
+    :type snapshots_dir: str
+    :return: a list of snapshot summaries, the most recent first
+    :rtype: list
+    """
+    summaries = []
+    for snapshot_id in reversed(_list_snapshot_ids(snapshots_dir)):
+        snapshot = load_snapshot(snapshots_dir, snapshot_id)
+        if snapshot is None:
+            continue
+        last_frame = snapshot['frames'][-1] if snapshot['frames'] else {}
+        summaries.append({
+            'id': snapshot['id'],
+            'time': snapshot['time'],
+            'pid': snapshot['pid'],
+            'hostname': snapshot['hostname'],
+            'exception': f"{snapshot['exception']['type']}: {snapshot['exception']['message']}",
+            'location': f"{last_frame.get('filename', '')}:{last_frame.get('line', '')}",
+        })
+    return summaries
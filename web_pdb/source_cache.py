@@ -0,0 +1,111 @@
+# Author: Roman Miroshnychenko aka Roman V.M.
+# E-mail: roman1972@gmail.com
+#
+# Copyright (c) 2016 Roman Miroshnychenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Content-addressed cache of source file listings
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+from threading import RLock
+
+__all__ = ['SourceCache']
+
+
+class SourceCache:
+    """
+    Stores source file listings by the hash of their contents
+
+    Frame data carry only a listing hash so that the web-UI downloads
+    each file only once and then takes it from the browser cache.
+    Least recently used listings are discarded when the total size
+    of stored listings exceeds ``max_size`` characters.
+    """
+    def __init__(self, max_size=16 * 1024 * 1024):
+        """
+        :param max_size: max total size of stored listings in characters
+        :type max_size: int
+        """
+        self._lock = RLock()
+        self._max_size = max_size
+        self._size = 0
+        self._hashes = {}
+        self._listings = OrderedDict()
+
+    def add(self, filename, get_lines):
+        """
+        Add a file listing to the cache
+
+        A listing is not re-read while file modification time and size
+        stay the same.
+
+        :param filename: source file name
+        :type filename: str
+        :param get_lines: a callable that returns a list of file lines
+        :type get_lines: collections.abc.Callable
+        :return: listing hash
+        :rtype: str
+        """
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            key = None
+        else:
+            key = (filename, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            listing_hash = self._hashes.get(key)
+            if listing_hash is not None and listing_hash in self._listings:
+                self._listings.move_to_end(listing_hash)
+                return listing_hash
+        listing = ''.join(get_lines())
+        listing_hash = hashlib.sha1(listing.encode('utf-8')).hexdigest()
+        with self._lock:
+            if key is not None:
+                self._hashes[key] = listing_hash
+            if listing_hash not in self._listings:
+                self._listings[listing_hash] = listing
+                self._size += len(listing)
+                self._evict()
+            return listing_hash
+
+    def get(self, listing_hash):
+        """
+        Get a file listing by its hash
+
+        :param listing_hash: listing hash
+        :type listing_hash: str
+        :return: file listing or ``None`` if the listing is not cached
+        :rtype: str
+        """
+        with self._lock:
+            listing = self._listings.get(listing_hash)
+            if listing is not None:
+                self._listings.move_to_end(listing_hash)
+            return listing
+
+    def _evict(self):
+        while self._size > self._max_size and len(self._listings) > 1:
+            listing_hash, listing = self._listings.popitem(last=False)
+            self._size -= len(listing)
+            for key in [k for k, v in self._hashes.items() if v == listing_hash]:
+                del self._hashes[key]
@@ -0,0 +1,251 @@
+# Author: Roman Miroshnychenko aka Roman V.M.
+# E-mail: roman1972@gmail.com
+#
+# Copyright (c) 2016 Roman Miroshnychenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Short summaries of large objects, e.g. arrays and data frames
+"""
+
+import reprlib
+import sys
+from threading import Lock
+
+__all__ = ['SummarizerRegistry', 'registry', 'register_summarizer']
+
+# The number of items shown at the start and at the end of a sample
+_SAMPLE_SIZE = 3
+
+_sample_repr = reprlib.Repr()
+_sample_repr.maxlevel = 1
+_sample_repr.maxstring = _sample_repr.maxother = 40
+# Rows of data frames are fetched with one extra column so that
+# the omitted columns are shown as "..."
+_sample_repr.maxlist = _sample_repr.maxtuple = _SAMPLE_SIZE
+
+_SIZE_UNITS = ('KiB', 'MiB', 'GiB', 'TiB')
+
+
+class SummarizerRegistry:
+    """
+    Summarizers of objects keyed by type
+
+    A summarizer is a function that takes an object and returns its short
+    representation. Summarizers are looked up along the MRO of an object type,
+    so a summarizer registered for a class also summarizes its subclasses.
+
+    Classes from third-party libraries can be registered by their dotted names,
+    e.g. ``'numpy.ndarray'``. Such names are resolved only after the module
+    appears in :data:`sys.modules`, so the registry never imports the library.
+    """
+    max_cached_types = 1024
+
+    def __init__(self):
+        self._lock = Lock()
+        self._summarizers = {}
+        # Dotted class names that are not resolved yet: {module name: {class name: summarizer}}
+        self._pending = {}
+        self._modules_count = 0
+        self._dispatch = {}
+
+    def register(self, cls, summarizer):
+        """
+        Register a summarizer for a class
+
+        :param cls: a class or its dotted name, e.g. ``'pandas.DataFrame'``
+        :type cls: type or str
+        :param summarizer: a function that takes an object and returns
+            its summary string. ``None`` removes a registered summarizer.
+        :type summarizer: typing.Callable[[object], str]
+        :raises ValueError: if the class name is not a dotted name
+        """
+        with self._lock:
+            if isinstance(cls, str):
+                module_name, _, class_name = cls.rpartition('.')
+                if not module_name or not class_name:
+                    raise ValueError(f'A dotted class name is expected: {cls}')
+                self._pending.setdefault(module_name, {})[class_name] = summarizer
+                self._modules_count = 0
+            else:
+                self._set_summarizer(cls, summarizer)
+
+    def _set_summarizer(self, cls, summarizer):
+        if summarizer is None:
+            self._summarizers.pop(cls, None)
+        else:
+            self._summarizers[cls] = summarizer
+        self._dispatch = {}
+
+    def _resolve_pending(self):
+        with self._lock:
+            self._modules_count = len(sys.modules)
+            for module_name in [name for name in self._pending if name in sys.modules]:
+                module = sys.modules[module_name]
+                names = self._pending[module_name]
+                for class_name, summarizer in list(names.items()):
+                    cls = getattr(module, class_name, None)
+                    # The module may be not initialized completely yet
+                    if isinstance(cls, type):
+                        del names[class_name]
+                        self._set_summarizer(cls, summarizer)
+                if not names:
+                    del self._pending[module_name]
+
+    def get_summarizer(self, cls):
+        """
+        Get a summarizer for a class
+
+        :param cls: a class
+        :type cls: type
+        :return: a summarizer or ``None`` if the class has no summarizer
+        """
+        # Pending names are checked again only after new modules are imported
+        if self._pending and len(sys.modules) != self._modules_count:
+            self._resolve_pending()
+        dispatch = self._dispatch
+        try:
+            return dispatch[cls]
+        except KeyError:
+            pass
+        summarizer = None
+        for base in cls.__mro__:
+            summarizer = self._summarizers.get(base)
+            if summarizer is not None:
+                break
+        if len(dispatch) >= self.max_cached_types:
+            dispatch.clear()
+        dispatch[cls] = summarizer
+        return summarizer
+
+    def summarize(self, obj):
+        """
+        Get a summary of an object
+
+        If a summarizer fails, ``None`` is returned
+        so that the object is represented as usual.
+
+        :param obj: an object
+        :return: a summary or ``None`` if the object has no summarizer
+        :rtype: str
+        """
+        summarizer = self.get_summarizer(type(obj))
+        if summarizer is None:
+            return None
+        try:
+            return summarizer(obj)
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+
+def _format_size(size):
+    if size < 1024:
+        return f'{size} B'
+    unit = ''
+    for unit in _SIZE_UNITS:
+        size /= 1024
+        if size < 1024:
+            break
+    return f'{size:.1f} {unit}'
+
+
+def _format_sample(size, get_item):
+    """
+    Format the first and the last items of a sequence
+
+    :param size: the number of items
+    :type size: int
+    :param get_item: a function that returns an item by its position
+    :type get_item: typing.Callable[[int], object]
+    :rtype: str
+    """
+    if size <= 2 * _SAMPLE_SIZE:
+        positions = list(range(size))
+    else:
+        positions = [*range(_SAMPLE_SIZE), None, *range(size - _SAMPLE_SIZE, size)]
+    items = ('...' if position is None else _sample_repr.repr(get_item(position))
+             for position in positions)
+    return f'[{", ".join(items)}]'
+
+
+def _summarize_ndarray(array):
+    # ndarray.item() returns a Python scalar for a position in the flattened array
+    # without copying the array
+    sample = _format_sample(array.size, array.item)
+    return (f'{type(array).__name__}(shape={array.shape}, dtype={array.dtype}, '
+            f'memory={_format_size(int(array.nbytes))}) {sample}')
+
+
+def _summarize_index(index):
+    sample = _format_sample(len(index), lambda position: index[position:position + 1].tolist()[0])
+    return (f'{type(index).__name__}(shape={index.shape}, dtype={index.dtype}, '
+            f'memory={_format_size(int(index.memory_usage(deep=False)))}) {sample}')
+
+
+def _summarize_series(series):
+    sample = _format_sample(
+        len(series), lambda position: series.iloc[position:position + 1].tolist()[0])
+    memory = _format_size(int(series.memory_usage(index=True, deep=False)))
+    return (f'{type(series).__name__}(name={_sample_repr.repr(series.name)}, '
+            f'shape={series.shape}, dtype={series.dtype}, memory={memory}) {sample}')
+
+
+def _summarize_data_frame(frame):
+    columns = _SAMPLE_SIZE + 1
+    dtypes = ', '.join(f'{dtype}: {count}'
+                       for dtype, count in frame.dtypes.value_counts().items())
+    memory = _format_size(int(frame.memory_usage(index=True, deep=False).sum()))
+    sample = _format_sample(
+        len(frame), lambda position: tuple(frame.iloc[position, :columns].tolist()))
+    return (f'{type(frame).__name__}(shape={frame.shape}, dtypes={{{dtypes}}}, '
+            f'memory={memory}, columns={_sample_repr.repr(frame.columns[:columns].tolist())}) '
+            f'{sample}')
+
+
+registry = SummarizerRegistry()
+registry.register('numpy.ndarray', _summarize_ndarray)
+registry.register('pandas.Index', _summarize_index)
+registry.register('pandas.Series', _summarize_series)
+registry.register('pandas.DataFrame', _summarize_data_frame)
+
+
+def register_summarizer(cls, summarizer):
+    """
+    Register a summarizer that shows objects of a class in Web-PDB
+
+    Summaries replace full representations of objects in the Globals
+    and Locals boxes and in the output of "inspect" command.
+    They should be built in constant time regardless of the object size.
+    Summarizers for NumPy arrays and pandas data frames, series
+    and indexes are registered by default.
+
+    Example::
+
+        web_pdb.register_summarizer(
+            'mylib.Grid', lambda grid: f'Grid({grid.width}x{grid.height})')
+
+    :param cls: a class or its dotted name, e.g. ``'mylib.Grid'``.
+        Dotted names are resolved only after the module is imported
+        by the program being debugged.
+    :type cls: type or str
+    :param summarizer: a function that takes an object and returns its summary
+        string. ``None`` removes a registered summarizer.
+    :type summarizer: typing.Callable[[object], str]
+    """
+    registry.register(cls, summarizer)
@@ -0,0 +1,155 @@
+# Author: Roman Miroshnychenko aka Roman V.M.
+# E-mail: roman1972@gmail.com
+#
+# Copyright (c) 2016 Roman Miroshnychenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Cached listings of variables in namespaces
+"""
+
+import types
+from collections import OrderedDict
+
+__all__ = ['VARIABLE_KINDS', 'get_variable_kind', 'VariableListing']
+
+# Kinds of variables that can be hidden in variable listings
+VARIABLE_KINDS = ('modules', 'functions', 'classes')
+
+_FUNCTION_TYPES = (types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+# Representations of these values do not change while they are bound to a name.
+# Method representations are not cached because they include the instance.
+_IMMUTABLE_TYPES = frozenset((int, float, complex, bool, str, bytes, range,
+                              type(None), type(Ellipsis), types.FunctionType,
+                              types.BuiltinFunctionType))
+
+
+def get_variable_kind(value):
+    """
+    Get the kind of a variable for filtering
+
+    :param value: variable value
+    :return: one of :data:`VARIABLE_KINDS` or ``None`` for other variables
+    :rtype: str
+    """
+    value_type = type(value)
+    if issubclass(value_type, types.ModuleType):
+        return 'modules'
+    if issubclass(value_type, _FUNCTION_TYPES):
+        return 'functions'
+    if issubclass(value_type, type):
+        return 'classes'
+    return None
+
+
+def _is_dunder(name):
+    return name.startswith('__') and name.endswith('__')
+
+
+class VariableListing:
+    """
+    Lists variables of namespaces with cached sorted names and representations
+
+    Sorted names of a namespace are cached until a name is added to it
+    or removed from it. Representations of modules, functions, classes
+    and immutable built-in values are cached by the identity of the value,
+    so they are re-created only after a name is bound to another object.
+    Mutable values may change in place, so they are represented every time.
+    """
+    max_namespaces = 16
+    max_reprs = 10000
+    max_cached_length = 1024
+
+    def __init__(self, get_repr):
+        """
+        :param get_repr: a function that returns a representation of a value
+        :type get_repr: typing.Callable[[object], str]
+        """
+        self._get_repr = get_repr
+        self._indexes = OrderedDict()
+        self._reprs = {}
+
+    def get_names(self, namespace, hidden=(), cache=False):
+        """
+        Get sorted names of variables in a namespace
+
+        Special ``__dunder__`` variables are omitted.
+
+        :param namespace: a namespace mapping
+        :type namespace: collections.abc.Mapping
+        :param hidden: kinds of variables to omit (see :data:`VARIABLE_KINDS`)
+        :type hidden: collections.abc.Container
+        :param cache: cache sorted names of the namespace. Only long-living
+            namespaces, e.g. module globals, should be cached because
+            the cache keeps a reference to them.
+        :type cache: bool
+        :return: sorted variable names
+        :rtype: list
+        """
+        if cache:
+            names = self._get_index(namespace)
+        else:
+            names = sorted(name for name in namespace if not _is_dunder(name))
+        if not hidden:
+            return names
+        return [name for name in names if get_variable_kind(namespace[name]) not in hidden]
+
+    def _get_index(self, namespace):
+        key = id(namespace)
+        entry = self._indexes.get(key)
+        if entry is not None and entry[0] is namespace and entry[1] == namespace.keys():
+            self._indexes.move_to_end(key)
+            return entry[2]
+        names = sorted(name for name in namespace if not _is_dunder(name))
+        self._indexes[key] = (namespace, set(namespace), names)
+        self._indexes.move_to_end(key)
+        if len(self._indexes) > self.max_namespaces:
+            self._indexes.popitem(last=False)
+        return names
+
+    def get_repr(self, value):
+        """
+        Get a representation of a value using the cache if possible
+
+        :param value: a value
+        :return: representation of the value
+        :rtype: str
+        """
+        entry = self._reprs.get(id(value))
+        # The cache holds references to values so their IDs cannot be reused
+        if entry is not None and entry[0] is value:
+            return entry[1]
+        repr_value = self._get_repr(value)
+        if self._is_cacheable(value):
+            if len(self._reprs) >= self.max_reprs:
+                self._reprs.clear()
+            self._reprs[id(value)] = (value, repr_value)
+        return repr_value
+
+    def _is_cacheable(self, value):
+        value_type = type(value)
+        if value_type in (str, bytes):
+            return len(value) <= self.max_cached_length
+        return (value_type in _IMMUTABLE_TYPES
+                or issubclass(value_type, (types.ModuleType, type)))
+
+    def clear(self):
+        """Clear the cache"""
+        self._indexes.clear()
+        self._reprs.clear()
@@ -24,59 +24,410 @@
 File-like web-based input/output console
 """
 
+import atexit
+import json
 import logging
-import queue
+import os
+import socket
 import time
+import uuid
 import weakref
-from socket import gethostname
-from threading import Thread, Event
+from threading import Thread, Event, Lock, Condition, current_thread
+from urllib.parse import parse_qs
 
-from asyncore_wsgi import make_server, AsyncWebSocketHandler
-
-from .buffer import ThreadSafeBuffer
+from .async_server import AsyncioWsgiServer, AsyncioWebSocketHandler
+from .buffer import DebuggerCall
+from .registry import SESSIONS_DIR_ENV, register_session, unregister_session
 from .wsgi_app import app
 
-__all__ = ['WebConsole']
+__all__ = ['WebConsole', 'WebServer']
+
+# Requests updating frame data via the input queue
+REFRESH = object()
+# Wakes up the debugger waiting for a command when the console is closed
+SHUTDOWN = object()
+
+
+def _diff_frame_data(old, new):
+    """
+    Get frame data fields that have changed
+
+    For ``globals`` and ``locals`` only changed and removed variables
+    are included. If there are no previous variables, ``reset`` flag
+    tells clients to replace all variables.
+
+    :param old: previously published frame data
+    :type old: dict
+    :param new: current frame data
+    :type new: dict
+    :return: changed fields
+    :rtype: dict
+    """
+    diff = {}
+    for key, value in new.items():
+        old_value = old.get(key)
+        if key in ('globals', 'locals') and isinstance(old_value, dict):
+            changed = {var: repr_value for var, repr_value in value.items()
+                       if old_value.get(var) != repr_value}
+            removed = [var for var in old_value if var not in value]
+            if changed or removed:
+                diff[key] = {'changed': changed, 'removed': removed}
+        elif key in ('globals', 'locals'):
+            diff[key] = {'changed': value, 'removed': [], 'reset': True}
+        elif value != old_value:
+            diff[key] = value
+    return diff
+
+
+def _broadcast_threads(min_sessions=2):
+    """
+    Send the list of debugging sessions to all clients
+
+    The list is sent only if there are at least ``min_sessions`` sessions,
+    so debugging a single thread does not produce extra messages.
+    """
+    if len(app.sessions) >= min_sessions:
+        WebConsoleSocketBase.broadcast(json.dumps({'threads': app.sessions.list()}))
 
 
-class WebConsoleSocket(AsyncWebSocketHandler):
+class WebConsoleSocketBase:
     """
-    WebConsoleSocket receives PDB commands from the front-end and
-    sends pings to client(s) about console updates
+    WebConsoleSocketBase receives PDB commands from the front-end and
+    sends updates to clients
+
+    This is the server-independent part of WebSocket handlers.
+    Each client is bound to the debugging session selected by ``thread``
+    query parameter of the WebSocket URL when it connects. A client
+    connected with ``observer`` query parameter is in observer view mode:
+    it receives updates but its commands are ignored. The view mode
+    is chosen by the client, so it is not an access control mechanism. Optional ``keys``
+    query parameter is a comma-separated list of frame data keys
+    the client is subscribed to, so other keys are not built for it.
+
+    A broadcast message is encoded once for all clients. Each client
+    has a bounded queue of unsent messages: a client that lags behind
+    with :attr:`max_queued_messages` messages in its queue stops receiving
+    updates, and when its queue is drained, it gets a single ``resync``
+    message instead of the skipped updates, so it downloads the latest
+    frame data snapshot.
+
+    Server-specific subclasses provide ``prepareMessage(data)``,
+    ``sendPrepared(message)`` and ``queued_messages()`` methods.
     """
-    clients = []
-    input_queue = queue.Queue()
+    clients = ()
+    max_queued_messages = 64
+    messages_sent = Condition()
+    waker = None
+    data = None
+    query = ''
+    session = None
+    observer = False
+    keys = None
+    _clients_lock = Lock()
+    _send_lock = None
+    _lagging = False
 
     @classmethod
-    def broadcast(cls, msg):
+    def broadcast(cls, msg, session=None):
+        """
+        Send a message to clients
+
+        This method can be called from any thread.
+
+        :param msg: a message
+        :type msg: str
+        :param session: if set, only clients of this session receive the message
+        :type session: web_pdb.sessions.DebugSession
+        """
+        message = None
+        # The tuple of clients is replaced, not modified, so it can be iterated safely
         for cl in cls.clients:
-            if cl.handshaked:
-                cl.sendMessage(msg)  # sendMessage uses deque so it is thread-safe
+            if cl.handshaked and (session is None or cl.session is session):
+                if message is None:
+                    message = cl.prepareMessage(msg)
+                cl._queue_message(message)  # pylint: disable=protected-access
+        if cls.waker is not None:
+            cls.waker.wake()
+
+    @classmethod
+    def has_clients(cls, session):
+        return any(cl.session is session for cl in cls.clients)
+
+    @classmethod
+    def subscribed_keys(cls, session):
+        """
+        Get frame data keys that clients of a session are subscribed to
+
+        :param session: a debugging session
+        :type session: web_pdb.sessions.DebugSession
+        :return: a set of keys or ``None`` if some client needs all keys
+        :rtype: set
+        """
+        keys = set()
+        for cl in cls.clients:
+            if cl.session is session:
+                if cl.keys is None:
+                    return None
+                keys.update(cl.keys)
+        return keys
+
+    @classmethod
+    def has_pending_messages(cls):
+        return any(cl.queued_messages() for cl in cls.clients if cl.handshaked)
+
+    @classmethod
+    def wait_sent(cls, timeout):
+        """
+        Wait until all queued messages are sent to clients
+
+        :param timeout: timeout in seconds
+        :type timeout: float
+        :return: ``False`` if some messages have not been sent in time
+        :rtype: bool
+        """
+        with cls.messages_sent:
+            return cls.messages_sent.wait_for(
+                lambda: not cls.has_pending_messages(), timeout)
+
+    def _queue_message(self, message):
+        # pylint: disable=no-member
+        with self._send_lock:
+            if self._lagging or self.queued_messages() >= self.max_queued_messages:
+                self._lagging = True
+            else:
+                self.sendPrepared(message)
+
+    def _resync(self):
+        """
+        Let a lagging client know that it has skipped updates
+        """
+        # pylint: disable=no-member
+        with self._send_lock:
+            if not self._lagging or self.queued_messages():
+                return
+            self._lagging = False
+            self.sendMessage(json.dumps({'resync': True}))
+            if len(app.sessions) > 1:
+                self.sendMessage(json.dumps({'threads': app.sessions.list()}))
+
+    def _notify_sent(self):
+        if self._lagging:
+            self._resync()
+        with self.messages_sent:
+            self.messages_sent.notify_all()
 
     def handleConnected(self):
-        self.clients.append(self)
+        query = parse_qs(self.query, keep_blank_values=True)
+        self.session = app.sessions.get(query.get('thread', [None])[0])
+        self.observer = 'observer' in query
+        if 'keys' in query:
+            self.keys = frozenset(query['keys'][0].split(','))
+        self._send_lock = Lock()
+        with self._clients_lock:
+            WebConsoleSocketBase.clients = (*self.clients, self)
+        if len(app.sessions) > 1:
+            self.sendMessage(json.dumps({'threads': app.sessions.list()}))
+        if self.session is not None:
+            self.session.input_queue.put(REFRESH)
 
     def handleMessage(self):
-        self.input_queue.put(self.data)
+        if self.session is not None and not self.observer:
+            self.session.input_queue.put(self.data)
 
     def handleClose(self):
-        self.clients.remove(self)
+        with self._clients_lock:
+            WebConsoleSocketBase.clients = tuple(cl for cl in self.clients if cl is not self)
+        self._notify_sent()
+
+
+class AsyncioWebConsoleSocket(WebConsoleSocketBase, AsyncioWebSocketHandler):
+    """
+    WebSocket handler for asyncio-based web-server
+    """
+    def queued_messages(self):
+        return self.sendq
+
+    def handleSent(self):
+        self._notify_sent()
+
+
+class WebServer:  # pylint: disable=too-many-instance-attributes
+    """
+    Web-UI server running in a background thread
+
+    :attr:`backend` selects the server implementation: ``'asyncio'`` or
+    ``'asyncore'``. One server is shared by debugging sessions of all threads
+    of the process and stops when the last session detaches from it.
+    A persistent server keeps running with its connected clients
+    for the life of the process.
+
+    If :attr:`gateway_dir` or ``WEB_PDB_GATEWAY_DIR`` environment variable
+    is set, the server listens on a Unix socket in that directory instead
+    of ``host`` and ``port`` and is accessed through the gateway
+    (see :mod:`web_pdb.gateway`). Gateway mode always uses
+    the ``'asyncio'`` backend.
+    """
+    shared_instance = None
+    gateway_dir = None
+    _shared_lock = Lock()
 
+    def __init__(self, host, port, backend='asyncio'):
+        self.host = host
+        self.port = port
+        self.persistent = False
+        self._users = 0
+        self._stop = Event()
+        self._asyncio_server = None
+        self._gateway_dir = self.gateway_dir or os.environ.get(SESSIONS_DIR_ENV)
+        self.session_id = None
+        if backend == 'asyncio' or self._gateway_dir:
+            self._asyncio_server = AsyncioWsgiServer(
+                host, port, app, ws_handler_class=AsyncioWebConsoleSocket)
+        self._thread = Thread(target=self._run, name='web-pdb-server', daemon=True)
+        if self._gateway_dir:
+            self.session_id = f'{os.getpid()}-{uuid.uuid4().hex[:8]}'
+            self._asyncio_server.unix_path = register_session(self._gateway_dir,
+                                                              self.session_id)
+            atexit.register(unregister_session, self._gateway_dir, self.session_id)
+            logging.critical('Web-PDB: starting web-server for gateway session %s',
+                             self.session_id)
+        else:
+            logging.critical(
+                'Web-PDB: starting web-server on http://%s:%s', socket.gethostname(), port)
+        self._thread.start()
+
+    @classmethod
+    def acquire(cls, host, port, backend='asyncio', persistent=False):
+        """
+        Attach to the shared server creating it if necessary
+
+        Only one server exists in a process so ``host``, ``port``
+        and ``backend`` are used only when the server is created.
+        Each :meth:`acquire` call must be paired with :meth:`release`.
+
+        :param persistent: keep the server running after all sessions
+            have detached from it
+        :type persistent: bool
+        :rtype: WebServer
+        """
+        with cls._shared_lock:
+            if cls.shared_instance is None or not cls.shared_instance.is_running:
+                cls.shared_instance = cls(host, port, backend)
+            server = cls.shared_instance
+            server.persistent = server.persistent or persistent
+            server._users += 1  # pylint: disable=protected-access
+            return server
+
+    def release(self):
+        """
+        Detach from the server stopping it if it is not used anymore
+        """
+        with self._shared_lock:
+            self._users -= 1
+            if self._users > 0 or self.persistent:
+                return
+            if WebServer.shared_instance is self:
+                WebServer.shared_instance = None
+            self.stop()
+
+    @property
+    def is_running(self):
+        return self._thread.is_alive() and not self._stop.is_set()
+
+    def _run(self):
+        # Static files are loaded while the server starts listening
+        Thread(target=app.preload, name='web-pdb-preload', daemon=True).start()
+        if self._asyncio_server is not None:
+            self._asyncio_server.serve_forever()
+            return
+        # asyncore_wsgi imports a large part of the standard library,
+        # so the asyncore backend is imported only when it is used
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from .asyncore_server import serve
+        serve(self.host, self.port, self._stop)
 
-class WebConsole:
+    def stop(self):
+        """
+        Stop the server and wait for its thread to finish
+        """
+        logging.critical('Web-PDB: stopping web-server...')
+        self._stop.set()
+        app.profiler.stop()
+        if self._asyncio_server is not None:
+            self._asyncio_server.shutdown()
+        waker = WebConsoleSocketBase.waker
+        if waker is not None:
+            waker.wake()
+        self._thread.join()
+        if self.session_id is not None:
+            unregister_session(self._gateway_dir, self.session_id)
+        logging.critical('Web-PDB: web-server stopped.')
+
+
+class WebConsole:  # pylint: disable=too-many-instance-attributes
     """
     A file-like class for exchanging data between PDB and the web-UI
+
+    Console output is stored in the history immediately but sent to clients
+    in batches: when :attr:`output_batch_size` characters
+    or :attr:`output_batch_lines` lines are accumulated, on PDB prompts,
+    on :meth:`flush` calls or :attr:`output_delay` seconds after
+    the first write, whichever comes first. This way programs that write
+    a lot of small chunks to redirected standard streams are not slowed down
+    by sending each chunk separately.
+
+    The web-server runs in a separate thread. :attr:`server_backend`
+    selects its implementation: ``'asyncio'`` (default) or ``'asyncore'``.
+    Consoles of different threads have independent debugging sessions
+    with their own input queues, console histories and frame data,
+    and share one web-server.
+    If ``persistent`` is ``True``, the console attaches to the persistent
+    server that is not stopped when the console is closed, and
+    the console history and frame data updates of the thread continue
+    from the previous session so connected clients stay in sync.
     """
-    def __init__(self, host, port, debugger):
+    server_backend = 'asyncio'
+    history_max_size = 1024 * 1024
+    history_max_lines = 10000
+    flush_timeout = 1.0
+    output_batch_size = 16 * 1024
+    output_batch_lines = 100
+    output_delay = 0.05
+
+    def __init__(self, host, port, debugger, persistent=False):
+        # Sessions attached to a running persistent server are persistent too
+        server = WebServer.shared_instance
+        persistent = persistent or (server is not None and server.persistent)
         self._debugger = weakref.proxy(debugger)
-        self._console_history = ThreadSafeBuffer('')
-        self._frame_data = None
+        self._session, is_new = app.sessions.open(current_thread(), reuse=persistent)
+        self._console_history = self._session.console_history
+        self._console_history.max_size = self.history_max_size
+        self._console_history.max_lines = self.history_max_lines
+        self._frame_data = self._session.frame_data
+        self._session.frame_data_keys = debugger.frame_data_keys
+        previous = None if is_new else self._frame_data.contents
+        if previous:
+            self._last_frame_data = {key: value for key, value in previous.items()
+                                     if key not in ('seq', 'session', 'thread')}
+            self._seq = previous['seq']
+            self._session_id = previous['session']
+        else:
+            self._last_frame_data = {}
+            self._seq = 0
+            self._session_id = uuid.uuid4().hex
+        self._publish_lock = Lock()
         self._stop_all = Event()
-        self._server_thread = Thread(target=self._run_server, args=(host, port))
-        self._server_thread.daemon = True
-        logging.critical(
-            'Web-PDB: starting web-server on http://%s:%s', gethostname(), port)
-        self._server_thread.start()
+        self._output_cond = Condition()
+        self._output_start = None
+        self._output_lines = 0
+        self._frame_data_update = None
+        self._output_thread = Thread(target=self._run_output_timer, name='web-pdb-output',
+                                     daemon=True)
+        self._output_thread.start()
+        self._persistent = persistent
+        self._server = WebServer.acquire(host, port, self.server_backend, persistent)
+        if is_new:
+            _broadcast_threads()
 
     @property
     def seekable(self):
@@ -94,62 +445,169 @@ class WebConsole:
     def closed(self):
         return self._stop_all.is_set()
 
-    def _run_server(self, host, port):
-        self._frame_data = app.frame_data
-        httpd = make_server(host, port, app, ws_handler_class=WebConsoleSocket)
+    @property
+    def source_cache(self):
+        return app.source_cache
+
+    @property
+    def session(self):
+        """The debugging session of the console"""
+        return self._session
+
+    def _set_awaiting_command(self, awaiting):
+        if awaiting:
+            self._session.awaiting_command.set()
+        else:
+            self._session.awaiting_command.clear()
+        # Let clients of other sessions know which threads are paused
+        _broadcast_threads()
+
+    def _run_output_timer(self):
+        """
+        Send buffered console output not later than :attr:`output_delay`
+        after it has been written, and send frame data updates
+
+        Frame data are diffed against the previous update and encoded
+        in this thread, so the debugged thread only builds them.
+        """
+        deadline = None
         while not self._stop_all.is_set():
-            try:
-                httpd.handle_request()
-            except (KeyboardInterrupt, SystemExit):
-                break
-        httpd.handle_close()
+            with self._output_cond:
+                if deadline is None and self._output_start is not None:
+                    deadline = time.monotonic() + self.output_delay
+                timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+                self._output_cond.wait_for(
+                    lambda: (self._frame_data_update is not None or self._stop_all.is_set()
+                             or (deadline is None and self._output_start is not None)),
+                    timeout)
+                frame_data, self._frame_data_update = self._frame_data_update, None
+            if frame_data is not None:
+                self._publish(frame_data=frame_data)
+            if deadline is not None and time.monotonic() >= deadline:
+                deadline = None
+                self._publish_output()
 
     def readline(self):
-        while not self._stop_all.is_set():
-            try:
-                data = WebConsoleSocket.input_queue.get(timeout=0.1)
+        # PDB waits for a command so it is a good moment to update frame data
+        self._publish_output()
+        self._publish_frame_data()
+        self._set_awaiting_command(True)
+        while True:
+            if self._stop_all.is_set():
+                data = '\n'  # Empty string causes BdbQuit exception.
                 break
-            except queue.Empty:
-                continue
-        else:
-            data = '\n'  # Empty string causes BdbQuit exception.
+            data = self._session.input_queue.get()
+            if isinstance(data, DebuggerCall):
+                data.run(self._debugger)
+                # Calls may change frame data, e.g. breakpoints
+                self._publish_frame_data()
+            elif data is REFRESH:
+                self._publish_frame_data()
+            elif data is not SHUTDOWN:
+                break
+        self._set_awaiting_command(False)
         self.writeline(data)
         return data
 
     read = readline
 
     def writeline(self, data):
-        self._console_history.contents += data
+        with self._output_cond:
+            end = self._console_history.append(data)
+            if self._output_start is None:
+                self._output_start = end - len(data)
+                self._output_cond.notify()
+            self._output_lines += data.count('\n')
+            if (end - self._output_start >= self.output_batch_size
+                    or self._output_lines >= self.output_batch_lines):
+                self._publish_output()
+
+    write = writeline
+
+    def _publish_output(self):
+        """
+        Push buffered console output to clients
+        """
+        with self._output_cond:
+            if self._output_start is None:
+                return
+            start, data = self._console_history.read(self._output_start)
+            self._output_start = None
+            self._output_lines = 0
+            self._publish(console={'start': start, 'data': data})
+
+    def _publish_frame_data(self):
+        """
+        Build frame data and pass them to the output thread that sends
+        their changes to clients
+
+        Only the frame data keys that clients are subscribed to are built,
+        and frame data are not built at all if no clients are connected.
+        A newly connected client requests a refresh via the input queue.
+        """
+        if not WebConsoleSocketBase.has_clients(self._session):
+            return
+        keys = WebConsoleSocketBase.subscribed_keys(self._session)
+        if keys is not None:
+            keys = [key for key in self._debugger.frame_data_keys if key in keys]
         try:
-            frame_data = self._debugger.get_current_frame_data()
+            frame_data = self._debugger.get_current_frame_data(keys)
         except (IOError, AttributeError):
             frame_data = {
                 'dirname': '',
                 'filename': '',
-                'file_listing': 'No data available',
+                'file_hash': '',
                 'current_line': -1,
                 'breakpoints': [],
-                'globals': 'No data available',
-                'locals': 'No data available'
+                'logpoints': [],
+                'globals': {},
+                'locals': {},
+                'hidden_variables': sorted(self._debugger.hidden_variables),
             }
-        frame_data['console_history'] = self._console_history.contents
-        self._frame_data.contents = frame_data
-        WebConsoleSocket.broadcast('ping')  # Ping all clients about data update
+            if keys is not None:
+                frame_data = {key: value for key, value in frame_data.items() if key in keys}
+        with self._output_cond:
+            self._frame_data_update = frame_data
+            self._output_cond.notify()
 
-    write = writeline
+    def _publish(self, frame_data=None, console=None):
+        """
+        Push frame data changes and/or new console output to clients
+
+        Each update carries a sequence number so that clients can detect
+        missed updates and re-download a full snapshot from ``/frame-data``.
+        """
+        with self._publish_lock:
+            update = {}
+            if frame_data is not None:
+                update = _diff_frame_data(self._last_frame_data, frame_data)
+                self._last_frame_data = frame_data
+            if console is not None:
+                update['console'] = console
+            if not update:
+                return
+            self._seq += 1
+            update['seq'] = self._seq
+            self._frame_data.contents = dict(self._last_frame_data, seq=self._seq,
+                                             session=self._session_id,
+                                             thread=self._session.id)
+            WebConsoleSocketBase.broadcast(json.dumps(update), self._session)
 
     def flush(self):
         """
-        Wait until history is read but no more than 10 cycles
-        in case a browser session is closed.
+        Send buffered console output to clients and wait until it is sent
+        but no more than :attr:`flush_timeout` in case a browser session is closed
         """
-        i = 0
-        while self._frame_data.is_dirty and i < 10:
-            i += 1
-            time.sleep(0.1)
+        self._publish_output()
+        WebConsoleSocketBase.wait_sent(self.flush_timeout)
 
     def close(self):
-        logging.critical('Web-PDB: stopping web-server...')
+        self.flush()
         self._stop_all.set()
-        self._server_thread.join()
-        logging.critical('Web-PDB: web-server stopped.')
+        with self._output_cond:
+            self._output_cond.notify()
+        self._session.input_queue.put(SHUTDOWN)
+        if not self._persistent:
+            app.sessions.remove(self._session)
+            _broadcast_threads(min_sessions=1)
+        self._server.release()
@@ -25,22 +25,39 @@ Web-UI WSGI application
 """
 
 import gzip
+import hashlib
 import json
+import mimetypes
 import os
 from functools import wraps
-from io import BytesIO
+from threading import Lock
 
 import bottle
 
-from .buffer import ThreadSafeBuffer
+from .breakpoints import get_breakpoint_info
+from .buffer import DebuggerCall
+from .profiler import SamplingProfiler
+from .sessions import SessionRegistry
+from .source_cache import SourceCache
 
 __all__ = ['app']
 
 # bottle.debug(True)
 
 this_dir = os.path.dirname(os.path.abspath(__file__))
-bottle.TEMPLATE_PATH.append(os.path.join(this_dir, 'templates'))
+# Bottle caches compiled templates by the identity of the lookup list
+template_lookup = [os.path.join(this_dir, 'templates')]
 static_path = os.path.join(this_dir, 'static')
+compressible_types = ('text/', 'application/javascript', 'image/svg+xml', 'font/ttf')
+
+
+def _accepts_gzip():
+    # pylint: disable=no-member
+    return 'gzip' in bottle.request.headers.get('Accept-Encoding', '')
+
+
+def _should_compress(data):
+    return isinstance(data, bytes) and len(data) >= app.compress_min_size
 
 
 def compress(func):
@@ -50,44 +67,574 @@ def compress(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
         result = func(*args, **kwargs)
-        # pylint: disable=no-member
-        if ('gzip' in bottle.request.headers.get('Accept-Encoding', '') and
-                isinstance(result, str) and
-                len(result) > 1024):
-            if isinstance(result, str):
-                result = result.encode('utf-8')
-            tmp_fo = BytesIO()
-            with gzip.GzipFile(mode='wb', fileobj=tmp_fo) as gzip_fo:
-                gzip_fo.write(result)
-            result = tmp_fo.getvalue()
-            bottle.response.add_header('Content-Encoding', 'gzip')
+        if isinstance(result, str):
+            result = result.encode('utf-8')
+        if _should_compress(result):
+            bottle.response.add_header('Vary', 'Accept-Encoding')
+            if _accepts_gzip():
+                result = gzip.compress(result, app.compress_level)
+                bottle.response.add_header('Content-Encoding', 'gzip')
         return result
     return wrapper
 
 
+def cached(get_version=None):
+    """
+    Cache route return data and its compressed form per data version
+
+    Several clients requesting the same version of data share one
+    encoding and compression. The version is also used as an ETag so
+    conditional requests with a matching ``If-None-Match`` header
+    get ``304 Not Modified`` response.
+
+    :param get_version: a callable that returns the current data version.
+        If ``None``, data are considered immutable during the process
+        lifetime and the ETag is calculated from their contents.
+    :type get_version: collections.abc.Callable
+    """
+    def decorator(func):
+        cache = {}
+        lock = Lock()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            # pylint: disable=no-member
+            version = get_version() if get_version is not None else None
+            key = (bottle.request.path, bottle.request.query_string)
+            with lock:
+                entry = cache.get(key)
+                if entry is None or entry['version'] != version:
+                    if len(cache) >= 32:
+                        cache.clear()
+                    entry = _make_cache_entry(func(*args, **kwargs), version)
+                    cache[key] = entry
+                if _should_compress(entry['body']):
+                    bottle.response.add_header('Vary', 'Accept-Encoding')
+                    if _accepts_gzip():
+                        if entry['gzip_body'] is None:
+                            entry['gzip_body'] = gzip.compress(entry['body'],
+                                                               app.compress_level)
+                        body = entry['gzip_body']
+                        bottle.response.add_header('Content-Encoding', 'gzip')
+                    else:
+                        body = entry['body']
+                else:
+                    body = entry['body']
+            bottle.response.set_header('ETag', entry['etag'])
+            bottle.response.set_header('Cache-Control', 'no-cache')
+            if entry['content_type']:
+                bottle.response.content_type = entry['content_type']
+            if entry['etag'] in bottle.request.headers.get('If-None-Match', ''):
+                bottle.response.status = 304
+                return b''
+            return body
+        return wrapper
+    return decorator
+
+
+def _make_cache_entry(body, version):
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    if version is None:
+        version = hashlib.sha1(body).hexdigest()
+    return {
+        'version': version,
+        'etag': f'"{version}"',
+        'content_type': bottle.response.content_type,
+        'body': body,
+        'gzip_body': None,
+    }
+
+
+def _get_session():
+    """
+    Get the debugging session selected by ``thread`` query parameter
+
+    :return: a session or ``None`` if there are no sessions
+    :rtype: web_pdb.sessions.DebugSession
+    """
+    return app.sessions.get(bottle.request.query.get('thread'))  # pylint: disable=no-member
+
+
+def _call_debugger(func):
+    """
+    Call a function in the debugger thread of the selected session
+
+    The debugger executes the call only while it waits for a command,
+    otherwise ``409 Conflict`` response is returned.
+
+    :param func: a function that receives the debugger instance
+    :type func: collections.abc.Callable
+    :return: the function result
+    """
+    session = _get_session()
+    if session is None or not session.awaiting_command.is_set():
+        raise bottle.HTTPError(409, 'The program is running')
+    call = DebuggerCall(func)
+    session.input_queue.put(call)
+    try:
+        return call.wait(app.debugger_call_timeout)
+    except TimeoutError as exc:
+        raise bottle.HTTPError(409, 'The program is running') from exc
+
+
+def _json_response(data):
+    bottle.response.set_header('Cache-Control', 'no-store')
+    bottle.response.content_type = 'application/json'
+    return json.dumps(data)
+
+
+def _get_frame_data_version():
+    session = _get_session()
+    snapshot = (session.frame_data.contents if session is not None else None) or {}
+    session = snapshot.get('session', '')
+    seq = snapshot.get('seq', 0)
+    return f'{session}-{seq}'
+
+
+def _find_static_files():
+    """
+    Find static files
+
+    :return: file system paths by URL paths, largest files first
+    :rtype: dict
+    """
+    paths = []
+    for dirpath, _, filenames in os.walk(static_path):
+        paths.extend(os.path.join(dirpath, filename) for filename in filenames)
+    paths.sort(key=os.path.getsize, reverse=True)
+    return {os.path.relpath(path, static_path).replace(os.sep, '/'): path for path in paths}
+
+
+def _load_static_file(path, compress_level):
+    with open(path, 'rb') as fo:
+        body = fo.read()
+    content_type, _ = mimetypes.guess_type(path)
+    content_type = content_type or 'application/octet-stream'
+    gzip_body = None
+    if content_type.startswith(compressible_types):
+        gzip_body = gzip.compress(body, compress_level)
+    if content_type.startswith('text/'):
+        content_type += '; charset=utf-8'
+    return {
+        'etag': f'"{hashlib.sha1(body).hexdigest()}"',
+        'content_type': content_type,
+        'body': body,
+        'gzip_body': gzip_body,
+    }
+
+
 class WebConsoleApp(bottle.Bottle):
+    console_tail_size = 64 * 1024
+    compress_level = 6
+    compress_min_size = 1024
+    vars_page_size = 100
+    vars_max_page_size = 1000
+    debugger_call_timeout = 5.0
+
     def __init__(self):
         super().__init__()
-        self.frame_data = ThreadSafeBuffer()
+        self.sessions = SessionRegistry()
+        self.source_cache = SourceCache()
+        self.profiler = SamplingProfiler()
+        self._static_paths = _find_static_files()
+        self._static_files = {}
+
+    def preload(self):
+        """
+        Load the web-UI page template and static files into memory
+
+        Static files are read and compressed only once so that
+        the web-UI page load does not wait for disk access
+        and compression of the front-end bundle.
+        """
+        bottle.template('index', template_lookup=template_lookup)
+        for path in self._static_paths:
+            self.get_static_file(path)
+
+    def get_static_file(self, path):
+        """
+        Get a static file loading it into memory if necessary
+
+        :param path: file path relative to the static files directory
+        :type path: str
+        :return: file data or ``None`` if the file does not exist
+        :rtype: dict
+        """
+        static_file = self._static_files.get(path)
+        if static_file is None and path in self._static_paths:
+            static_file = _load_static_file(self._static_paths[path], self.compress_level)
+            self._static_files[path] = static_file
+        return static_file
 
 
 app = WebConsoleApp()
 
 
+@app.hook('before_request')
+def check_observer():
+    """
+    Reject requests of observer view mode that change the debugger state
+
+    Clients in observer view mode add ``observer`` query parameter
+    to their requests. The view mode is chosen by a client, so this check
+    only prevents accidental commands and is not an access control mechanism.
+    """
+    observer = bottle.request.query.get('observer')  # pylint: disable=no-member
+    if observer is not None and bottle.request.method not in ('GET', 'HEAD'):
+        raise bottle.HTTPError(403, 'The debugger cannot be controlled in observer view mode')
+
+
 @app.route('/')
-@compress
+@cached()
 def root():
-    return bottle.template('index')
+    return bottle.template('index', template_lookup=template_lookup)
+
+
+def _get_frame_data_keys():
+    keys = bottle.request.query.get('keys')  # pylint: disable=no-member
+    return keys.split(',') if keys is not None else None
+
+
+def _build_missing_frame_data(session, keys=None):
+    """
+    Build frame data keys that are missing in the published snapshot
+
+    Keys that no WebSocket client is subscribed to are not published,
+    so they are built on request in the debugger thread.
+    If the program is running, missing keys are left out.
+
+    :param session: a debugging session
+    :type session: web_pdb.sessions.DebugSession
+    :param keys: requested keys. If ``None``, all keys are requested.
+    :type keys: list
+    :return: built frame data
+    :rtype: dict
+    """
+    if session is None:
+        return {}
+    snapshot = session.frame_data.contents or {}
+    missing = [key for key in session.frame_data_keys
+               if key not in snapshot and (keys is None or key in keys)]
+    if not missing:
+        return {}
+    try:
+        return _call_debugger(lambda debugger: debugger.get_current_frame_data(missing))
+    except (bottle.HTTPError, IOError, AttributeError):
+        return {}
+
+
+def _dump_frame_data(session, keys, built=None):
+    """
+    Serialize published frame data and the keys built on request
+
+    :param session: a debugging session or ``None``
+    :type session: web_pdb.sessions.DebugSession
+    :param keys: frame data keys to include. If ``None``, all keys are included.
+    :type keys: list
+    :param built: frame data built on request
+    :type built: dict
+    :return: JSON string
+    :rtype: str
+    """
+    snapshot = (session.frame_data.contents if session is not None else None) or {'seq': 0}
+    if keys is not None:
+        frame_data = {key: snapshot[key] for key in keys if key in snapshot}
+        frame_data['seq'] = snapshot['seq']
+    else:
+        frame_data = dict(snapshot)
+    frame_data.update(built or {})
+    if (keys is None or 'console' in keys) and session is not None:
+        start, data = session.console_history.tail(app.console_tail_size)
+        frame_data['console'] = {'start': start, 'data': data}
+    elif keys is None or 'console' in keys:
+        frame_data['console'] = {'start': 0, 'data': ''}
+    return json.dumps(frame_data)
+
+
+@cached(_get_frame_data_version)
+def _get_published_frame_data():
+    bottle.response.content_type = 'application/json'
+    return _dump_frame_data(_get_session(), _get_frame_data_keys())
 
 
-@app.route('/frame-data')
 @compress
+def _get_built_frame_data(session, keys, built):
+    bottle.response.set_header('Cache-Control', 'no-store')
+    bottle.response.content_type = 'application/json'
+    return _dump_frame_data(session, keys, built)
+
+
+@app.route('/frame-data')
 def get_frame_data():
-    bottle.response.cache_control = 'no-store'
+    """
+    Get a snapshot of frame data
+
+    Optional ``keys`` query parameter is a comma-separated list
+    of frame data keys to include in the snapshot. Optional ``thread``
+    query parameter selects a debugging session.
+
+    Published frame data are cached per version. Keys that have not been
+    published are built only if they are requested, and such responses
+    are not cached because their version is not tracked.
+    """
+    session = _get_session()
+    keys = _get_frame_data_keys()
+    built = _build_missing_frame_data(session, keys)
+    if built:
+        return _get_built_frame_data(session, keys, built)
+    return _get_published_frame_data()
+
+
+@app.route('/threads')
+def get_threads():
+    """
+    Get debugging sessions of threads
+    """
+    return _json_response(app.sessions.list())
+
+
+@app.route('/console-history')
+@compress
+def get_console_history():
+    """
+    Get a range of console history
+
+    Query parameters ``start`` and ``end`` are character offsets
+    from the beginning of the debugging session. If omitted,
+    all retained history is returned.
+    """
+    # pylint: disable=no-member
+    session = _get_session()
+    if session is None:
+        bottle.abort(404, 'No debugging sessions')
+    start = bottle.request.query.get('start', type=int)
+    end = bottle.request.query.get('end', type=int)
+    start, data = session.console_history.read(start, end)
+    bottle.response.set_header('Cache-Control', 'no-store')
+    bottle.response.content_type = 'application/json'
+    return json.dumps({
+        'start': start,
+        'end': start + len(data),
+        'first': session.console_history.start,
+        'data': data,
+    })
+
+
+@app.route('/vars')
+@compress
+def get_variables():
+    """
+    Get a variable from the current frame with a page of its children
+
+    Query parameters:
+
+    * ``scope`` -- ``globals`` or ``locals``.
+    * ``path`` -- a comma-separated variable name followed by positions
+      of nested children. If omitted, the scope itself is returned
+      with variables as its children.
+    * ``offset`` and ``limit`` -- a range of children to return.
+    * ``thread`` -- a debugging session.
+
+    Variables are accessed in the debugger thread and only
+    while it waits for a command.
+    """
+    # pylint: disable=no-member
+    scope = bottle.request.query.get('scope', 'locals')
+    if scope not in ('globals', 'locals'):
+        bottle.abort(400, f'Invalid scope: {scope}')
+    path = [item for item in bottle.request.query.get('path', '').split(',') if item]
+    try:
+        path[1:] = [int(item) for item in path[1:]]
+    except ValueError:
+        bottle.abort(400, 'Invalid variable path')
+    offset = max(bottle.request.query.get('offset', 0, type=int), 0)
+    limit = bottle.request.query.get('limit', app.vars_page_size, type=int)
+    limit = min(max(limit, 0), app.vars_max_page_size)
+    try:
+        result = _call_debugger(
+            lambda debugger: debugger.get_variable(scope, path, offset, limit))
+    except (KeyError, IndexError):
+        bottle.abort(404, 'Variable not found')
+    return _json_response(result)
+
+
+@app.put('/variable-filters')
+def set_variable_filters():
+    """
+    Set kinds of variables that are hidden in Globals and Locals
+
+    The request body is a JSON object with ``hidden`` list
+    of variable kinds: ``modules``, ``functions`` and/or ``classes``.
+    """
+    hidden = _get_json_body().get('hidden')
+    if not isinstance(hidden, list) or not all(isinstance(kind, str) for kind in hidden):
+        bottle.abort(400, 'A list of variable kinds is expected')
+    try:
+        result = _call_debugger(lambda debugger: debugger.set_hidden_variables(hidden))
+    except ValueError as exc:
+        bottle.abort(400, str(exc))
+    return _json_response({'hidden': result})
+
+
+@app.get('/breakpoints')
+def get_breakpoints():
+    """
+    Get all breakpoints and logpoints
+    """
+    return _json_response(_call_debugger(lambda debugger: debugger.get_breakpoints()))
+
+
+def _get_json_body():
+    data = bottle.request.json  # pylint: disable=no-member
+    if not isinstance(data, dict):
+        bottle.abort(400, 'A JSON object is expected')
+    return data
+
+
+@app.post('/breakpoints')
+def add_breakpoint():
+    """
+    Set a breakpoint or a logpoint
+
+    The request body is a JSON object with ``file`` and ``line``
+    and optional ``cond`` and ``log`` properties. If ``log`` is set,
+    a logpoint with this message is created.
+    """
+    data = _get_json_body()
+    if not isinstance(data.get('line'), int):
+        bottle.abort(400, 'Invalid line number')
+    try:
+        result = _call_debugger(lambda debugger: get_breakpoint_info(
+            debugger.set_breakpoint(data.get('file', ''), data['line'],
+                                    data.get('cond'), data.get('log'))))
+    except ValueError as exc:
+        bottle.abort(400, str(exc))
+    bottle.response.status = 201
+    return _json_response(result)
+
+
+@app.route('/breakpoints/<number:int>', 'PATCH')
+def update_breakpoint(number):
+    """
+    Change ``enabled``, ``cond`` and/or ``log`` properties of a breakpoint
+    """
+    changes = {key: value for key, value in _get_json_body().items()
+               if key in ('enabled', 'cond', 'log')}
+    try:
+        result = _call_debugger(lambda debugger: debugger.update_breakpoint(number, changes))
+    except KeyError:
+        bottle.abort(404, 'Breakpoint not found')
+    except ValueError as exc:
+        bottle.abort(400, str(exc))
+    return _json_response(result)
+
+
+@app.delete('/breakpoints/<number:int>')
+def remove_breakpoint(number):
+    """
+    Clear a breakpoint
+    """
+    try:
+        _call_debugger(lambda debugger: debugger.remove_breakpoint(number))
+    except KeyError:
+        bottle.abort(404, 'Breakpoint not found')
+    bottle.response.status = 204
+    return ''
+
+
+@app.get('/profile')
+@compress
+def get_profile():
+    """
+    Get stacks sampled by the profiler
+
+    The profiler samples all threads of the process, so it does not
+    depend on the ``thread`` query parameter and works while
+    the program is running.
+    """
+    bottle.response.set_header('Cache-Control', 'no-store')
     bottle.response.content_type = 'application/json'
-    return json.dumps(app.frame_data.contents)
+    return json.dumps(app.profiler.get_profile())
+
+
+@app.post('/profile/start')
+def start_profiler():
+    """
+    Start the sampling profiler
+
+    Optional ``interval`` query parameter sets an interval
+    between samples in seconds.
+    """
+    interval = bottle.request.query.get('interval', type=float)  # pylint: disable=no-member
+    if interval is not None and interval <= 0:
+        bottle.abort(400, 'Invalid interval')
+    app.profiler.start(interval)
+    return _json_response(app.profiler.get_profile())
+
+
+@app.post('/profile/stop')
+def stop_profiler():
+    """
+    Stop the sampling profiler
+    """
+    app.profiler.stop()
+    return _json_response(app.profiler.get_profile())
+
+
+@app.delete('/profile')
+def reset_profiler():
+    """
+    Discard samples collected by the profiler
+    """
+    app.profiler.reset()
+    bottle.response.status = 204
+    return ''
+
+
+@app.route('/source/<listing_hash>')
+@compress
+def get_source(listing_hash):
+    """
+    Get a source file listing by its hash
+
+    Listings never change for the same hash so they can be cached
+    by browsers indefinitely.
+    """
+    # pylint: disable=no-member
+    listing = app.source_cache.get(listing_hash)
+    if listing is None:
+        bottle.abort(404, 'Source listing not found')
+    bottle.response.set_header('ETag', f'"{listing_hash}"')
+    bottle.response.set_header('Cache-Control', 'public, max-age=31536000, immutable')
+    if bottle.request.headers.get('If-None-Match') == f'"{listing_hash}"':
+        bottle.response.status = 304
+        return ''
+    bottle.response.content_type = 'text/plain; charset=utf-8'
+    return listing
 
 
 @app.route('/static/<path:path>')
 def get_static(path):
-    return bottle.static_file(path, root=static_path)
+    """
+    Get a static file from memory
+
+    Files are revalidated by browsers with their ETags
+    and sent compressed if possible.
+    """
+    static_file = app.get_static_file(path)
+    if static_file is None:
+        bottle.abort(404, 'File not found')
+    bottle.response.set_header('ETag', static_file['etag'])
+    bottle.response.set_header('Cache-Control', 'no-cache')
+    bottle.response.content_type = static_file['content_type']
+    # pylint: disable=no-member
+    if static_file['etag'] in bottle.request.headers.get('If-None-Match', ''):
+        bottle.response.status = 304
+        return b''
+    if static_file['gzip_body'] is not None:
+        bottle.response.add_header('Vary', 'Accept-Encoding')
+        if _accepts_gzip():
+            bottle.response.add_header('Content-Encoding', 'gzip')
+            return static_file['gzip_body']
+    return static_file['body']